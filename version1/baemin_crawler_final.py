@@ -4,94 +4,177 @@
 가게배달 업체 정보 수집: 배달타입, 상호명, 주소, 전화번호, 최근주문수, 전체리뷰수
 """
 import uiautomator2 as u2
-import time
-import re
 import sys
-import os
 import pandas as pd
 from datetime import datetime
-import xml.etree.ElementTree as ET
-import cv2
-import numpy as np
+from geometry import dedup_by_y
+from screen_snapshot import ScreenSnapshot, SnapshotDevice
+from settle import wait_for_all, wait_for_any, wait_for_settle
+from scroll import ScrollEngine
+from device_profile import DeviceProfile
+from store_list import StoreListModel
+from visited import VisitedRegistry
+from page_state import BACK, PageState, classify, reachable_by_back
+from store_filter import StoreNameFilter
+from checkpoint import RecordLog
+from template_match import TemplateMatcher
+from screenshot import ScreenshotService
+from element_resolver import ElementResolver, STORE_INFO_BUTTON
+from tracing import TracingDevice, span, tracer
+from metrics import MetricsDevice, metrics
 
 sys.stdout.reconfigure(encoding='utf-8')
 
 
 class BaeminCrawler:
-    def __init__(self):
+    def __init__(self, settle_timeout=3.0, serial=None, device=None, log_callback=None):
         self.d = None
+        self.serial = serial  # 디바이스 시리얼 (None이면 연결된 기본 디바이스)
+        self.device = device  # u2.connect() 대신 쓸 디바이스 (재생 디바이스 등)
+        self.log_callback = log_callback  # 로그를 받을 함수 (GUI 로그 창 등)
         self.stores = []
+        self.settle_timeout = settle_timeout  # 화면 안정 대기 최대 시간 (초)
+        self.list_filter = StoreNameFilter.load('list')
+        self.similar_filter = StoreNameFilter.load('similar')
+        self.matcher = TemplateMatcher()  # 템플릿 캐시 + 찾았던 위치
+        self.resolver = ElementResolver()  # 앱 버전별로 통한 버튼 찾기 방법
+        self.profile = DeviceProfile()  # 화면 크기 (connect에서 실제 값으로)
+        self.scroller = ScrollEngine()  # 스와이프 길이 학습 + 목록 끝 감지
+        self.store_list = StoreListModel()  # 가게목록에서 본 가게 위치 + 방문/건너뜀
+        self._app_version = None
+        self._snap = None
+        self._snap_generation = -1
+
+    def log(self, msg):
+        """로그 출력 (시리얼을 지정했으면 앞에 [시리얼])"""
+        if self.serial:
+            body = msg.lstrip('\n')
+            msg = msg[:len(msg) - len(body)] + f'[{self.serial}] {body}'
+        if self.log_callback:
+            self.log_callback(msg)
+        print(msg)
 
     def connect(self):
         """디바이스 연결"""
-        self.d = u2.connect()
-        print('[OK] 디바이스 연결됨')
+        device = self.device or u2.connect(self.serial)
+        if tracer.enabled:
+            device = TracingDevice(device)  # 디바이스 RPC도 구간으로 기록
+        if metrics.enabled:
+            device = MetricsDevice(device, self.serial or 'default')  # 덤프/스크린샷 지연, 디바이스 상태
+        self.d = SnapshotDevice(device)
+        # 화면 크기는 연결할 때 한 번만 확인 → 제스처 좌표를 화면 비율로 계산
+        self.profile = DeviceProfile.from_device(self.d)
+        self.scroller = ScrollEngine.for_profile(self.profile)
+        self.log('[OK] 디바이스 연결됨')
         return True
 
-    def get_xml_root(self):
-        """XML 루트 가져오기"""
-        xml = self.d.dump_hierarchy()
-        return ET.fromstring(xml)
+    def snapshot(self, fresh=False):
+        """현재 화면 스냅샷 (클릭/스와이프/뒤로가기 전까지 재사용)"""
+        if fresh or self._snap is None or self._snap_generation != self.d.generation:
+            self._snap = ScreenSnapshot(self.d.dump_hierarchy())
+            self._snap_generation = self.d.generation
+        return self._snap
 
-    def get_all_texts(self):
-        """현재 화면의 모든 텍스트 추출"""
-        root = self.get_xml_root()
-        texts = []
+    def settle(self, until=None, timeout=None, change_timeout=None):
+        """화면이 안정될 때까지 대기 (고정 sleep 대신, 최대 settle_timeout초)
 
-        def extract(node):
-            text = node.attrib.get('text', '')
-            if text.strip():
-                texts.append(text.strip())
-            for child in node:
-                extract(child)
+        change_timeout: 이 시간 안에 화면이 안 바뀌면 바로 반환 (스크롤 끝 등)
+        """
+        # 마지막 동작 이후 아직 덤프 안 했으면 직전 화면이 바뀐 뒤부터 안정 판단
+        previous = self._snap if self._snap_generation != self.d.generation else None
+        self._snap = wait_for_settle(self.d, timeout=timeout or self.settle_timeout,
+                                     until=until, previous=previous, change_timeout=change_timeout)
+        self._snap_generation = self.d.generation
+        return self._snap
+
+    def wait_for_any(self, selectors, timeout=1.0):
+        """셀렉터 중 하나가 보일 때까지 대기 (확인마다 덤프 1개) → 찾은 번호 또는 None"""
+        index, self._snap = wait_for_any(self.d, selectors, timeout=timeout)
+        self._snap_generation = self.d.generation
+        return index
+
+    def wait_for_all(self, selectors, timeout=1.0):
+        """셀렉터가 모두 보일 때까지 대기 (확인마다 덤프 1개) → bool"""
+        found, self._snap = wait_for_all(self.d, selectors, timeout=timeout)
+        self._snap_generation = self.d.generation
+        return found
+
+    def current_state(self, snap=None):
+        """현재 화면 상태 (덤프 1개로 판별)"""
+        return classify(snap or self.snapshot())
+
+    def back_to(self, target, max_presses=4):
+        """target 화면이 될 때까지만 뒤로가기 (매번 화면 확인)"""
+        state = self.current_state()
+        for _ in range(max_presses):
+            if state == target:
+                return True
+            if state != PageState.UNKNOWN and not reachable_by_back(state, target):
+                self.log(f'      [WARN] {state.value} 화면에서 뒤로가기로 {target.value} 못 감')
+                return False
+            expected = BACK.get(state)
+            self.go_back()
+            new_state = self.current_state()
+            if expected and new_state not in expected:
+                self.log(f'      [WARN] 뒤로가기: {state.value} → {new_state.value} (예상과 다름)')
+            state = new_state
+        return state == target
+
+    def get_xml_root(self, snap=None):
+        """XML 루트 가져오기"""
+        return (snap or self.snapshot()).root
 
-        extract(root)
-        return texts
+    def get_all_texts(self, snap=None):
+        """현재 화면의 모든 텍스트 추출"""
+        return list((snap or self.snapshot()).texts)
 
-    def get_content_descs(self):
+    def get_content_descs(self, snap=None):
         """현재 화면의 모든 content-desc 추출"""
-        root = self.get_xml_root()
-        descs = []
-
-        def extract(node):
-            desc = node.attrib.get('content-desc', '')
-            if desc.strip():
-                descs.append(desc.strip())
-            for child in node:
-                extract(child)
-
-        extract(root)
-        return descs
+        return list((snap or self.snapshot()).descs)
 
     def find_and_click_image(self, template_path, threshold=0.7):
-        """이미지 템플릿 매칭으로 클릭"""
-        screen = self.d.screenshot(format='opencv')
-        template = cv2.imread(template_path)
+        """이미지 템플릿 매칭으로 클릭 (전에 찾았던 위치 주변부터 매칭)"""
+        # 폰에서 축소 JPEG로 받아서 바로 흑백 디코딩
+        screen_gray, screen_scale = ScreenshotService(self.d).gray()
 
-        if template is None:
-            print(f'[ERROR] 템플릿 없음: {template_path}')
+        found = self.matcher.match(screen_gray, template_path, threshold, screen_scale)
+        if found is None:
+            self.log(f'[ERROR] 템플릿 없음: {template_path}')
             return False
 
-        screen_gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
-        template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
-
-        result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-
-        if max_val >= threshold:
-            h, w = template_gray.shape
-            cx = max_loc[0] + w // 2
-            cy = max_loc[1] + h // 2
+        cx, cy, max_val = found
+        if cx is not None:
             self.d.click(cx, cy)
-            print(f'      [이미지매칭] 클릭 ({cx}, {cy}) - {max_val:.0%}')
+            self.log(f'      [이미지매칭] 클릭 ({cx}, {cy}) - {max_val:.0%}')
             return True
         else:
-            print(f'      [WARN] 이미지 못 찾음 - {max_val:.0%}')
+            self.log(f'      [WARN] 이미지 못 찾음 - {max_val:.0%}')
             return False
 
-    def extract_delivery_types(self):
+    def app_version(self):
+        """배민 앱 버전 (처음 한 번만 조회, 모르면 'unknown')"""
+        if self._app_version is None:
+            self._app_version = 'unknown'
+            packages = [n.package for n in self.snapshot().nodes if n.package and n.package != 'com.android.systemui']
+            if packages:
+                try:
+                    info = self.d.app_info(packages[0])
+                    self._app_version = f'{packages[0]} {info.get("versionName", "unknown")}'
+                except Exception:
+                    pass
+        return self._app_version
+
+    def click_store_info_button(self):
+        """가게정보·원산지 클릭 - UI 덤프에서 먼저 찾고, 없으면 이미지 매칭"""
+        strategy = self.resolver.click(self.d, self.snapshot(), STORE_INFO_BUTTON, self.app_version(),
+                                       self.find_and_click_image)
+        if strategy and strategy != 'image':
+            self.log(f'      [{strategy}] 가게정보·원산지 클릭')
+        return strategy is not None
+
+    def extract_delivery_types(self, snap=None):
         """배달타입 추출 (가게배달/알뜰배달/한집배달)"""
-        descs = self.get_content_descs()
+        descs = self.get_content_descs(snap)
         types = []
         for desc in descs:
             if desc in ['가게배달', '알뜰배달', '한집배달']:
@@ -99,9 +182,9 @@ class BaeminCrawler:
                     types.append(desc)
         return types
 
-    def extract_store_info(self):
+    def extract_store_info(self, snap=None):
         """가게정보 페이지에서 상호명, 주소, 전화번호 추출"""
-        texts = self.get_all_texts()
+        texts = self.get_all_texts(snap)
         info = {}
 
         for i, t in enumerate(texts):
@@ -114,140 +197,141 @@ class BaeminCrawler:
 
         return info
 
-    def extract_stats(self):
+    def extract_stats(self, snap=None):
         """최근주문수, 전체리뷰수 추출 - 라벨 오른쪽 같은 행에서 값 찾기"""
-        root = self.get_xml_root()
+        snap = snap or self.snapshot()
         stats = {}
 
-        # 모든 텍스트 요소와 bounds 수집
-        elements = []
-        def collect(node):
-            text = node.attrib.get('text', '').strip()
-            bounds = node.attrib.get('bounds', '')
-            if text and bounds:
-                match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
-                if match:
-                    x1, y1, x2, y2 = map(int, match.groups())
-                    elements.append({
-                        'text': text,
-                        'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2,
-                        'cy': (y1 + y2) // 2
-                    })
-            for child in node:
-                collect(child)
-        collect(root)
-
-        # 라벨 찾고 같은 행(y좌표 유사)에서 오른쪽에 있는 값 찾기
-        for elem in elements:
-            if elem['text'] == '최근 주문수':
-                for other in elements:
-                    if other['x1'] >= elem['x2'] and abs(other['cy'] - elem['cy']) < 40:
-                        stats['최근주문수'] = other['text']
-                        break
-
-            if elem['text'] == '전체 리뷰수':
-                for other in elements:
-                    if other['x1'] >= elem['x2'] and abs(other['cy'] - elem['cy']) < 40:
-                        stats['전체리뷰수'] = other['text']
-                        break
+        # 라벨 찾고 같은 행(y좌표 유사)에서 오른쪽에 있는 텍스트 값 찾기
+        geo = snap.geometry
+        for label, key in (('최근 주문수', '최근주문수'), ('전체 리뷰수', '전체리뷰수')):
+            for elem in snap.by_text.get(label, []):
+                if not elem.has_bounds:
+                    continue
+                values = geo.right_in_row(elem, tol=40, mask=geo.has_text)
+                if values:
+                    stats[key] = values[0].text
 
         return stats
 
+    def _scroll(self, direction):
+        # 스와이프 전후 스냅샷으로 이동 거리 측정 (직전 화면이 캐시에 있을 때만 - 덤프 추가 없음)
+        before = self._snap if self._snap is not None and self._snap_generation == self.d.generation else None
+        gesture = self.scroller.gesture(direction)
+        self.d.swipe(*gesture, duration=self.scroller.duration)
+        more = self.scroller.update(direction, gesture, before, self.settle(change_timeout=self.scroller.change_timeout))
+        if before is not None and classify(before) == PageState.STORE_LIST:
+            self.store_list.scrolled(self.scroller.shift(gesture))
+        return more
+
     def scroll_down(self, times=1):
-        """아래로 스크롤"""
+        """아래로 스크롤 → 목록 끝이라 더 안 움직이면 False"""
         for _ in range(times):
-            self.d.swipe(540, 1500, 540, 700, duration=0.3)
-            time.sleep(0.8)
+            if not self._scroll('down'):
+                return False
+        return True
 
     def scroll_up(self, times=1):
-        """위로 스크롤"""
+        """위로 스크롤 → 맨 위라 더 안 움직이면 False"""
         for _ in range(times):
-            self.d.swipe(540, 700, 540, 1500, duration=0.3)
-            time.sleep(0.8)
+            if not self._scroll('up'):
+                return False
+        return True
 
     def go_back(self):
         """뒤로가기"""
         self.d.press('back')
-        time.sleep(1.5)
+        self.settle()
 
     def click_expand_delivery(self):
         """배달타입 펼치기 클릭"""
         elem = self.d(descriptionContains='펼쳐보기')
         if elem.exists(timeout=2):
             elem.click()
-            time.sleep(1)
+            self.settle()
             return True
         return False
 
     def click_sort_option(self, sort_type='기본순'):
         """정렬 옵션 선택 (기본순/주문 많은 순/별점 높은 순/가까운 순/찜 많은 순)"""
         # 1. 정렬 버튼 클릭 (기본순 텍스트 위쪽 버튼 클릭)
-        # 기본순 텍스트 좌표를 찾고, 그 위쪽(약 130px)을 클릭
+        # 기본순 텍스트 좌표를 찾고, 그 위쪽(1080px 폭 기준 약 130px)을 클릭
         sort_btn = self.d(textContains='기본순')
         if sort_btn.exists(timeout=3):
             # 기본순 텍스트의 bounds에서 좌표 추출
             info = sort_btn.info
             bounds = info.get('bounds', {})
             x = (bounds.get('left', 0) + bounds.get('right', 0)) // 2
-            y = bounds.get('top', 0) - 130  # 텍스트 위쪽 130px
+            y = bounds.get('top', 0) - self.profile.px(130)  # 텍스트 위쪽 130px (1080px 폭 기준)
             self.d.click(x, y)
-            print(f'      [OK] 정렬 버튼 클릭 ({x}, {y})')
-            time.sleep(1)
+            self.log(f'      [OK] 정렬 버튼 클릭 ({x}, {y})')
+            self.settle()
         else:
-            print(f'      [WARN] 정렬 버튼 못 찾음')
+            self.log(f'      [WARN] 정렬 버튼 못 찾음')
             return False
 
         # 2. 원하는 정렬 옵션 선택
         sort_elem = self.d(descriptionContains=sort_type)
         if sort_elem.exists(timeout=3):
             sort_elem.click()
-            print(f'      [OK] 정렬 선택: {sort_type}')
-            time.sleep(1)
+            self.log(f'      [OK] 정렬 선택: {sort_type}')
+            self.settle()
             return True
         else:
-            print(f'      [WARN] 정렬 옵션 못 찾음: {sort_type}')
-            # 팝업 닫기 (뒤로가기)
-            self.d.press('back')
+            self.log(f'      [WARN] 정렬 옵션 못 찾음: {sort_type}')
+            # 팝업 닫기 (뒤로가기 + 팝업이 닫힐 때까지 대기)
+            self.go_back()
             return False
 
-    def find_기본순_y(self):
+    def find_기본순_y(self, snap=None):
         """기본순 또는 기본순 외 텍스트의 y좌표 찾기"""
-        root = self.get_xml_root()
-
-        def find(node):
-            text = node.attrib.get('text', '')
-            bounds = node.attrib.get('bounds', '')
+        for n in (snap or self.snapshot()).nodes:
             # '기본순' 또는 '기본순 외' 둘 다 찾기
-            if text == '기본순' or text.startswith('기본순 외'):
-                match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
-                if match:
-                    return int(match.group(4))  # y2 반환
-            for child in node:
-                result = find(child)
-                if result:
-                    return result
-            return None
-
-        return find(root)
-
-    def get_stores_below_기본순(self, passed_기본순=False, last_store_name=None):
+            if (n.text == '기본순' or n.text.startswith('기본순 외')) and n.has_bounds:
+                return n.y2
+        return None
+
+    def _list_store_name(self, desc):
+        """가게목록 행 content-desc → 가게명 (가게가 아니면 None)"""
+        # 가게명 추출: "가게명, 배달팁 X원" → "가게명"
+        store_name = desc
+        if ', 배달팁' in desc:
+            store_name = desc.split(', 배달팁')[0]
+
+        # 제외: 배달타입, 거리, 가격, 별점, 리뷰수, UI요소 등 (store_name_filter.json)
+        # 가게명: 2글자 이상, 30글자 이하
+        if self.list_filter.accepts(store_name):
+            return store_name
+        return None
+
+    def get_stores_below_기본순(self, passed_기본순=False, last_store_name=None, snap=None):
         """기본순 또는 기본순 외 아래에 있는 가게 이름들 추출"""
-        root = self.get_xml_root()
-
-        # 1. 기본순 또는 기본순 외 y좌표 찾기
-        기본순_y = None
-        def find_기본순(node):
-            nonlocal 기본순_y
-            text = node.attrib.get('text', '')
-            bounds = node.attrib.get('bounds', '')
+        snap = snap or self.snapshot()
+
+        # 노드 테이블 한 번 순회: 기준 y좌표들(마지막 값 사용)과 가게 후보를 함께 수집
+        기본순_y = None        # 1. 기본순 또는 기본순 외
+        last_store_y = None    # 2. 마지막 방문 가게 (있으면, 하단 y좌표)
+        방금본가게_y = None    # 3. "방금 본 가게와 비슷해요!" (하단 y좌표)
+        candidates = []
+        for n in snap.nodes:
+            if not n.has_bounds:
+                continue
+            text = n.text
+            desc = n.desc
             # '기본순' 또는 '기본순 외' 둘 다 찾기
             if text == '기본순' or text.startswith('기본순 외'):
-                match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
-                if match:
-                    기본순_y = int(match.group(4))
-            for child in node:
-                find_기본순(child)
-        find_기본순(root)
+                기본순_y = n.y2
+            if not desc:
+                continue
+            if last_store_name and last_store_name in desc:
+                last_store_y = n.y2
+            if '방금 본 가게' in desc:
+                방금본가게_y = n.y2
+
+            # 가게명 행인지는 처음 보는 desc만 분류 (목록 모델이 기억)
+            store_name = self.store_list.row_name(desc, self._list_store_name)
+            if store_name:
+                candidates.append({'name': store_name, 'y': n.y1})
 
         # 기본순 화면에 없고, 이미 지나갔다면 y=0으로 설정 (전체 화면에서 찾기)
         if 기본순_y is None:
@@ -256,139 +340,11 @@ class BaeminCrawler:
             else:
                 return []
 
-        # 2. 마지막 방문 가게 y좌표 찾기 (있으면)
-        last_store_y = None
-        if last_store_name:
-            def find_last_store(node):
-                nonlocal last_store_y
-                desc = node.attrib.get('content-desc', '')
-                bounds = node.attrib.get('bounds', '')
-                if last_store_name in desc and bounds:
-                    match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
-                    if match:
-                        last_store_y = int(match.group(4))  # 하단 y좌표
-                for child in node:
-                    find_last_store(child)
-            find_last_store(root)
-
-        # 3. "방금 본 가게와 비슷해요!" y좌표 찾기
-        방금본가게_y = None
-        def find_방금본가게(node):
-            nonlocal 방금본가게_y
-            desc = node.attrib.get('content-desc', '')
-            bounds = node.attrib.get('bounds', '')
-            if '방금 본 가게' in desc and bounds:
-                match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
-                if match:
-                    방금본가게_y = int(match.group(4))  # 하단 y좌표
-            for child in node:
-                find_방금본가게(child)
-        find_방금본가게(root)
-
-        # 3. 기본순 아래 가게들 찾기
-        stores = []
-        def find_stores(node):
-            desc = node.attrib.get('content-desc', '')
-            bounds = node.attrib.get('bounds', '')
-
-            if desc.strip() and bounds:
-                match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
-                if match:
-                    y1 = int(match.group(2))
-                    # 기본순 아래
-                    if y1 > 기본순_y:
-                        # 가게명 추출: "가게명, 배달팁 X원" → "가게명"
-                        store_name = desc
-                        if ', 배달팁' in desc:
-                            store_name = desc.split(', 배달팁')[0]
-
-                        # 제외: 배달타입, 거리, 가격, 별점, 리뷰수, 메뉴설명, UI요소 등
-                        exclude = (
-                            # 배달타입/UI
-                            store_name in ['가게배달', '알뜰배달', '한집배달', '음식배달'] or
-                            '음식' in store_name or
-                            # 거리/가격
-                            'km' in store_name or
-                            '원,' in store_name or
-                            '원)' in store_name or
-                            '거리' in store_name or
-                            # 별점/리뷰
-                            '별점' in store_name or
-                            re.match(r'^\d+개$', store_name) or
-                            re.match(r'^[\d.,]+개$', store_name) or
-                            re.match(r'^[\d.]+$', store_name) or
-                            # 광고/프로모션
-                            '추천' in store_name or
-                            '광고' in store_name or
-                            '받기' in store_name or
-                            '하기' in store_name or
-                            '빽보이' in store_name or
-                            '카카오' in store_name or
-                            '브랜드' in store_name or
-                            '쿠폰' in store_name or
-                            '할인' in store_name or
-                            '혜택' in store_name or
-                            '모아보기' in store_name or
-                            '푸드페스타' in store_name or
-                            '혼자 사는 어르신에게' in store_name or
-                            # UI 요소
-                            '탭바' in store_name or
-                            '탭' in store_name or
-                            '홈' in store_name or
-                            '뒤로' in store_name or
-                            '검색' in store_name or
-                            '장바구니' in store_name or
-                            '스토어' in store_name or
-                            '버튼' in store_name or
-                            '알림' in store_name or
-                            '도움말' in store_name or
-                            '배민클럽' in store_name or
-                            # 상태바 요소
-                            '오후' in store_name or
-                            '오전' in store_name or
-                            'Mobile' in store_name or
-                            '신호' in store_name or
-                            '막대' in store_name or
-                            '배터리' in store_name or
-                            '퍼센트' in store_name or
-                            '5G' in store_name or
-                            '4G' in store_name or
-                            'LTE' in store_name or
-                            'Wi-Fi' in store_name or
-                            # 기타
-                            '번째' in store_name or
-                            '총' in store_name or
-                            '방금' in store_name or
-                            '비슷' in store_name or
-                            '최소' in store_name or
-                            '최대' in store_name or
-                            '메뉴' in store_name or
-                            '전체' in store_name or
-                            # 특수문자로 시작
-                            store_name.startswith(',') or
-                            store_name.startswith('.') or
-                            store_name.replace('.', '').replace(',', '').isdigit()
-                        )
-                        # 가게명: 2글자 이상, 30글자 이하
-                        if not exclude and 2 <= len(store_name) <= 30:
-                            stores.append({'name': store_name, 'y': y1})
-            for child in node:
-                find_stores(child)
-        find_stores(root)
-
-        # y좌표로 정렬 (위에서 아래로)
-        stores.sort(key=lambda x: x['y'])
+        # 기본순 아래 가게들만
+        stores = [c for c in candidates if c['y'] > 기본순_y]
 
-        # 중복 제거 (y좌표 근처 50px 이내)
-        unique = []
-        for s in stores:
-            is_dup = False
-            for u in unique:
-                if abs(u['y'] - s['y']) < 50:
-                    is_dup = True
-                    break
-            if not is_dup:
-                unique.append(s)
+        # y좌표로 정렬 (위에서 아래로) + 중복 제거 (y좌표 근처 50px 이내)
+        unique = dedup_by_y(stores, 50)
 
         # 마지막 방문 가게 아래 + "방금 본 가게와 비슷해요!" 아래 2개 건너뛰기
         if last_store_y and 방금본가게_y:
@@ -419,61 +375,34 @@ class BaeminCrawler:
 
         return unique
 
-    def get_방금본가게_아래_4개(self):
+    def get_방금본가게_아래_4개(self, snap=None):
         """'방금 본 가게와 비슷해요!' 아래 4개 매장 이름 반환"""
-        root = self.get_xml_root()
+        snap = snap or self.snapshot()
 
-        # 방금 본 가게 y좌표 찾기
+        # 방금 본 가게 y좌표와 가게 후보를 한 번에 수집
         방금본가게_y = None
-        def find_방금본가게(node):
-            nonlocal 방금본가게_y
-            desc = node.attrib.get('content-desc', '')
-            bounds = node.attrib.get('bounds', '')
-            if '방금 본 가게' in desc and bounds:
-                match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
-                if match:
-                    방금본가게_y = int(match.group(4))
-            for child in node:
-                find_방금본가게(child)
-        find_방금본가게(root)
+        candidates = []
+        for n in snap.nodes:
+            desc = n.desc
+            if not desc or not n.has_bounds:
+                continue
+            if '방금 본 가게' in desc:
+                방금본가게_y = n.y2
+
+            # 가게명 추출: "가게명, 배달팁 X원" → "가게명"
+            store_name = desc
+            if ', 배달팁' in desc:
+                store_name = desc.split(', 배달팁')[0]
+
+            # 가게명 필터 (간단하게)
+            if self.similar_filter.accepts(store_name):
+                candidates.append({'name': store_name, 'y': n.y1})
 
         if not 방금본가게_y:
             return []
 
-        # 방금본가게_y 아래 가게들 찾기
-        stores = []
-        def find_stores(node):
-            desc = node.attrib.get('content-desc', '')
-            bounds = node.attrib.get('bounds', '')
-            if desc.strip() and bounds:
-                match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
-                if match:
-                    y1 = int(match.group(2))
-                    if y1 > 방금본가게_y:
-                        # 가게명 추출: "가게명, 배달팁 X원" → "가게명"
-                        store_name = desc
-                        if ', 배달팁' in desc:
-                            store_name = desc.split(', 배달팁')[0]
-
-                        # 가게명 필터 (간단하게)
-                        exclude = (
-                            'km' in store_name or '음식' in store_name or
-                            '별점' in store_name or '개' in store_name or '탭' in store_name or
-                            '홈' in store_name or '검색' in store_name or '버튼' in store_name or
-                            '오후' in store_name or '오전' in store_name or '방금' in store_name or
-                            '비슷' in store_name or '배민클럽' in store_name or
-                            '푸드페스타' in store_name or '추천' in store_name or '광고' in store_name or
-                            '혼자 사는 어르신에게' in store_name or
-                            store_name in ['가게배달', '알뜰배달', '한집배달', '음식배달'] or
-                            len(store_name) < 2 or len(store_name) > 30
-                        )
-                        if not exclude:
-                            stores.append({'name': store_name, 'y': y1})
-            for child in node:
-                find_stores(child)
-        find_stores(root)
-
-        # y좌표로 정렬해서 상위 4개 반환
+        # 방금본가게_y 아래 가게들을 y좌표로 정렬해서 상위 4개 반환
+        stores = [c for c in candidates if c['y'] > 방금본가게_y]
         stores.sort(key=lambda x: x['y'])
         return [s['name'] for s in stores[:4]]
 
@@ -486,16 +415,16 @@ class BaeminCrawler:
             elem = self.d(descriptionContains=store_name)
             if elem.exists(timeout=3):
                 elem.click()
-                print(f'      [OK] {index}번째 가게 클릭: {store_name}')
-                time.sleep(2)
+                self.log(f'      [OK] {index}번째 가게 클릭: {store_name}')
+                self.settle()
                 return True
 
-        print(f'      [WARN] {index}번째 가게 못 찾음')
+        self.log(f'      [WARN] {index}번째 가게 못 찾음')
         return False
 
-    def get_store_name_from_list(self):
+    def get_store_name_from_list(self, snap=None):
         """가게 상세 페이지에서 가게명 추출"""
-        texts = self.get_all_texts()
+        texts = self.get_all_texts(snap)
         # 첫 번째 줄이 보통 가게명
         for t in texts:
             if len(t) > 2 and len(t) < 30 and '배달' not in t and '리뷰' not in t:
@@ -521,216 +450,238 @@ class BaeminCrawler:
             store_data['가게명'] = self.get_store_name_from_list()
 
             # 1. 배달타입 펼치기
-            print(f'      [1] 배달타입 펼치기...')
-            self.click_expand_delivery()
-            time.sleep(1)
+            self.log(f'      [1] 배달타입 펼치기...')
+            with span('expand'):
+                self.click_expand_delivery()
 
             # 2. 배달타입 추출
-            print(f'      [2] 배달타입 추출...')
-            delivery_types = self.extract_delivery_types()
+            self.log(f'      [2] 배달타입 추출...')
+            with span('delivery_type'):
+                delivery_types = self.extract_delivery_types()
             store_data['배달타입'] = ', '.join(delivery_types)
-            print(f'          → {store_data["배달타입"]}')
-
-            # 3. 가게정보·원산지 클릭 (이미지 매칭)
-            print(f'      [3] 가게정보·원산지 클릭...')
-            if self.find_and_click_image('templates/store_info_btn.png', threshold=0.6):
-                time.sleep(2)
-
+            self.log(f'          → {store_data["배달타입"]}')
+
+            # 3. 가게정보·원산지 클릭 (UI 덤프 → 이미지 매칭)
+            self.log(f'      [3] 가게정보·원산지 클릭...')
+            with span('image_click'):
+                opened = self.click_store_info_button()
+                if opened:
+                    self.settle(until=lambda snap: '상호명' in snap.by_text)
+            if opened:
                 # 4. 상호명, 주소, 전화번호 추출
-                print(f'      [4] 가게정보 추출...')
-                info = self.extract_store_info()
+                self.log(f'      [4] 가게정보 추출...')
+                with span('info_extract'):
+                    info = self.extract_store_info()
                 store_data.update(info)
-                print(f'          → 상호명: {info.get("상호명", "없음")}')
+                self.log(f'          → 상호명: {info.get("상호명", "없음")}')
 
                 # 5. 최근주문수, 전체리뷰수 추출 (둘 다 보일 때까지 스크롤)
-                print(f'      [5] 통계 추출...')
-                for _ in range(5):
-                    if self.d(textContains='최근 주문수').exists(timeout=1) and self.d(textContains='전체 리뷰수').exists(timeout=1):
-                        break
-                    self.scroll_down(1)
-                stats = self.extract_stats()
+                self.log(f'      [5] 통계 추출...')
+                with span('stats_scroll'):
+                    for _ in range(5):
+                        if self.wait_for_all([{'textContains': '최근 주문수'}, {'textContains': '전체 리뷰수'}]):
+                            break
+                        if not self.scroll_down(1):
+                            break
+                    stats = self.extract_stats()
                 store_data.update(stats)
-                print(f'          → 최근주문수: {stats.get("최근주문수", "없음")}')
-                print(f'          → 전체리뷰수: {stats.get("전체리뷰수", "없음")}')
-
-                # 뒤로가기 (가게정보 → 가게상세)
-                self.go_back()
+                self.log(f'          → 최근주문수: {stats.get("최근주문수", "없음")}')
+                self.log(f'          → 전체리뷰수: {stats.get("전체리뷰수", "없음")}')
 
         except Exception as e:
-            print(f'      [ERROR] {e}')
+            self.log(f'      [ERROR] {e}')
 
-        # 뒤로가기 (가게상세 → 가게목록) - 항상 1번만
-        self.go_back()
+        # 뒤로가기 (가게정보 → 가게상세 → 가게목록) - 화면 확인하며 필요한 만큼만
+        with span('back'):
+            self.back_to(PageState.STORE_LIST)
 
         return store_data
 
-    def save_to_excel(self, filename=None):
-        """엑셀 저장"""
-        if not self.stores:
-            print('[WARN] 저장할 데이터 없음')
+    def save_to_excel(self, filename=None, checkpoint=None):
+        """엑셀 저장 - checkpoint(RecordLog)가 주어지면 중간 저장 파일 내용으로 내보냄"""
+        stores = checkpoint.load() if checkpoint is not None else self.stores
+        if not stores:
+            self.log('[WARN] 저장할 데이터 없음')
             return
 
         if filename is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f'baemin_stores_{timestamp}.xlsx'
 
-        df = pd.DataFrame(self.stores)
+        df = pd.DataFrame(stores)
         df.to_excel(filename, index=False)
-        print(f'[OK] 엑셀 저장 완료: {filename}')
-        print(f'     총 {len(self.stores)}개 가게')
+        self.log(f'[OK] 엑셀 저장 완료: {filename}')
+        self.log(f'     총 {len(stores)}개 가게')
 
     def go_to_store_list(self):
         """메인화면에서 음식배달 더보기 클릭 → 기본순 아래 가게 찾기"""
-        print('[STEP 1] 음식배달에서 더보기 클릭')
-        elem = self.d(descriptionContains='음식배달에서 더보기')
-        if elem.exists(timeout=3):
-            elem.click()
-            time.sleep(2)
-            print('      [OK] 더보기 클릭 완료')
+        self.log('[STEP 1] 음식배달에서 더보기 클릭')
+        state = self.current_state()
+        if state == PageState.STORE_LIST:
+            self.log('      [OK] 이미 가게목록 화면')
         else:
-            print('      [WARN] 더보기 버튼 못 찾음')
-            return False
+            if state not in (PageState.HOME, PageState.UNKNOWN):
+                self.back_to(PageState.HOME)
+            elem = self.d(descriptionContains='음식배달에서 더보기')
+            if elem.exists(timeout=3):
+                elem.click()
+                self.settle()
+                self.log('      [OK] 더보기 클릭 완료')
+            else:
+                self.log('      [WARN] 더보기 버튼 못 찾음')
+                return False
 
-        print('[STEP 2] 기본순 아래 가게목록 찾기')
+        self.log('[STEP 2] 기본순 아래 가게목록 찾기')
         for i in range(10):
             # 기본순 아래 가게가 있는지 확인
             stores = self.get_stores_below_기본순()
             if stores:
-                print(f'      [OK] 기본순 아래 가게 {len(stores)}개 발견! (스크롤 {i}회)')
+                self.log(f'      [OK] 기본순 아래 가게 {len(stores)}개 발견! (스크롤 {i}회)')
                 for j, s in enumerate(stores[:3]):
-                    print(f'          {j+1}. {s["name"]}')
+                    self.log(f'          {j+1}. {s["name"]}')
                 return True
 
-            self.scroll_down(1)
-            print(f'      스크롤 {i+1}회...')
+            if not self.scroll_down(1):
+                self.log('      [INFO] 목록 끝')
+                break
+            self.log(f'      스크롤 {i+1}회...')
 
-        print('      [WARN] 기본순 아래 가게 못 찾음')
+        self.log('      [WARN] 기본순 아래 가게 못 찾음')
         return False
 
     def collect_all_store_names(self, max_stores=50):
         """스크롤하면서 가게 이름 모두 수집 (1단계)"""
-        print('[PHASE 1] 가게 이름 수집 시작')
-        print('-' * 40)
+        self.log('[PHASE 1] 가게 이름 수집 시작')
+        self.log('-' * 40)
 
-        all_names = []
+        names = StoreListModel()
         no_new_count = 0
         max_no_new = 5  # 5번 연속 새 가게 없으면 종료
 
-        while len(all_names) < max_stores and no_new_count < max_no_new:
-            stores = self.get_stores_below_기본순(passed_기본순=len(all_names) > 0)
+        while len(names) < max_stores and no_new_count < max_no_new:
+            stores = self.get_stores_below_기본순(passed_기본순=len(names) > 0)
 
-            new_count = 0
-            for s in stores:
-                if s['name'] not in all_names:
-                    all_names.append(s['name'])
-                    new_count += 1
-                    print(f'      {len(all_names)}. {s["name"]}')
+            new_names = names.observe(stores)
+            for i, name in enumerate(new_names, len(names) - len(new_names) + 1):
+                self.log(f'      {i}. {name}')
 
-                    if len(all_names) >= max_stores:
-                        break
-
-            if new_count == 0:
+            if not new_names:
                 no_new_count += 1
             else:
                 no_new_count = 0
 
-            # 스크롤
-            if len(all_names) < max_stores:
-                self.scroll_down(1)
-                time.sleep(0.5)
+            # 스크롤 (목록 끝이면 종료)
+            if len(names) < max_stores and not self.scroll_down(1):
+                self.log('      [INFO] 목록 끝')
+                break
 
-        print(f'\n[OK] 총 {len(all_names)}개 가게 이름 수집 완료')
+        all_names = names.ordered()[:max_stores]
+        self.log(f'\n[OK] 총 {len(all_names)}개 가게 이름 수집 완료')
         return all_names
 
-    def run(self, max_stores=5, sort_type='기본순'):
+    def run(self, max_stores=5, sort_type='기본순', save=True, resume=False, checkpoint_path=None, visited=None):
         """크롤링 실행 - 화면에 보이는 가게 바로 크롤링
 
         Args:
-            max_stores: 크롤링할 최대 가게 수
+            max_stores: 크롤링할 최대 가게 수 (resume이면 이미 수집한 가게 포함)
             sort_type: 정렬 방식 ('기본순', '주문 많은 순', '별점 높은 순', '가까운 순', '찜 많은 순')
+            save: False면 엑셀 저장 생략 (여러 디바이스 결과를 합칠 때)
+            resume: True면 중간 저장 파일의 가게는 건너뛰고 이어서 크롤링
+            checkpoint_path: 중간 저장 파일 (기본: baemin_checkpoint_정렬방식.jsonl)
+            visited: VisitedRegistry - 이전 실행/다른 디바이스가 크롤링한 가게도 건너뜀 (기본: 이번 실행만)
+
+        Returns:
+            수집한 가게 정보 리스트
         """
-        print('=' * 60)
-        print('  배달의민족 크롤러')
-        print(f'  정렬: {sort_type}')
-        print('=' * 60)
-        print()
+        self.log('=' * 60)
+        self.log('  배달의민족 크롤러')
+        self.log(f'  정렬: {sort_type}')
+        self.log('=' * 60)
+        self.log('')
 
         if not self.connect():
-            return
+            return self.stores
 
         # 메인화면에서 가게 목록으로 이동
         if not self.go_to_store_list():
-            print('[ERROR] 가게 목록으로 이동 실패')
-            return
+            self.log('[ERROR] 가게 목록으로 이동 실패')
+            return self.stores
 
         # 정렬 옵션 선택 (기본순이 아닐 경우)
         if sort_type != '기본순':
-            print(f'[STEP 3] 정렬 변경: {sort_type}')
+            self.log(f'[STEP 3] 정렬 변경: {sort_type}')
             if not self.click_sort_option(sort_type):
-                print('[WARN] 정렬 변경 실패, 기본순으로 진행')
-            time.sleep(1)
-
-        skip_names = []  # 스킵할 가게명 목록 (방문한 가게 + 방금본가게 광고)
-        collected_count = 0
+                self.log('[WARN] 정렬 변경 실패, 기본순으로 진행')
+
+        # 가게마다 중간 저장 - resume이면 이전 실행에서 수집한 가게부터 시작
+        if checkpoint_path is None:
+            checkpoint_path = f'baemin_checkpoint_{sort_type.replace(" ", "_")}.jsonl'
+        checkpoint = RecordLog(checkpoint_path)
+        self.stores = checkpoint.open(resume=resume)
+        if self.stores:
+            self.log(f'[RESUME] {checkpoint_path}: 이미 수집한 가게 {len(self.stores)}개 건너뜀')
+
+        # 방문한 가게(방문 기록 + 중간 저장 파일) + 방금본가게 광고는 건너뜀
+        visited = visited if visited is not None else VisitedRegistry()
+        if len(visited):
+            self.log(f'[INFO] 방문 기록: 가게 {len(visited)}개 건너뜀')
+        self.store_list = StoreListModel(visited, collected=[s['가게명'] for s in self.stores])
+        collected_count = len(self.stores)
         retry_count = 0
         max_retry = 10
 
         while collected_count < max_stores and retry_count < max_retry:
-            # 현재 화면에서 모든 가게 찾기
-            all_stores = self.get_stores_below_기본순(passed_기본순=collected_count > 0)
+            # 가게 상세/정보 화면에 남아있으면 가게목록까지만 뒤로가기
+            if self.current_state() in (PageState.STORE_DETAIL, PageState.STORE_INFO):
+                self.back_to(PageState.STORE_LIST)
 
-            # 스킵 목록에 없는 가게만 필터링
-            available_stores = [s for s in all_stores if s['name'] not in skip_names]
+            # 다른 디바이스가 그 사이 크롤링한 가게 반영
+            visited.refresh()
 
-            if available_stores:
-                new_store = available_stores[0]
+            # 현재 화면에서 모든 가게 찾기 → 목록 모델에 반영, 위에서부터 첫 미방문 가게
+            # 가게를 한 번이라도 봤으면 기본순은 지나간 것 (방문 기록으로 전부 건너뛰어 수집 수가 0이어도)
+            all_stores = self.get_stores_below_기본순(passed_기본순=collected_count > 0 or len(self.store_list) > 0)
+            new_rows = self.store_list.observe(all_stores)
+            new_store = self.store_list.next_unvisited(all_stores)
+
+            if new_store:
                 collected_count += 1
-                print(f'\n[{collected_count}/{max_stores}] {new_store["name"]}')
+                self.log(f'\n[{collected_count}/{max_stores}] {new_store["name"]}')
 
                 # 가게 클릭
                 elem = self.d(descriptionContains=new_store['name'])
                 if elem.exists(timeout=3):
                     elem.click()
-                    print(f'      [OK] 클릭')
-                    time.sleep(2)
+                    self.log(f'      [OK] 클릭')
+                    self.settle(until=lambda snap: snap.has_desc_contains('펼쳐보기'))
 
                     # 크롤링
-                    store_data = self.crawl_single_store(collected_count)
+                    with span('store', index=collected_count, store=new_store['name']):
+                        store_data = self.crawl_single_store(collected_count)
                     store_data['가게명'] = new_store['name']
                     self.stores.append(store_data)
-                    skip_names.append(new_store['name'])  # 방문한 가게 스킵 목록에 추가
-                    print(f'      [완료] 상호명: {store_data.get("상호명", "")}')
-
-                    # 뒤로가기 직후: 먼저 방금 방문한 가게를 화면에서 찾기 (위로 스크롤)
-                    time.sleep(0.5)
+                    checkpoint.append(store_data)
+                    metrics.inc('stores_completed', device=self.serial or 'default')
+                    self.store_list.mark_visited(new_store['name'])
+                    self.log(f'      [완료] 상호명: {store_data.get("상호명", "")}')
 
-                    # 1단계: 방금 방문한 가게가 화면에 보이는지 확인, 없으면 위로 스크롤
+                    # 뒤로가기 직후: 먼저 방금 방문한 가게를 화면에서 찾기
+                    # 1단계: 방금 방문한 가게가 화면에 보이는지 확인, 없으면 목록 모델의 위치 쪽으로 스크롤
                     for scroll_up_try in range(5):
-                        elem_check = self.d(descriptionContains=new_store['name'])
-                        if elem_check.exists(timeout=1):
+                        self.store_list.observe(self.get_stores_below_기본순(passed_기본순=True))
+                        where = self.store_list.locate(new_store['name'])
+                        if where == 'visible':
+                            break
+                        if not (self.scroll_down(1) if where == 'down' else self.scroll_up(1)):
                             break
-                        else:
-                            # 위로 스크롤
-                            self.d.swipe(540, 800, 540, 1500, duration=0.3)
-                            time.sleep(0.5)
 
                     # 2단계: 스크롤해서 "방금 본 가게와 비슷해요!" 찾기
                     방금본_found = False
                     for scroll_try in range(5):
                         # "방금 본 가게" 있는지 확인
-                        root = self.get_xml_root()
-                        def check_방금본가게(node):
-                            desc = node.attrib.get('content-desc', '')
-                            if '방금 본 가게' in desc:
-                                return True
-                            for child in node:
-                                if check_방금본가게(child):
-                                    return True
-                            return False
-
-                        if check_방금본가게(root):
+                        if self.snapshot().has_desc_contains('방금 본 가게'):
                             방금본_found = True
-                            print(f'      [발견] "방금 본 가게와 비슷해요!"')
+                            self.log(f'      [발견] "방금 본 가게와 비슷해요!"')
                             break
                         else:
                             self.scroll_down(1)
@@ -740,36 +691,63 @@ class BaeminCrawler:
                         방금본_stores = []
                         방금본_stores = self.get_방금본가게_아래_4개()
                         if len(방금본_stores) < 4:
-                            self.d.swipe(540, 1200, 540, 900, duration=0.2)  # 짧은 스크롤
-                            time.sleep(0.3)
+                            self.d.swipe(*self.profile.swipe(0.5, 0.5, 0.5, 0.375), duration=0.2)  # 짧은 스크롤 540,1200 → 540,900
+                            self.settle()
                             방금본_stores = self.get_방금본가게_아래_4개()
                         for s in 방금본_stores:
-                            if s not in skip_names:
-                                skip_names.append(s)
-                                print(f'      [SKIP] 방금본가게 광고: {s}')
+                            if self.store_list.mark_skipped(s):
+                                metrics.inc('skips', reason='similar_ad', device=self.serial or 'default')
+                                self.log(f'      [SKIP] 방금본가게 광고: {s}')
                 else:
-                    print(f'      [WARN] 클릭 실패')
+                    self.log(f'      [WARN] 클릭 실패')
+                    metrics.inc('skips', reason='click_failed', device=self.serial or 'default')
                     collected_count -= 1
 
                 retry_count = 0
-                time.sleep(1)
             else:
-                # 새 가게 없으면 스크롤
-                print(f'      스크롤... ({retry_count+1})')
-                self.scroll_down(1)
-                retry_count += 1
-                time.sleep(1)
+                # 미방문 가게 없으면 스크롤 - 처음 보는 가게가 있었으면(이미 수집한 구간을 지나는 중) 재시도로 안 셈
+                if new_rows:
+                    retry_count = 0
+                else:
+                    self.log(f'      스크롤... ({retry_count+1})')
+                    retry_count += 1
+                    metrics.inc('retries', kind='scroll', device=self.serial or 'default')
+                if not self.scroll_down(1):
+                    self.log('      [INFO] 목록 끝 - 더 이상 새 가게 없음')
+                    break
+
+        checkpoint.close()
+
+        # 엑셀 저장 (중간 저장 파일 → 엑셀)
+        if save:
+            self.save_to_excel(checkpoint=checkpoint)
 
-        # 엑셀 저장
-        self.save_to_excel()
+        # 필터 튜닝용: 가장 많이 걸린 제외 규칙
+        self.log('[INFO] 가게명 필터 제외 상위 규칙')
+        for rule, count in self.list_filter.report(10):
+            self.log(f'      {count:5d}  {rule}')
 
-        print()
-        print('=' * 60)
-        print('  크롤링 완료!')
-        print('=' * 60)
+        self.log('')
+        self.log('=' * 60)
+        self.log('  크롤링 완료!')
+        self.log('=' * 60)
+
+        return self.stores
 
 
 if __name__ == '__main__':
+    # --resume: 중간 저장 파일(baemin_checkpoint_정렬방식.jsonl)에 있는 가게는 건너뛰고 이어서
+    resume = '--resume' in sys.argv
+    # --record 파일.zip: 화면 덤프/스크린샷을 동작과 함께 녹화 (오프라인 벤치마크용)
+    record_path = sys.argv[sys.argv.index('--record') + 1] if '--record' in sys.argv else None
+    # --trace 파일.json: 단계/디바이스 RPC 구간 기록 (chrome://tracing, ui.perfetto.dev)
+    trace_path = sys.argv[sys.argv.index('--trace') + 1] if '--trace' in sys.argv else None
+    # --metrics 포트: http://localhost:포트/ 상태 페이지, /metrics (Prometheus)
+    metrics_port = int(sys.argv[sys.argv.index('--metrics') + 1]) if '--metrics' in sys.argv else None
+    # --visited 파일(.sqlite / .bloom): 이전 실행에서 크롤링한 가게 건너뜀, --visited-ttl 시간: 이보다 오래된 기록은 다시 크롤링
+    visited_path = sys.argv[sys.argv.index('--visited') + 1] if '--visited' in sys.argv else None
+    visited_ttl = float(sys.argv[sys.argv.index('--visited-ttl') + 1]) * 3600 if '--visited-ttl' in sys.argv else None
+
     print('=' * 60)
     print('  배달의민족 크롤러')
     print('=' * 60)
@@ -803,5 +781,23 @@ if __name__ == '__main__':
     print(f'→ {max_stores}개 가게 크롤링')
     print()
 
-    crawler = BaeminCrawler()
-    crawler.run(max_stores=max_stores, sort_type=sort_type)
+    device = None
+    if record_path:
+        from session_recorder import RecordingDevice
+        device = RecordingDevice(u2.connect(), record_path)
+    crawler = BaeminCrawler(device=device)
+    visited = VisitedRegistry(visited_path, ttl=visited_ttl)
+    if metrics_port:
+        metrics.serve(metrics_port)
+        print(f'[OK] 상태 페이지: http://localhost:{metrics_port}/')
+    if trace_path:
+        tracer.start()
+    try:
+        crawler.run(max_stores=max_stores, sort_type=sort_type, resume=resume, visited=visited)
+    finally:
+        visited.close()
+        if device is not None:
+            device.close()
+            print(f'[OK] 녹화 저장: {record_path}')
+        if trace_path:
+            print(f'[OK] 구간 기록 저장: {trace_path} ({tracer.save(trace_path)}개)')
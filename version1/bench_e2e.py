@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+전체 크롤링 처리량 벤치마크 - 재생 디바이스에 RPC별 지연을 넣어서 USB/Wi-Fi ADB/에뮬레이터 환경 흉내
+가게/시간, 단계별 시간(포함/자체), 가장 무거운 호출 경로, time.sleep 대기 vs 디바이스 I/O 비율 출력
+
+사용법:
+    python bench_e2e.py v1 --stores 10 --profile usb
+    python bench_e2e.py v2 --profile all
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+
+from replay_device import baemin_device, make_stores, run_v1, run_v2
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# RPC별 지연 (초) - 대략적인 실측값 기준
+PROFILES = {
+    'none': {'dump_hierarchy': 0, 'screenshot': 0, 'click': 0, 'swipe': 0, 'press': 0, 'selector': 0, 'app_info': 0},
+    'usb': {'dump_hierarchy': 0.35, 'screenshot': 0.25, 'click': 0.08, 'swipe': 0.05, 'press': 0.08,
+            'selector': 0.12, 'app_info': 0.1},
+    'wifi': {'dump_hierarchy': 0.8, 'screenshot': 0.7, 'click': 0.2, 'swipe': 0.15, 'press': 0.2,
+             'selector': 0.3, 'app_info': 0.25},
+    'emulator': {'dump_hierarchy': 0.15, 'screenshot': 0.1, 'click': 0.03, 'swipe': 0.02, 'press': 0.03,
+                 'selector': 0.05, 'app_info': 0.05},
+}
+
+# 시간을 잴 크롤러 메서드 (있는 것만)
+PHASES = [
+    'go_to_store_list', 'click_sort_option', 'crawl_single_store', 'get_stores_below_기본순',
+    'get_방금본가게_아래_4개', 'go_to_main', 'search_store', 'click_first_store', 'crawl_store_info',
+    'click_expand_delivery', 'extract_delivery_types', 'click_store_info_button', 'find_and_click_image',
+    'extract_store_info', 'extract_stats', 'scroll_down', 'scroll_up', 'back_to', 'settle', 'snapshot',
+]
+
+_real_sleep = time.sleep
+
+
+class PhaseTimer:
+    """단계별 포함 시간(하위 단계 포함)과 자체 시간(하위 단계 제외) 누적 + 호출 경로별 포함 시간"""
+
+    def __init__(self):
+        self.inclusive = defaultdict(float)
+        self.exclusive = defaultdict(float)
+        self.calls = Counter()
+        self.tree = defaultdict(float)   # (바깥 단계, ..., 단계) → 포함 시간
+        self._stack = []   # [이름, 시작 시각, 하위 단계 시간]
+
+    def start(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def stop(self):
+        path = tuple(frame[0] for frame in self._stack)
+        name, started, child = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        self.tree[path] += elapsed
+        self.inclusive[name] += elapsed
+        self.exclusive[name] += elapsed - child
+        self.calls[name] += 1
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    @contextlib.contextmanager
+    def span(self, name):
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop()
+
+    def critical_path(self):
+        """가장 무거운 호출 경로 → [(이름, 포함 시간), ...]
+
+        크롤링은 디바이스 1대에서 순차 실행이라 전체 실행이 하나의 의존 사슬이고,
+        그 안에서 매 단계마다 포함 시간이 가장 큰 하위 단계를 따라 내려감
+        """
+        children = defaultdict(list)
+        for path, elapsed in self.tree.items():
+            children[path[:-1]].append((path, elapsed))
+        chain, path = [], ()
+        while children.get(path):
+            path, elapsed = max(children[path], key=lambda kv: kv[1])
+            chain.append((path[-1], elapsed))
+        return chain
+
+    def wrap(self, name, fn):
+        def timed(*args, **kwargs):
+            with self.span(name):
+                return fn(*args, **kwargs)
+        return timed
+
+
+class _LatencySelector:
+    def __init__(self, obj, device):
+        self._obj = obj
+        self._device = device
+
+    def _rpc(self, fn, *args, **kwargs):
+        return self._device._rpc('selector', fn, *args, **kwargs)
+
+    def exists(self, *args, **kwargs):
+        return self._rpc(self._obj.exists, *args, **kwargs)
+
+    def click(self, *args, **kwargs):
+        return self._rpc(self._obj.click, *args, **kwargs)
+
+    def set_text(self, *args, **kwargs):
+        return self._rpc(self._obj.set_text, *args, **kwargs)
+
+    @property
+    def info(self):
+        return self._rpc(lambda: self._obj.info)
+
+    def __getattr__(self, name):
+        return getattr(self._obj, name)
+
+
+class _LatencyRpc:
+    def __init__(self, device):
+        self._device = device
+
+    def takeScreenshot(self, *args):
+        return self._device._rpc('screenshot', self._device._d.jsonrpc.takeScreenshot, *args)
+
+
+class LatencyDevice:
+    """디바이스 래퍼 - RPC마다 profile 지연을 넣고 디바이스 I/O 시간으로 기록
+
+    Args:
+        d: 재생 디바이스
+        profile: {RPC 이름: 지연(초)}
+        timer: PhaseTimer (RPC를 'device.이름' 단계로 기록)
+    """
+
+    def __init__(self, d, profile, timer):
+        self._d = d
+        self.profile = profile
+        self.timer = timer
+        self.jsonrpc = _LatencyRpc(self)
+
+    def _rpc(self, name, fn, *args, **kwargs):
+        with self.timer.span(f'device.{name}'):
+            delay = self.profile.get(name, 0)
+            if delay:
+                _real_sleep(delay)
+            return fn(*args, **kwargs)
+
+    def dump_hierarchy(self, *args, **kwargs):
+        return self._rpc('dump_hierarchy', self._d.dump_hierarchy, *args, **kwargs)
+
+    def screenshot(self, *args, **kwargs):
+        return self._rpc('screenshot', self._d.screenshot, *args, **kwargs)
+
+    def click(self, *args, **kwargs):
+        return self._rpc('click', self._d.click, *args, **kwargs)
+
+    def swipe(self, fx, fy, tx, ty, duration=None, steps=None):
+        # 스와이프는 제스처 시간(duration)만큼 더 걸림
+        def swipe():
+            if duration:
+                _real_sleep(duration)
+            return self._d.swipe(fx, fy, tx, ty, duration=duration, steps=steps)
+        return self._rpc('swipe', swipe)
+
+    def press(self, *args, **kwargs):
+        return self._rpc('press', self._d.press, *args, **kwargs)
+
+    def app_info(self, *args, **kwargs):
+        return self._rpc('app_info', self._d.app_info, *args, **kwargs)
+
+    def __call__(self, **selector):
+        return _LatencySelector(self._d(**selector), self)
+
+    def __getattr__(self, name):
+        return getattr(self._d, name)
+
+
+@contextlib.contextmanager
+def instrument(timer, classes):
+    """크롤러 클래스 메서드와 time.sleep에 타이머 설치 (끝나면 원래대로)"""
+    originals = []
+    for cls in classes:
+        for name in PHASES:
+            fn = cls.__dict__.get(name)
+            if fn is not None:
+                originals.append((cls, name, fn))
+                setattr(cls, name, timer.wrap(name, fn))
+    time.sleep = timer.wrap('time.sleep', _real_sleep)
+    try:
+        yield
+    finally:
+        time.sleep = _real_sleep
+        for cls, name, fn in originals:
+            setattr(cls, name, fn)
+
+
+def run(crawler, profile, stores=10, scale=1.0, missing=1):
+    """재생 디바이스로 크롤링 1회 → (수집한 가게 수, 처리한 가게/행 수, 전체 시간, PhaseTimer)
+
+    V2는 엑셀 행 stores개 + 배민에 없는 가게 missing개를 검색 (못 찾은 행도 검색 시간은 듦)
+    """
+    import pandas as pd
+    from baemin_crawler_final import BaeminCrawler
+    sys.path.insert(0, os.path.join(HERE, '..', 'version2'))
+    from baemin_crawler_v2_gui import BaeminCrawlerV2
+
+    timer = PhaseTimer()
+    delays = {k: v * scale for k, v in PROFILES[profile].items()}
+    device = LatencyDevice(baemin_device(), delays, timer)
+
+    cwd = os.getcwd()
+    os.chdir(HERE)
+    start = time.perf_counter()
+    try:
+        with instrument(timer, [BaeminCrawler, BaeminCrawlerV2]), contextlib.redirect_stdout(io.StringIO()):
+            if crawler == 'v1':
+                records, _ = run_v1(stores, device=device)
+                found = searched = len(records)
+            else:
+                names = [s['가게명'] for s in make_stores()[:stores]] + [f'없는 가게 {i + 1}' for i in range(missing)]
+                output_path, _ = run_v2(names, device=device)
+                searched = len(names)
+                found = int(pd.read_excel(output_path)['크롤링시간'].notna().sum())
+    finally:
+        os.chdir(cwd)
+    return found, searched, time.perf_counter() - start, timer
+
+
+def report(crawler, profile, found, searched, wall, timer):
+    print(f'\n[{crawler} / {profile}] 가게 {found}개, {wall:.1f}초 → {found / wall * 3600:,.0f} 가게/시간'
+          f' ({wall / max(found, 1):.2f}초/가게)')
+    if searched != found:
+        print(f'  검색한 행 {searched}개 (못 찾음 {searched - found}개) → {searched / wall * 3600:,.0f} 행/시간'
+              f' ({wall / max(searched, 1):.2f}초/행)')
+
+    device_io = sum(t for name, t in timer.exclusive.items() if name.startswith('device.'))
+    sleep = timer.exclusive.get('time.sleep', 0.0)
+    cpu = wall - device_io - sleep
+    print(f'  디바이스 I/O {device_io:6.1f}초 ({device_io / wall:4.0%})  '
+          f'time.sleep {sleep:6.1f}초 ({sleep / wall:4.0%})  '
+          f'나머지(CPU) {cpu:6.1f}초 ({cpu / wall:4.0%})')
+
+    print('  가장 무거운 호출 경로 (단계마다 포함 시간이 가장 큰 하위 단계)')
+    for depth, (name, elapsed) in enumerate(timer.critical_path()):
+        print(f'    {"  " * depth}{name} {elapsed:.2f}초 ({elapsed / wall:.0%})')
+
+    print('  단계별 시간 (자체 시간 많은 순)')
+    print(f'  {"단계":28s} {"호출":>6s} {"포함(초)":>9s} {"자체(초)":>9s} {"자체 비율":>8s}')
+    for name, own in sorted(timer.exclusive.items(), key=lambda kv: -kv[1]):
+        print(f'  {name:28s} {timer.calls[name]:6d} {timer.inclusive[name]:9.2f} {own:9.2f} {own / wall:8.1%}')
+
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='재생 디바이스 + 지연 주입으로 전체 크롤링 처리량 측정')
+    parser.add_argument('crawler', choices=['v1', 'v2'])
+    parser.add_argument('--stores', type=int, default=10, help='크롤링할 가게 수')
+    parser.add_argument('--profile', default='usb', choices=list(PROFILES) + ['all'], help='지연 프로필')
+    parser.add_argument('--scale', type=float, default=1.0, help='지연 배율 (빠른 확인용으로 0.1 등)')
+    parser.add_argument('--missing', type=int, default=1, help='V2: 엑셀에 섞을 배민에 없는 가게 수')
+    args = parser.parse_args()
+
+    profiles = [p for p in PROFILES if p != 'none'] if args.profile == 'all' else [args.profile]
+    for profile in profiles:
+        found, searched, wall, timer = run(args.crawler, profile, args.stores, args.scale, args.missing)
+        report(args.crawler, profile, found, searched, wall, timer)
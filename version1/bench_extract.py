@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+추출 함수 마이크로 벤치마크 - UI 덤프 파싱/가게목록/통계/가게정보/배달타입/방금본가게 추출 시간 측정
+입력: ui_dumps/*.xml + 재생 디바이스 크롤링 1회에서 나온 덤프 + --session 녹화 파일
+결과는 커밋별로 bench_history.jsonl에 쌓고, 직전 커밋보다 느려진 항목은 [REGRESSION] 표시
+
+사용법:
+    python bench_extract.py                       # 측정 + 기록
+    python bench_extract.py --session s.zip       # 녹화 세션 덤프 추가
+    python bench_extract.py --check               # 느려진 항목이 있으면 종료 코드 1
+"""
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from baemin_crawler_final import BaeminCrawler
+from screen_snapshot import ScreenSnapshot
+from store_list import StoreListModel
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HISTORY_FILE = os.path.join(HERE, 'bench_history.jsonl')
+
+# 이름 → (crawler, snap) → 결과
+BENCHMARKS = {
+    'get_stores_below_기본순': lambda c, snap: c.get_stores_below_기본순(passed_기본순=True, snap=snap),
+    'extract_stats': lambda c, snap: c.extract_stats(snap),
+    'extract_store_info': lambda c, snap: c.extract_store_info(snap),
+    'extract_delivery_types': lambda c, snap: c.extract_delivery_types(snap),
+    'get_방금본가게_아래_4개': lambda c, snap: c.get_방금본가게_아래_4개(snap),
+}
+
+
+def load_dumps(sessions=(), replay=True):
+    """벤치마크 입력 덤프 → [(이름, xml), ...] (같은 내용은 한 번만)"""
+    dumps = {}
+    for path in sorted(glob.glob(os.path.join(HERE, 'ui_dumps', '*.xml'))):
+        with open(path, encoding='utf-8') as f:
+            dumps.setdefault(f.read(), os.path.basename(path))
+
+    if replay:
+        # 녹화에 없는 화면(가게목록/가게정보 등)은 재생 디바이스 크롤링 1회로 확보
+        from replay_device import baemin_device, run_v1
+        from session_recorder import RecordingDevice, SessionArchive
+        buf = io.BytesIO()
+        device = RecordingDevice(baemin_device(), SessionArchive(buf, 'w'))
+        cwd = os.getcwd()
+        os.chdir(HERE)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_v1(8, device=device)
+        finally:
+            os.chdir(cwd)
+        device.close()
+        for i, xml in enumerate(SessionArchive(buf).dumps()):
+            dumps.setdefault(xml, f'replay#{i}')
+
+    for path in sessions:
+        from session_recorder import SessionArchive
+        with SessionArchive(path) as archive:
+            for i, xml in enumerate(archive.dumps()):
+                dumps.setdefault(xml, f'{os.path.basename(path)}#{i}')
+
+    return [(name, xml) for xml, name in dumps.items()]
+
+
+def measure(fn, xml, repeat, setup=None):
+    """fn(snap)을 새 스냅샷마다 repeat번 호출 → (호출당 시간 목록 초, 최대 메모리 바이트)
+
+    setup: 호출마다 먼저 실행 (측정 밖) - 이전 호출이 채운 캐시 비우기 등
+    """
+    times = []
+    for _ in range(repeat):
+        snap = ScreenSnapshot(xml)   # 파싱은 측정 밖 (geometry 등 지연 계산은 측정에 포함)
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn(snap)
+        times.append(time.perf_counter() - start)
+
+    snap = ScreenSnapshot(xml)
+    if setup:
+        setup()
+    tracemalloc.start()
+    fn(snap)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return times, peak
+
+
+def run_benchmarks(dumps, repeat=30, verbose=False):
+    """전체 벤치마크 → {이름: {'median_us', 'p90_us', 'peak_kib'}}"""
+    crawler = BaeminCrawler()
+
+    def fresh_list():
+        # 가게목록 행 분류 캐시(store_list)는 크롤러에 남음 → 호출마다 새 목록 모델 (처음 보는 화면 기준)
+        crawler.store_list = StoreListModel()
+
+    cases = dict(BENCHMARKS)
+    cases['parse(ScreenSnapshot)'] = None
+
+    results = {}
+    for name, bench in cases.items():
+        all_times = []
+        peaks = []
+        for dump_name, xml in dumps:
+            if bench is None:
+                fn = lambda snap, xml=xml: ScreenSnapshot(xml)
+            else:
+                fn = lambda snap, bench=bench: bench(crawler, snap)
+            times, peak = measure(fn, xml, repeat, fresh_list)
+            all_times.extend(times)
+            peaks.append(peak)
+            if verbose:
+                print(f'    {name:28s} {dump_name:24s} {statistics.median(times) * 1e6:9.1f}us {peak / 1024:8.1f}KiB')
+        all_times.sort()
+        results[name] = {
+            'median_us': round(statistics.median(all_times) * 1e6, 2),
+            'p90_us': round(all_times[int(len(all_times) * 0.9)] * 1e6, 2),
+            'peak_kib': round(max(peaks) / 1024, 1),
+        }
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def load_history(path=HISTORY_FILE):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_regressions(results, baseline, tolerance=0.2, min_us=2.0):
+    """baseline보다 tolerance 비율 이상(최소 min_us) 느려진 항목 → [(이름, 이전, 현재)]"""
+    regressions = []
+    for name, r in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        if r['median_us'] > old['median_us'] * (1 + tolerance) and r['median_us'] - old['median_us'] >= min_us:
+            regressions.append((name, old['median_us'], r['median_us']))
+    return regressions
+
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='추출 함수 마이크로 벤치마크')
+    parser.add_argument('--session', nargs='*', default=[], help='녹화 세션 zip (session_recorder)')
+    parser.add_argument('--no-replay', action='store_true', help='재생 디바이스 덤프 제외')
+    parser.add_argument('--repeat', type=int, default=30, help='덤프마다 반복 횟수')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='이 비율 이상 느려지면 회귀로 표시')
+    parser.add_argument('--history', default=HISTORY_FILE, help='기록 파일')
+    parser.add_argument('--no-save', action='store_true', help='기록 파일에 저장하지 않음')
+    parser.add_argument('--check', action='store_true', help='회귀가 있으면 종료 코드 1')
+    parser.add_argument('-v', '--verbose', action='store_true', help='덤프별 결과 출력')
+    args = parser.parse_args()
+
+    dumps = load_dumps(args.session, replay=not args.no_replay)
+    print(f'[INFO] 덤프 {len(dumps)}개, 반복 {args.repeat}회')
+    results = run_benchmarks(dumps, args.repeat, args.verbose)
+
+    commit = git_commit()
+    history = load_history(args.history)
+    # 비교 기준: 다른 커밋의 가장 최근 기록
+    baseline = next((h for h in reversed(history) if h['commit'] != commit), None)
+    regressions = find_regressions(results, baseline['results'], args.tolerance) if baseline else []
+    slow = {name for name, _, _ in regressions}
+
+    print(f'{"벤치마크":28s} {"중앙값":>10s} {"p90":>10s} {"최대메모리":>10s}  {"이전(" + baseline["commit"] + ")" if baseline else ""}')
+    for name, r in results.items():
+        before = baseline['results'].get(name, {}).get('median_us') if baseline else None
+        mark = '  [REGRESSION]' if name in slow else ''
+        print(f'{name:28s} {r["median_us"]:8.1f}us {r["p90_us"]:8.1f}us {r["peak_kib"]:7.1f}KiB'
+              f'  {f"{before:.1f}us" if before is not None else ""}{mark}')
+
+    if not args.no_save:
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'commit': commit, 'date': datetime.now().isoformat(timespec='seconds'),
+                                'dumps': len(dumps), 'results': results}, ensure_ascii=False) + '\n')
+
+    if regressions:
+        print(f'[WARN] 회귀 {len(regressions)}개 (기준 {baseline["commit"]})')
+        if args.check:
+            sys.exit(1)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+크롤링 중간 저장 - 가게 1개 끝날 때마다 JSONL 파일에 한 줄씩 추가
+중간에 죽어도 그때까지 수집한 가게는 남고, --resume으로 이어서 크롤링
+"""
+import json
+import os
+
+
+class RecordLog:
+    """JSONL 기록 파일 (레코드 1개 = 한 줄)
+
+    Args:
+        path: 파일 경로
+        fsync_every: 몇 개마다 디스크까지 동기화할지 (flush는 매번)
+    """
+
+    def __init__(self, path, fsync_every=5):
+        self.path = path
+        self.fsync_every = fsync_every
+        self._file = None
+        self._pending = 0
+
+    def load(self):
+        """저장된 레코드 목록 (마지막 줄이 쓰다 만 상태면 무시)"""
+        return self._read()[0]
+
+    def _read(self):
+        # → (레코드 목록, 온전한 마지막 줄까지의 바이트 길이)
+        if not os.path.exists(self.path):
+            return [], 0
+        records = []
+        good = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+                good += len(line)
+        return records, good
+
+    def open(self, resume=False):
+        """기록 시작 - resume이면 기존 레코드를 돌려주고 이어서 추가, 아니면 비우고 시작"""
+        records, good = self._read() if resume else ([], 0)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        # 쓰다 만 마지막 줄은 잘라냄
+        self._file.truncate(good)
+        self._pending = 0
+        return records
+
+    def append(self, record):
+        """레코드 1개 추가"""
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        """디스크까지 동기화"""
+        if self._file and self._pending:
+            os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def close(self):
+        if self._file:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+디바이스 화면 정보 - 연결할 때 window_size()를 한 번만 불러서 보관
+제스처 좌표는 화면 비율(0~1)로 적고 여기서 실제 픽셀로 바꿈
+기존 픽셀 값은 1080x2400 화면에서 잡은 값 (BASE_WIDTH, BASE_HEIGHT)
+"""
+
+BASE_WIDTH, BASE_HEIGHT = 1080, 2400
+
+
+class DeviceProfile:
+    """화면 크기 + 비율/기준 픽셀 → 실제 픽셀 변환
+
+    Args:
+        width, height: 화면 크기 (px)
+    """
+
+    def __init__(self, width=BASE_WIDTH, height=BASE_HEIGHT):
+        self.width = width
+        self.height = height
+
+    @classmethod
+    def from_device(cls, d):
+        """d.window_size()로 생성 (실패하면 기준 화면 크기)"""
+        try:
+            width, height = d.window_size()
+        except Exception as e:
+            print(f'[WARN] 화면 크기 확인 실패, {BASE_WIDTH}x{BASE_HEIGHT}로 가정: {e}')
+            return cls()
+        return cls(width, height)
+
+    def x(self, fx):
+        """가로 비율 → px"""
+        return int(round(fx * self.width))
+
+    def y(self, fy):
+        """세로 비율 → px"""
+        return int(round(fy * self.height))
+
+    def swipe(self, fx, fy, tx, ty):
+        """비율 좌표 스와이프 → (fx, fy, tx, ty) px"""
+        return self.x(fx), self.y(fy), self.x(tx), self.y(ty)
+
+    def px(self, base_px):
+        """기준 화면(가로 1080)에서 잰 거리 → 이 화면의 px (UI 요소 크기는 가로 해상도에 비례)"""
+        return int(round(base_px * self.width / BASE_WIDTH))
+
+    def __repr__(self):
+        return f'DeviceProfile({self.width}x{self.height})'
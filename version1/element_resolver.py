@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+버튼 찾기 - 이미 받아둔 UI 덤프(스냅샷)에서 desc/text/resource-id로 먼저 찾고
+없을 때만 스크린샷 이미지 매칭
+앱 버전별로 어떤 방법이 통했는지 기억해서 다음부터 그 방법을 먼저 시도
+"""
+import json
+import os
+import re
+import threading
+
+STRATEGY_FILE = 'element_strategy.json'  # 실행 폴더 기준 (중간 저장 파일과 같은 위치, .gitignore)
+_file_lock = threading.Lock()           # 같은 프로세스의 디바이스 스레드(크롤러마다 ElementResolver 1개)가 번갈아 저장
+
+
+class ElementTarget:
+    """찾을 버튼 정의
+
+    Args:
+        name: 버튼 이름 (기억 파일의 키)
+        selectors: [(방법 이름, UINode → bool), ...] 스냅샷에서 찾는 방법들
+        template: 이미지 매칭용 템플릿 경로 (없으면 이미지 매칭 안 함)
+        threshold: 이미지 매칭 정확도
+    """
+
+    def __init__(self, name, selectors, template=None, threshold=0.7):
+        self.name = name
+        self.selectors = selectors
+        self.template = template
+        self.threshold = threshold
+
+    def strategies(self):
+        names = [label for label, _ in self.selectors]
+        if self.template:
+            names.append('image')
+        return names
+
+
+# "가게정보·원산지" (공지 글의 '가게 정보란' 같은 문장은 제외)
+_STORE_INFO_LABEL = re.compile(r'^가게\s*정보\s*([·・/]\s*원산지)?$')
+
+STORE_INFO_BUTTON = ElementTarget(
+    '가게정보·원산지',
+    selectors=[
+        ('desc', lambda n: bool(_STORE_INFO_LABEL.match(n.desc))),
+        ('text', lambda n: bool(_STORE_INFO_LABEL.match(n.text))),
+        ('resource-id', lambda n: 'store_info' in n.resource_id or 'shop_info' in n.resource_id),
+    ],
+    template='templates/store_info_btn.png',
+    threshold=0.6,
+)
+
+
+class ElementResolver:
+    """앱 버전별로 통한 방법을 기억하는 버튼 클릭기 (디바이스 여러 대가 공유해도 됨)
+
+    Args:
+        path: 기억 파일 경로 (JSON, {앱 버전: {버튼 이름: 방법}})
+    """
+
+    def __init__(self, path=STRATEGY_FILE):
+        self.path = path
+        self._learned = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def order(self, target, version):
+        """시도할 방법 순서 - 이 버전에서 통했던 방법을 먼저"""
+        strategies = target.strategies()
+        learned = self._learned.get(version, {}).get(target.name)
+        if learned in strategies:
+            strategies.remove(learned)
+            strategies.insert(0, learned)
+        return strategies
+
+    def remember(self, target, version, strategy):
+        if self._learned.get(version, {}).get(target.name) == strategy:
+            return
+        with _file_lock:
+            # 다른 크롤러가 그 사이 저장한 기록에 합쳐서 임시 파일 → 교체 (쓰다 만 파일을 읽지 않게)
+            learned = self._load()
+            for v, targets in self._learned.items():
+                learned.setdefault(v, {}).update(targets)
+            learned.setdefault(version, {})[target.name] = strategy
+            self._learned = learned
+            tmp = f'{self.path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            try:
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(learned, f, ensure_ascii=False, indent=2)
+                os.replace(tmp, self.path)
+            except OSError:
+                pass
+
+    def find_node(self, snap, target, strategy):
+        """스냅샷에서 방법(strategy)에 맞는 노드 (없으면 None)"""
+        for label, matches in target.selectors:
+            if label == strategy:
+                for n in snap.nodes:
+                    if n.has_bounds and matches(n):
+                        return n
+        return None
+
+    def click(self, d, snap, target, version, image_click):
+        """버튼 클릭 → 통한 방법 이름, 못 찾으면 None
+
+        Args:
+            d: 디바이스
+            snap: 현재 화면 스냅샷 (이미 받아둔 것)
+            target: ElementTarget
+            version: 앱 버전 (기억 키)
+            image_click: (템플릿 경로, 정확도) → bool, 이미지 매칭 클릭
+        """
+        for strategy in self.order(target, version):
+            if strategy == 'image':
+                if not image_click(target.template, target.threshold):
+                    continue
+            else:
+                node = self.find_node(snap, target, strategy)
+                if node is None:
+                    continue
+                d.click((node.x1 + node.x2) // 2, (node.y1 + node.y2) // 2)
+            self.remember(target, version, strategy)
+            return strategy
+        return None
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+노드 좌표 계산 - bounds 파싱과 행/열 위치 질의
+bounds 전체를 N×4 int32 배열 하나로 만들어서 반복문 대신 벡터 마스크로 질의
+"""
+import re
+import numpy as np
+
+# "[x1,y1][x2,y2]"
+BOUNDS_RE = re.compile(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]')
+
+
+def parse_bounds(bounds):
+    """bounds 문자열 → (x1, y1, x2, y2), 형식이 틀리면 None"""
+    match = BOUNDS_RE.search(bounds)
+    if match:
+        return tuple(map(int, match.groups()))
+    return None
+
+
+class NodeGeometry:
+    """bounds가 있는 노드들의 좌표 배열 (행 순서 = 문서 순서)
+
+    boxes[i] = (x1, y1, x2, y2), nodes[i]가 해당 UINode
+    """
+
+    def __init__(self, nodes):
+        self.nodes = [n for n in nodes if n.has_bounds]
+        if self.nodes:
+            self.boxes = np.array([(n.x1, n.y1, n.x2, n.y2) for n in self.nodes], dtype=np.int32)
+        else:
+            self.boxes = np.empty((0, 4), dtype=np.int32)
+        self.x1 = self.boxes[:, 0]
+        self.y1 = self.boxes[:, 1]
+        self.x2 = self.boxes[:, 2]
+        self.y2 = self.boxes[:, 3]
+        self.cy = (self.y1 + self.y2) // 2
+        self.has_text = np.array([bool(n.text) for n in self.nodes], dtype=bool)
+        self._row_of = {id(n): i for i, n in enumerate(self.nodes)}
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def row(self, node):
+        """UINode → 배열 행 번호"""
+        return self._row_of[id(node)]
+
+    def same_row(self, node, tol=40):
+        """node와 세로 중심이 tol 미만으로 차이나는 노드 마스크"""
+        return np.abs(self.cy - self.cy[self.row(node)]) < tol
+
+    def right_of(self, node):
+        """node 오른쪽 끝 이후에서 시작하는 노드 마스크"""
+        return self.x1 >= self.x2[self.row(node)]
+
+    def right_in_row(self, node, tol=40, mask=None):
+        """같은 행에서 node 오른쪽에 있는 노드들 (문서 순서)"""
+        hits = self.same_row(node, tol) & self.right_of(node)
+        if mask is not None:
+            hits &= mask
+        return [self.nodes[i] for i in np.flatnonzero(hits)]
+
+
+def dedup_by_y(items, tol, key=lambda item: item['y']):
+    """y좌표가 tol 미만으로 가까운 항목 제거 (위에서부터 먼저 나온 것 유지)
+
+    정렬 후 직전에 남긴 항목과만 비교하면 되므로 O(n log n)
+    반환값은 y 오름차순
+    """
+    unique = []
+    last_y = None
+    for item in sorted(items, key=key):
+        y = key(item)
+        if last_y is None or y - last_y >= tol:
+            unique.append(item)
+            last_y = y
+    return unique
+
+
+def dedup_points(points, tol):
+    """x, y 모두 tol 미만으로 가까운 점 제거 (먼저 나온 점 유지, 입력 순서 보존)
+
+    tol 크기 격자에 남긴 점을 담아 주변 3×3 칸만 확인 - 칸마다 점은 최대 1개
+    """
+    grid = {}
+    unique = []
+    for x, y in points:
+        gx, gy = x // tol, y // tol
+        is_dup = False
+        for cx in (gx - 1, gx, gx + 1):
+            for cy in (gy - 1, gy, gy + 1):
+                other = grid.get((cx, cy))
+                if other and abs(other[0] - x) < tol and abs(other[1] - y) < tol:
+                    is_dup = True
+                    break
+            if is_dup:
+                break
+        if not is_dup:
+            grid[(gx, gy)] = (x, y)
+            unique.append((x, y))
+    return unique
@@ -8,6 +8,8 @@ import numpy as np
 import os
 import sys
 
+from geometry import dedup_points
+
 sys.stdout.reconfigure(encoding='utf-8')
 
 def find_and_click(template_path, threshold=0.8):
@@ -102,18 +104,9 @@ def find_all(template_path, threshold=0.8):
     result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
     locations = np.where(result >= threshold)
 
-    points = []
-    for pt in zip(*locations[::-1]):
-        center_x = pt[0] + w // 2
-        center_y = pt[1] + h // 2
-        # 중복 제거 (근접한 점들)
-        is_dup = False
-        for px, py in points:
-            if abs(px - center_x) < 20 and abs(py - center_y) < 20:
-                is_dup = True
-                break
-        if not is_dup:
-            points.append((center_x, center_y))
+    # 중복 제거 (근접한 점들)
+    centers = [(int(x) + w // 2, int(y) + h // 2) for x, y in zip(*locations[::-1])]
+    points = dedup_points(centers, 20)
 
     print(f'[INFO] {len(points)}개 발견')
     for i, (x, y) in enumerate(points):
@@ -5,7 +5,6 @@ UI Inspector - 클릭으로 요소 정보 확인
 """
 import uiautomator2 as u2
 import xml.etree.ElementTree as ET
-import re
 import http.server
 import socketserver
 import webbrowser
@@ -15,6 +14,9 @@ import sys
 import os
 from io import BytesIO
 
+from geometry import BOUNDS_RE
+from screenshot import ScreenshotService
+
 PORT = 8888
 
 class InspectorHandler(http.server.SimpleHTTPRequestHandler):
@@ -34,15 +36,20 @@ class InspectorHandler(http.server.SimpleHTTPRequestHandler):
     def send_screenshot(self):
         try:
             d = u2.connect()
-            img = d.screenshot()
-            buffer = BytesIO()
-            img.save(buffer, format='PNG')
-            img_data = base64.b64encode(buffer.getvalue()).decode()
+            # 폰이 보낸 축소 JPEG base64를 그대로 전달 (PNG 재인코딩 없음)
+            screens = ScreenshotService(d)
+            img_data = screens.jpeg_base64()
+            result = {'image': img_data, 'format': 'jpeg', 'scale': screens.scale}
+            if not img_data:
+                img = d.screenshot()
+                buffer = BytesIO()
+                img.save(buffer, format='PNG')
+                result = {'image': base64.b64encode(buffer.getvalue()).decode(), 'format': 'png', 'scale': 1}
 
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
             self.end_headers()
-            self.wfile.write(json.dumps({'image': img_data}).encode())
+            self.wfile.write(json.dumps(result).encode())
         except Exception as e:
             self.send_response(500)
             self.end_headers()
@@ -57,7 +64,7 @@ class InspectorHandler(http.server.SimpleHTTPRequestHandler):
             elements = []
             def parse(node):
                 bounds = node.attrib.get('bounds', '')
-                match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
+                match = BOUNDS_RE.search(bounds)
                 if match:
                     x1, y1, x2, y2 = map(int, match.groups())
                     elem = {
@@ -173,9 +180,10 @@ HTML_PAGE = '''
                 elements = await hierRes.json();
 
                 const img = document.getElementById('screenshot');
-                img.src = 'data:image/png;base64,' + imgData.image;
+                img.src = `data:image/${imgData.format};base64,` + imgData.image;
                 img.onload = () => {
-                    scale = img.naturalWidth / img.clientWidth;
+                    // 화면 좌표 / 표시 좌표 (축소해서 받은 이미지면 그만큼 보정)
+                    scale = img.naturalWidth / img.clientWidth / imgData.scale;
                     document.getElementById('status').textContent = `로드 완료! 요소 ${elements.length}개 (클릭하여 확인)`;
                 };
             } catch(e) {
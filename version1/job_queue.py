@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 작업 큐 - 여러 디바이스 워커가 작업을 하나씩 가져가는 방식 (work stealing)
+임대(lease) 시간 안에 끝내지 못한 작업은 다른 워커가 다시 가져감, 실패는 재시도 횟수까지
+"""
+import json
+import sqlite3
+import time
+from contextlib import closing
+
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class JobQueue:
+    """작업 큐 (파일 1개, 스레드/프로세스 여러 개에서 동시 사용 가능)
+
+    Args:
+        path: SQLite 파일 경로
+        lease_seconds: 작업 1개 임대 시간 - 넘으면 워커가 죽은 것으로 보고 다시 배정
+        max_attempts: 작업당 최대 시도 횟수
+    """
+
+    def __init__(self, path, lease_seconds=180, max_attempts=3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    owner TEXT,
+                    lease_until REAL,
+                    result TEXT,
+                    error TEXT,
+                    seq INTEGER
+                )
+            ''')
+
+    def _connect(self):
+        # 호출마다 새 연결 - sqlite3 연결은 스레드 간 공유 불가
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        # WAL + NORMAL: 커밋마다가 아니라 체크포인트 때 묶어서 fsync (프로그램이 죽어도 커밋된 행은 남음)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return closing(conn)  # with가 끝나면 닫음 (sqlite3 연결의 with는 커밋만 하고 닫지 않음)
+
+    def reset(self):
+        """모든 작업 삭제"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM jobs')
+
+    def requeue(self):
+        """이전 실행에서 임대 중이던(중단된) 작업과 실패한 작업을 다시 대기로 (이어서 하기용)"""
+        with self._connect() as conn:
+            cur = conn.execute(
+                'UPDATE jobs SET status = ?, attempts = 0, owner = NULL, lease_until = NULL '
+                'WHERE status IN (?, ?)', (PENDING, LEASED, FAILED))
+            return cur.rowcount
+
+    def add(self, key, payload):
+        """작업 추가 (같은 key가 이미 있으면 그대로 둠)"""
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR IGNORE INTO jobs (key, payload, seq) '
+                'VALUES (?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM jobs))',
+                (str(key), json.dumps(payload, ensure_ascii=False)))
+
+    def lease(self, owner):
+        """대기 중이거나 임대가 만료된 작업 1개 가져오기 → (key, payload), 없으면 None"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._expire(conn, now)
+                row = conn.execute(
+                    'SELECT key, payload FROM jobs '
+                    'WHERE attempts < ? AND (status = ? OR (status = ? AND lease_until < ?)) '
+                    'ORDER BY seq LIMIT 1',
+                    (self.max_attempts, PENDING, LEASED, now)).fetchone()
+                if row is None:
+                    conn.execute('COMMIT')
+                    return None
+                conn.execute(
+                    'UPDATE jobs SET status = ?, owner = ?, lease_until = ?, attempts = attempts + 1 '
+                    'WHERE key = ?',
+                    (LEASED, owner, now + self.lease_seconds, row[0]))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        return row[0], json.loads(row[1])
+
+    def _expire(self, conn, now):
+        # 마지막 시도의 임대가 만료된 작업(워커가 멈추거나 죽음) → 실패 처리 (fail()과 같은 결과)
+        return conn.execute(
+            'UPDATE jobs SET status = ?, error = ?, lease_until = NULL '
+            'WHERE status = ? AND lease_until < ? AND attempts >= ?',
+            (FAILED, f'임대 만료 ({self.lease_seconds}초 안에 끝나지 않음)', LEASED, now, self.max_attempts)).rowcount
+
+    def complete(self, key, owner, result=None):
+        """작업 완료 (임대한 워커만, 임대가 다른 워커로 넘어갔으면 False)"""
+        with self._connect() as conn:
+            cur = conn.execute(
+                'UPDATE jobs SET status = ?, result = ?, lease_until = NULL '
+                'WHERE key = ? AND owner = ? AND status = ?',
+                (DONE, json.dumps(result, ensure_ascii=False), str(key), owner, LEASED))
+            return cur.rowcount == 1
+
+    def fail(self, key, owner, error=''):
+        """작업 실패 - 시도 횟수가 남았으면 다시 대기, 아니면 실패 처리"""
+        with self._connect() as conn:
+            cur = conn.execute(
+                'UPDATE jobs SET status = CASE WHEN attempts < ? THEN ? ELSE ? END, '
+                'error = ?, lease_until = NULL '
+                'WHERE key = ? AND owner = ? AND status = ?',
+                (self.max_attempts, PENDING, FAILED, str(error), str(key), owner, LEASED))
+            return cur.rowcount == 1
+
+    def has_unfinished(self):
+        """아직 끝나지 않은(대기/임대 중, 재시도 가능) 작업이 있는지"""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT COUNT(*) FROM jobs WHERE (attempts < ? AND status IN (?, ?)) '
+                'OR (status = ? AND lease_until >= ?)',
+                (self.max_attempts, PENDING, LEASED, LEASED, time.time())).fetchone()
+            return row[0] > 0
+
+    def results(self):
+        """완료된 작업 결과 {key: result}"""
+        with self._connect() as conn:
+            rows = conn.execute('SELECT key, result FROM jobs WHERE status = ?', (DONE,)).fetchall()
+        return {key: json.loads(result) for key, result in rows}
+
+    def counts(self):
+        """상태별 작업 수 (만료된 마지막 임대는 실패로 집계)"""
+        with self._connect() as conn:
+            self._expire(conn, time.time())
+            rows = conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        return dict(rows)
+
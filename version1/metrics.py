@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+크롤러 상태 모니터링 - 크롤러 프로세스 안에서 HTTP로 현재 상태 제공
+    /metrics  Prometheus 텍스트 형식 (완료 가게 수, 분당 가게 수, 덤프/스크린샷 지연 히스토그램,
+              재시도/건너뜀 수, 디바이스별 상태)
+    /         같은 내용을 보여주는 간단한 상태 페이지 (5초마다 새로고침)
+
+serve()를 부르기 전에는 기록하지 않음 (connect()에서 디바이스를 감싸지 않음)
+
+사용법:
+    metrics.serve(9100)
+    metrics.inc('stores_completed', device='R3CN...')
+"""
+import bisect
+import html
+import http.server
+import threading
+import time
+from collections import defaultdict, deque
+
+# 지연 히스토그램 구간 (초)
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+RATE_WINDOW = 300  # 분당 가게 수 계산 구간 (초)
+STALE_AFTER = 120  # 이 시간 동안 RPC가 없으면 디바이스 멈춤으로 표시 (초)
+
+HELP = {
+    'stores_completed': ('counter', '수집 완료한 가게 수'),
+    'retries': ('counter', '다시 시도한 횟수 (kind별)'),
+    'skips': ('counter', '건너뛴 가게 수 (reason별)'),
+    'rpc_errors': ('counter', '디바이스 RPC 예외 수'),
+    'dump_seconds': ('histogram', 'UI 덤프 지연 (초)'),
+    'screenshot_seconds': ('histogram', '스크린샷 지연 (초)'),
+}
+
+
+def _escape(value):
+    # 라벨 값 이스케이프 (Prometheus 텍스트 형식: \ " 줄바꿈)
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in sorted(labels.items())) + '}'
+
+
+class _Histogram:
+    __slots__ = ('counts', 'total', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class Metrics:
+    """카운터/히스토그램/디바이스 상태 저장소 (스레드 안전)"""
+
+    def __init__(self, prefix='baemin'):
+        self.prefix = prefix
+        self.enabled = False
+        self._counters = defaultdict(int)     # (이름, 라벨 튜플) → 값
+        self._histograms = {}                  # (이름, 라벨 튜플) → _Histogram
+        self._completed = deque()              # 최근 완료 시각 (분당 가게 수용)
+        self._devices = {}                     # 디바이스 → {'last_seen', 'ok', 'error', 'errors'}
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self.server = None
+
+    def inc(self, name, n=1, **labels):
+        """카운터 증가 (stores_completed면 분당 가게 수에도 반영)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[(name, tuple(sorted(labels.items())))] += n
+            if name == 'stores_completed':
+                now = time.time()
+                self._completed.extend([now] * n)
+
+    def observe(self, name, seconds, **labels):
+        """히스토그램에 값 추가"""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = _Histogram()
+            hist.observe(seconds)
+
+    def device_seen(self, device, error=None):
+        """디바이스 RPC 결과 기록 - error가 있으면 비정상으로 표시"""
+        if not self.enabled:
+            return
+        with self._lock:
+            state = self._devices.setdefault(device, {'last_seen': 0.0, 'ok': True, 'error': '', 'errors': 0})
+            state['last_seen'] = time.time()
+            state['ok'] = error is None
+            if error is not None:
+                state['error'] = str(error)[:200]
+                state['errors'] += 1
+
+    def stores_per_minute(self):
+        now = time.time()
+        with self._lock:
+            while self._completed and self._completed[0] < now - RATE_WINDOW:
+                self._completed.popleft()
+            recent = len(self._completed)
+        window = min(RATE_WINDOW, max(now - self._started, 1.0))
+        return recent * 60 / window
+
+    def devices(self):
+        """디바이스 → (정상 여부, 마지막 RPC 이후 초, 오류 수, 마지막 오류)"""
+        now = time.time()
+        with self._lock:
+            return {device: (s['ok'] and now - s['last_seen'] < STALE_AFTER, now - s['last_seen'], s['errors'], s['error'])
+                    for device, s in self._devices.items()}
+
+    def render(self):
+        """Prometheus 텍스트 형식"""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (list(h.counts), h.total, h.count) for key, h in self._histograms.items()}
+
+        lines = []
+        described = set()
+
+        def describe(name, kind=None, text=None):
+            if name not in described:
+                kind, text = HELP.get(name, (kind, text))
+                # 카운터는 샘플 이름(_total)과 같은 이름으로 설명
+                family = f'{self.prefix}_{name}_total' if kind == 'counter' else f'{self.prefix}_{name}'
+                lines.append(f'# HELP {family} {text}')
+                lines.append(f'# TYPE {family} {kind}')
+                described.add(name)
+
+        for (name, labels), value in sorted(counters.items()):
+            describe(name, 'counter', name)
+            lines.append(f'{self.prefix}_{name}_total{_labels(dict(labels))} {value}')
+
+        for (name, labels), (counts, total, count) in sorted(histograms.items()):
+            describe(name, 'histogram', name)
+            labels = dict(labels)
+            cumulative = 0
+            for bound, n in zip(list(BUCKETS) + ['+Inf'], counts):
+                cumulative += n
+                lines.append(f'{self.prefix}_{name}_bucket{_labels({**labels, "le": bound})} {cumulative}')
+            lines.append(f'{self.prefix}_{name}_sum{_labels(labels)} {total:.6f}')
+            lines.append(f'{self.prefix}_{name}_count{_labels(labels)} {count}')
+
+        describe('stores_per_minute', 'gauge', f'최근 {RATE_WINDOW}초 기준 분당 완료 가게 수')
+        lines.append(f'{self.prefix}_stores_per_minute {self.stores_per_minute():.3f}')
+
+        devices = self.devices()
+        if devices:
+            describe('device_up', 'gauge', '디바이스 정상 여부 (마지막 RPC 성공 + 최근 응답)')
+            for device, (ok, _, _, _) in sorted(devices.items()):
+                lines.append(f'{self.prefix}_device_up{_labels({"device": device})} {int(ok)}')
+            describe('device_last_seen_seconds', 'gauge', '마지막 디바이스 RPC 이후 시간 (초)')
+            for device, (_, ago, _, _) in sorted(devices.items()):
+                lines.append(f'{self.prefix}_device_last_seen_seconds{_labels({"device": device})} {ago:.1f}')
+        return '\n'.join(lines) + '\n'
+
+    def render_html(self):
+        """상태 페이지"""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (h.total, h.count) for key, h in self._histograms.items()}
+
+        rows = ''.join(f'<tr><td>{html.escape(name)}</td><td>{html.escape(_labels(dict(labels)))}</td><td>{value}</td></tr>'
+                       for (name, labels), value in sorted(counters.items()))
+        latency = ''.join(f'<tr><td>{html.escape(name)}</td><td>{html.escape(_labels(dict(labels)))}</td>'
+                          f'<td>{count}</td><td>{total / count * 1000:.0f} ms</td></tr>'
+                          for (name, labels), (total, count) in sorted(histograms.items()) if count)
+        devices = ''.join(f'<tr><td>{html.escape(device)}</td><td>{"정상" if ok else "문제"}</td><td>{ago:.0f}초 전</td>'
+                          f'<td>{errors}</td><td>{html.escape(error)}</td></tr>'
+                          for device, (ok, ago, errors, error) in sorted(self.devices().items()))
+        return STATUS_PAGE.format(rate=self.stores_per_minute(), counters=rows, latency=latency, devices=devices)
+
+    def serve(self, port=9100, host=''):
+        """백그라운드 스레드로 HTTP 서버 시작 + 기록 시작"""
+        metrics = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body, content_type = metrics.render(), 'text/plain; version=0.0.4; charset=utf-8'
+                elif self.path == '/':
+                    body, content_type = metrics.render_html(), 'text/html; charset=utf-8'
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass  # 로그 숨기기
+
+        self.enabled = True
+        self._started = time.time()
+        self.server = http.server.ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self.server
+
+    def shutdown(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+# 프로세스 공용 저장소
+metrics = Metrics()
+
+
+class _MetricsRpc:
+    def __init__(self, rpc, device):
+        self._rpc = rpc
+        self._device = device
+
+    def takeScreenshot(self, *args):
+        return self._device._timed('screenshot_seconds', self._rpc.takeScreenshot, *args)
+
+    def __getattr__(self, name):
+        return getattr(self._rpc, name)
+
+
+class MetricsDevice:
+    """u2 디바이스 래퍼 - 덤프/스크린샷 지연과 디바이스 상태 기록
+
+    Args:
+        d: uiautomator2 디바이스
+        name: 디바이스 라벨 (시리얼)
+        metrics: 저장소 (기본: 공용 저장소)
+    """
+
+    def __init__(self, d, name, metrics=metrics):
+        self._d = d
+        self.name = name
+        self._metrics = metrics
+        self.jsonrpc = _MetricsRpc(d.jsonrpc, self)
+
+    def _timed(self, histogram, fn, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self._metrics.inc('rpc_errors', device=self.name)
+            self._metrics.device_seen(self.name, error=e)
+            raise
+        if histogram:
+            self._metrics.observe(histogram, time.perf_counter() - start, device=self.name)
+        self._metrics.device_seen(self.name)
+        return result
+
+    def dump_hierarchy(self, *args, **kwargs):
+        return self._timed('dump_seconds', self._d.dump_hierarchy, *args, **kwargs)
+
+    def screenshot(self, *args, **kwargs):
+        return self._timed('screenshot_seconds', self._d.screenshot, *args, **kwargs)
+
+    def click(self, *args, **kwargs):
+        return self._timed(None, self._d.click, *args, **kwargs)
+
+    def swipe(self, *args, **kwargs):
+        return self._timed(None, self._d.swipe, *args, **kwargs)
+
+    def press(self, *args, **kwargs):
+        return self._timed(None, self._d.press, *args, **kwargs)
+
+    def __call__(self, **selector):
+        return self._d(**selector)
+
+    def __getattr__(self, name):
+        return getattr(self._d, name)
+
+
+STATUS_PAGE = '''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta http-equiv="refresh" content="5">
+    <title>크롤러 상태</title>
+    <style>
+        body {{ margin: 0; padding: 20px; font-family: 'Malgun Gothic', sans-serif; background: #1e1e1e; color: #fff; }}
+        h1 {{ color: #4fc3f7; margin-bottom: 10px; }}
+        h3 {{ color: #4fc3f7; }}
+        table {{ border-collapse: collapse; margin-bottom: 20px; }}
+        td, th {{ padding: 6px 12px; border-bottom: 1px solid #333; text-align: left; }}
+        th {{ color: #aaa; font-weight: normal; }}
+        .rate {{ font-size: 28px; color: #ffeb3b; }}
+    </style>
+</head>
+<body>
+    <h1>크롤러 상태</h1>
+    <p>분당 가게 수 <span class="rate">{rate:.2f}</span> (<a href="/metrics" style="color:#4fc3f7">/metrics</a>)</p>
+    <h3>카운터</h3>
+    <table><tr><th>이름</th><th>라벨</th><th>값</th></tr>{counters}</table>
+    <h3>지연</h3>
+    <table><tr><th>이름</th><th>라벨</th><th>횟수</th><th>평균</th></tr>{latency}</table>
+    <h3>디바이스</h3>
+    <table><tr><th>디바이스</th><th>상태</th><th>마지막 응답</th><th>오류 수</th><th>마지막 오류</th></tr>{devices}</table>
+</body>
+</html>
+'''
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+여러 디바이스 병렬 크롤링 - USB 허브에 연결된 폰마다 워커 1개씩 실행
+작업(정렬 방식, 엑셀 행 묶음 등)을 디바이스에 나눠주고 결과를 하나로 합침
+"""
+import argparse
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+
+def list_devices():
+    """adb에 연결된(device 상태) 디바이스 시리얼 목록"""
+    from adbutils import adb
+    return [d.serial for d in adb.device_list()]
+
+
+def run_on_devices(serials, jobs, work):
+    """jobs를 디바이스마다 스레드 1개로 실행 - 각 job은 그때 비어있는 디바이스를 맡음
+
+    Args:
+        serials: 디바이스 시리얼 목록
+        jobs: 작업 목록 (디바이스 수보다 많아도 됨)
+        work: work(serial, job) → 결과
+
+    Returns:
+        [(job, 결과 또는 None), ...] - jobs 순서대로
+    """
+    if not serials:
+        raise ValueError('연결된 디바이스가 없습니다')
+
+    free = queue.Queue()
+    for serial in serials:
+        free.put(serial)
+
+    def run(job):
+        serial = free.get()
+        try:
+            return work(serial, job)
+        finally:
+            free.put(serial)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=len(serials)) as pool:
+        futures = [pool.submit(run, job) for job in jobs]
+        for job, future in zip(jobs, futures):
+            try:
+                results.append((job, future.result()))
+            except Exception as e:
+                print(f'[ERROR] 작업 실패 {job}: {e}')
+                results.append((job, None))
+    return results
+
+
+def merge_store_records(record_lists):
+    """여러 워커의 가게 목록 합치기 - 가게명 중복은 먼저 나온 것만, 순번 다시 매김"""
+    merged = []
+    seen = set()
+    for records in record_lists:
+        for record in records or []:
+            name = record.get('가게명')
+            if name in seen:
+                continue
+            seen.add(name)
+            merged.append(dict(record, 순번=len(merged) + 1))
+    return merged
+
+
+def crawl_v1_parallel(serials, sort_types, max_stores=10, filename=None, resume=False,
+                      visited_path=None, visited_ttl=None):
+    """V1 크롤러를 정렬 방식별로 디바이스에 나눠 실행하고 엑셀 1개로 저장 (정렬 방식마다 중간 저장 파일 1개)
+
+    visited_path가 있으면 모든 디바이스가 같은 방문 기록을 써서 다른 디바이스가 크롤링한 가게는 건너뜀
+    """
+    from baemin_crawler_final import BaeminCrawler
+    from visited import VisitedRegistry
+
+    def work(serial, sort_type):
+        crawler = BaeminCrawler(serial=serial)
+        with VisitedRegistry(visited_path, ttl=visited_ttl, device=serial) as visited:
+            records = crawler.run(max_stores=max_stores, sort_type=sort_type, save=False, resume=resume,
+                                  visited=visited)
+        return [dict(r, 정렬=sort_type, 디바이스=serial) for r in records]
+
+    results = run_on_devices(serials, sort_types, work)
+    stores = merge_store_records(records for _, records in results)
+    if not stores:
+        print('[WARN] 저장할 데이터 없음')
+        return None
+
+    if filename is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f'baemin_stores_{timestamp}.xlsx'
+    pd.DataFrame(stores).to_excel(filename, index=False)
+    print(f'[OK] 엑셀 저장 완료: {filename}')
+    print(f'     총 {len(stores)}개 가게 (디바이스 {len(serials)}대)')
+    return filename
+
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='여러 디바이스로 배민 가게목록 병렬 크롤링')
+    parser.add_argument('--serials', nargs='*', help='디바이스 시리얼 (생략하면 연결된 전체)')
+    parser.add_argument('--sorts', nargs='*', default=['기본순', '주문 많은 순', '별점 높은 순', '가까운 순', '찜 많은 순'],
+                        help='디바이스에 나눠줄 정렬 방식')
+    parser.add_argument('--max-stores', type=int, default=10, help='정렬 방식별 크롤링할 가게 수')
+    parser.add_argument('--resume', action='store_true', help='중간 저장 파일에 있는 가게는 건너뛰고 이어서 크롤링')
+    parser.add_argument('--visited', help='디바이스/실행 간 공유 방문 기록 파일 (.sqlite 또는 .bloom)')
+    parser.add_argument('--visited-ttl', type=float, help='방문 기록 유효 시간 (시간) - 지나면 다시 크롤링')
+    args = parser.parse_args()
+
+    serials = args.serials or list_devices()
+    print(f'[INFO] 디바이스 {len(serials)}대: {", ".join(serials)}')
+    crawl_v1_parallel(serials, args.sorts, max_stores=args.max_stores, resume=args.resume,
+                      visited_path=args.visited, visited_ttl=args.visited_ttl * 3600 if args.visited_ttl else None)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+화면 상태 판별 - 덤프 1개(ScreenSnapshot)로 현재 어떤 화면인지 분류
+뒤로가기 전이표로 목표 화면까지 필요한 만큼만 뒤로가기
+"""
+from enum import Enum
+
+
+class PageState(Enum):
+    HOME = '메인'
+    STORE_LIST = '가게목록'
+    STORE_DETAIL = '가게상세'
+    STORE_INFO = '가게정보'
+    SEARCH_INPUT = '검색입력'
+    SEARCH_RESULTS = '검색결과'
+    UNKNOWN = '알수없음'
+
+
+def _is_store_info(snap):
+    # 가게정보·원산지 페이지: 상호명/주소/전화번호 라벨 또는 통계 라벨
+    return ('상호명' in snap.by_text and ('주소' in snap.by_text or '전화번호' in snap.by_text)) or \
+        '최근 주문수' in snap.by_text or '전체 리뷰수' in snap.by_text
+
+
+def _is_store_detail(snap):
+    # 가게 상세: 배달유형별 배달팁 펼쳐보기/접기 버튼, 상단 가게 이미지
+    return any('배달유형별 배달팁' in d or d == '가게 상세 이미지' for d in snap.descs)
+
+
+def _has_edit_text(snap):
+    return any(n.cls == 'android.widget.EditText' for n in snap.nodes)
+
+
+def _is_search_results(snap):
+    # 검색창 + 가게 결과 (배달팁/준비중)
+    return _has_edit_text(snap) and any('배달팁' in d or '준비중' in d for d in snap.descs)
+
+
+def _is_search_input(snap):
+    return _has_edit_text(snap)
+
+
+def _is_store_list(snap):
+    # 기본순 정렬 버튼이 보이거나, 뒤로가기 + 가게별 거리 표시
+    if any(t == '기본순' or t.startswith('기본순 외') for t in snap.texts):
+        return True
+    return '뒤로가기' in snap.descs and any(d.startswith('거리 ') for d in snap.descs)
+
+
+def _is_home(snap):
+    # 음식배달에서 더보기, 또는 하단 홈탭이 있고 뒤로가기가 없는 화면
+    if '음식배달에서 더보기' in snap.descs:
+        return True
+    return '하단탭바 홈탭' in snap.descs and '뒤로가기' not in snap.descs
+
+
+# 위에서부터 먼저 맞는 상태로 분류 (구체적인 화면 먼저)
+CLASSIFIERS = [
+    (PageState.STORE_INFO, _is_store_info),
+    (PageState.STORE_DETAIL, _is_store_detail),
+    (PageState.SEARCH_RESULTS, _is_search_results),
+    (PageState.SEARCH_INPUT, _is_search_input),
+    (PageState.STORE_LIST, _is_store_list),
+    (PageState.HOME, _is_home),
+]
+
+# 뒤로가기 1번 후 나올 수 있는 화면
+BACK = {
+    PageState.STORE_INFO: {PageState.STORE_DETAIL},
+    PageState.STORE_DETAIL: {PageState.STORE_LIST, PageState.SEARCH_RESULTS},
+    PageState.SEARCH_RESULTS: {PageState.SEARCH_INPUT, PageState.HOME},
+    PageState.SEARCH_INPUT: {PageState.SEARCH_INPUT, PageState.HOME},  # 결과 0개 화면도 검색입력으로 분류됨
+    PageState.STORE_LIST: {PageState.HOME},
+    PageState.HOME: set(),
+}
+
+
+def classify(snap):
+    """스냅샷 → PageState"""
+    for state, is_state in CLASSIFIERS:
+        if is_state(snap):
+            return state
+    return PageState.UNKNOWN
+
+
+def reachable_by_back(state, target):
+    """state에서 뒤로가기만으로 target에 갈 수 있는지"""
+    seen = set()
+    frontier = [state]
+    while frontier:
+        current = frontier.pop()
+        if current == target:
+            return True
+        if current in seen:
+            continue
+        seen.add(current)
+        frontier.extend(BACK.get(current, ()))
+    return False
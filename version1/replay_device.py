@@ -0,0 +1,570 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 재생 디바이스 - 폰 없이 크롤러 실행 (벤치마크/회귀 테스트용)
+크롤러가 쓰는 uiautomator2 API 일부(dump_hierarchy, screenshot, click, swipe, press,
+선택자 exists/click/info/set_text)를 화면 그래프로 흉내냄
+화면 그래프는 ui_dumps/*.xml, screenshots/*.png 녹화본 + 녹화에 없는 화면(가게목록/가게정보/검색)은 생성
+
+사용법:
+    python replay_device.py v1 --stores 5
+    python replay_device.py v2
+"""
+import argparse
+import base64
+import os
+import sys
+import tempfile
+from collections import Counter
+from xml.sax.saxutils import quoteattr
+
+import cv2
+import numpy as np
+
+from screen_snapshot import ScreenSnapshot
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCREEN_SIZE = (1080, 2400)
+
+
+class UiObjectNotFoundError(Exception):
+    """선택자에 맞는 요소 없음 (uiautomator2.UiObjectNotFoundError 대응)"""
+
+
+class Screen:
+    """화면 1개
+
+    Args:
+        name: 화면 이름
+        xml: 계층 덤프 문자열, 또는 device → 문자열 (상태에 따라 달라지는 화면)
+        image: 스크린샷 경로 (없으면 흰 화면)
+        rules: [(이벤트, 조건, 다음 화면, push), ...]
+            이벤트: 'click' / 'back' / 'enter' / 'scroll'
+            조건: click이면 desc/text에 포함될 문자열 또는 (x1, y1, x2, y2) 영역, 나머지는 None
+            다음 화면: 화면 이름, 또는 (device, 인자) → 화면 이름/None(그대로)
+                인자는 click이면 클릭된 UINode, scroll이면 세로 이동량(px)
+            push: True면 뒤로가기 기록에 쌓음, False면 현재 화면만 교체
+    """
+
+    def __init__(self, name, xml, image=None, rules=()):
+        self.name = name
+        self.xml = xml
+        self.image = image
+        self.rules = list(rules)
+
+    def render(self, device):
+        return self.xml(device) if callable(self.xml) else self.xml
+
+
+class _ReplayRpc:
+    """d.jsonrpc 대응 - takeScreenshot만 지원"""
+
+    def __init__(self, device):
+        self._device = device
+
+    def takeScreenshot(self, scale, quality):
+        screen = self._device.screenshot(format='opencv')
+        if scale != 1:
+            screen = cv2.resize(screen, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        _, buf = cv2.imencode('.jpg', screen, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        return base64.b64encode(buf.tobytes()).decode()
+
+
+class ReplaySelector:
+    """d(**selector) 대응 - 현재 화면 덤프에서 찾음 (기다리지 않음)"""
+
+    def __init__(self, device, selector):
+        self._device = device
+        self.selector = selector
+
+    def _matches(self, n):
+        for key, value in self.selector.items():
+            if key == 'text' and n.text != value:
+                return False
+            if key == 'textContains' and value not in n.text:
+                return False
+            if key == 'textStartsWith' and not n.text.startswith(value):
+                return False
+            if key == 'description' and n.desc != value:
+                return False
+            if key == 'descriptionContains' and value not in n.desc:
+                return False
+            if key == 'descriptionStartsWith' and not n.desc.startswith(value):
+                return False
+            if key == 'className' and n.cls != value:
+                return False
+            if key == 'resourceId' and n.resource_id != value:
+                return False
+            if key == 'clickable' and n.clickable != value:
+                return False
+        return True
+
+    def _find(self):
+        self._device.calls['selector'] += 1
+        for n in self._device.snapshot().nodes:
+            if n.has_bounds and self._matches(n):
+                return n
+        return None
+
+    def exists(self, timeout=None):
+        return self._find() is not None
+
+    def click(self, timeout=None, offset=None):
+        n = self._find()
+        if n is None:
+            raise UiObjectNotFoundError(self.selector)
+        self._device.click((n.x1 + n.x2) // 2, (n.y1 + n.y2) // 2)
+
+    def click_exists(self, timeout=None):
+        if not self.exists():
+            return False
+        self.click()
+        return True
+
+    @property
+    def info(self):
+        n = self._find()
+        if n is None:
+            raise UiObjectNotFoundError(self.selector)
+        return {
+            'bounds': {'left': n.x1, 'top': n.y1, 'right': n.x2, 'bottom': n.y2},
+            'text': n.text,
+            'contentDescription': n.desc,
+            'className': n.cls,
+            'resourceName': n.resource_id,
+            'clickable': n.clickable,
+        }
+
+    def get_text(self):
+        n = self._find()
+        if n is None:
+            raise UiObjectNotFoundError(self.selector)
+        return n.text
+
+    def set_text(self, text):
+        if self._find() is None:
+            raise UiObjectNotFoundError(self.selector)
+        self._device.state['typed'] = text
+        self._device.actions.append(('set_text', text))
+
+    def clear_text(self):
+        self.set_text('')
+
+
+class ReplayDevice:
+    """화면 그래프를 따라 움직이는 가짜 디바이스
+
+    Args:
+        screens: Screen 목록
+        start: 시작 화면 이름
+        version: app_info()가 돌려줄 앱 버전
+    """
+
+    def __init__(self, screens, start, version='replay'):
+        self.screens = {s.name: s for s in screens}
+        self.current = start
+        self.history = []         # 뒤로가기로 돌아갈 화면 이름들
+        self.state = {}           # 화면 그래프 스크립트가 쓰는 상태 (입력한 검색어, 스크롤 위치 등)
+        self.actions = []         # 지금까지 받은 동작 기록
+        self.calls = Counter()    # RPC 종류별 호출 수
+        self.version = version
+        self.jsonrpc = _ReplayRpc(self)
+        self._images = {}
+        self._snap_key = None
+        self._snap = None
+
+    # --- 화면 ---
+
+    @property
+    def screen(self):
+        return self.screens[self.current]
+
+    def render(self):
+        return self.screen.render(self)
+
+    def snapshot(self):
+        """현재 화면 스냅샷 (같은 덤프면 재사용)"""
+        xml = self.render()
+        if xml != self._snap_key:
+            self._snap_key = xml
+            self._snap = ScreenSnapshot(xml)
+        return self._snap
+
+    def go(self, name, push=True):
+        """name 화면으로 이동 (push면 뒤로가기 기록에 현재 화면을 쌓음)"""
+        if push:
+            self.history.append(self.current)
+        self.current = name
+
+    def back(self):
+        """뒤로가기 기록에서 이전 화면으로 (기록이 없으면 그대로)"""
+        if self.history:
+            self.current = self.history.pop()
+
+    def _apply(self, event, arg=None, node=None):
+        # 현재 화면 규칙 중 맞는 것 실행 → 실행했으면 True
+        for rule_event, cond, target, push in self.screen.rules:
+            if rule_event != event:
+                continue
+            if event == 'click':
+                if isinstance(cond, tuple):
+                    x, y = arg
+                    if not (cond[0] <= x <= cond[2] and cond[1] <= y <= cond[3]):
+                        continue
+                elif node is None or (cond not in node.desc and cond not in node.text):
+                    continue
+            nxt = target(self, node if event == 'click' else arg) if callable(target) else target
+            if nxt is not None:
+                self.go(nxt, push)
+            return True
+        return False
+
+    # --- uiautomator2 API ---
+
+    def dump_hierarchy(self, compressed=False, pretty=False, max_depth=None):
+        self.calls['dump_hierarchy'] += 1
+        return self.render()
+
+    def screenshot(self, filename=None, format='pillow', display_id=None):
+        self.calls['screenshot'] += 1
+        path = self.screen.image
+        if path not in self._images:
+            image = cv2.imread(os.path.join(HERE, path)) if path else None
+            if image is None:
+                image = np.full((SCREEN_SIZE[1], SCREEN_SIZE[0], 3), 255, dtype=np.uint8)
+            self._images[path] = image
+        image = self._images[path].copy()
+        if filename:
+            cv2.imwrite(filename, image)
+            return None
+        if format == 'opencv':
+            return image
+        from PIL import Image
+        return Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+
+    def click(self, x, y):
+        self.calls['click'] += 1
+        self.actions.append(('click', x, y))
+        # 좌표를 포함하는 노드 중 작은 것부터 규칙 확인
+        hits = [n for n in self.snapshot().nodes
+                if n.has_bounds and n.x1 <= x <= n.x2 and n.y1 <= y <= n.y2]
+        hits.sort(key=lambda n: (n.x2 - n.x1) * (n.y2 - n.y1))
+        for n in hits:
+            if self._apply('click', (x, y), n):
+                return
+        self._apply('click', (x, y))
+
+    def swipe(self, fx, fy, tx, ty, duration=None, steps=None):
+        self.calls['swipe'] += 1
+        self.actions.append(('swipe', fx, fy, tx, ty))
+        # 손가락이 위로 움직이면(fy > ty) 아래 내용이 보임 → 양수
+        self._apply('scroll', fy - ty)
+
+    def press(self, key):
+        self.calls['press'] += 1
+        self.actions.append(('press', key))
+        if key == 'back':
+            if not self._apply('back'):
+                self.back()
+        elif key == 'home':
+            self.history.clear()
+            self.current = self.state.get('home', self.current)
+        elif key == 'enter':
+            self._apply('enter')
+
+    def window_size(self):
+        return SCREEN_SIZE
+
+    def app_info(self, package):
+        return {'packageName': package, 'versionName': self.version}
+
+    def __call__(self, **selector):
+        return ReplaySelector(self, selector)
+
+
+# --- 배민 화면 그래프 ---
+
+BRANDS = ['서울불백', '프랭크버거', '미친 짜글이', '나만 아는 아구집', '봉구스 밥버거', '교촌치킨',
+          '굽네치킨', '엽기떡볶이', '청년다방', '본죽', '김밥천국', '역전우동', '지코바 양념치킨',
+          '도미노피자', '파파존스', '한솥도시락', '명랑핫도그', '백채김치찌개', '신전떡볶이', '두찜']
+SIMILAR_BRANDS = ['고봉민김밥', '국수나무', '죠스떡볶이', '호식이두마리치킨', '피자스쿨', '맘스터치',
+                  '이삭토스트', '샐러디', '써브웨이', '롯데리아', '바르다김선생', '진대감']
+BRANCHES = ['반포점', '서초점', '강남본점', '신논현점', '잠원점']
+SORTS = ['기본순', '주문 많은 순', '별점 높은 순', '가까운 순', '찜 많은 순']
+DELIVERY = ['가게배달', '알뜰배달', '한집배달']
+
+# 가게상세 녹화 화면에서 가게정보·원산지 버튼 위치 (templates/store_info_btn.png 매칭 위치)
+STORE_INFO_REGION = (860, 682, 1000, 752)
+
+LIST_TOP, LIST_BOTTOM = 290, 2200   # 가게목록에서 스크롤되는 영역
+ROW_HEIGHT = 320
+SIMILAR_HEIGHT = 420
+
+
+def make_stores(count=30):
+    """가짜 가게 목록 (가게명, 상호명, 주소, 전화번호, 통계)"""
+    stores = []
+    for i in range(count):
+        name = f'{BRANDS[i % len(BRANDS)]} {BRANCHES[i // len(BRANDS) % len(BRANCHES)]}'
+        stores.append({
+            '가게명': name,
+            '상호명': f'(주){name}',
+            '주소': f'서울특별시 서초구 신반포로 {100 + i} 1층',
+            '전화번호': f'050-{1000 + i}-{8000 + i}',
+            '최근주문수': f'{(i * 37) % 900 + 100:,}',
+            '전체리뷰수': f'{(i * 53) % 5000 + 20:,}',
+            '배달타입': DELIVERY[i % len(DELIVERY)],
+        })
+    return stores
+
+
+def _node(text='', desc='', bounds=(0, 0, 0, 0), cls='android.view.View', clickable=False,
+          resource_id='', package='com.sampleapp'):
+    x1, y1, x2, y2 = bounds
+    return (f'<node text={quoteattr(text)} resource-id={quoteattr(resource_id)} class="{cls}" '
+            f'package="{package}" content-desc={quoteattr(desc)} clickable="{str(clickable).lower()}" '
+            f'bounds="[{x1},{y1}][{x2},{y2}]" />')
+
+
+def _hierarchy(nodes):
+    return ('<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\' ?>\n<hierarchy rotation="0">'
+            + _node(bounds=(0, 0) + SCREEN_SIZE, cls='android.widget.FrameLayout').replace(' />', '>')
+            + ''.join(nodes) + '</node></hierarchy>')
+
+
+def _status_bar():
+    return [_node(desc='오전 1:05', bounds=(40, 20, 200, 80), package='com.android.systemui'),
+            _node(desc='배터리 100퍼센트', bounds=(960, 20, 1040, 80), package='com.android.systemui')]
+
+
+def _read_dump(name):
+    with open(os.path.join(HERE, 'ui_dumps', name), encoding='utf-8') as f:
+        return f.read()
+
+
+def baemin_screens(stores=None):
+    """배민 화면 그래프 → (Screen 목록, 시작 화면 이름)
+
+    메인/가게상세는 녹화한 덤프와 스크린샷, 가게목록/가게정보/검색 화면은 stores로 생성
+    """
+    stores = stores or make_stores()
+    by_name = {s['가게명']: s for s in stores}
+    similar = {}  # 가게명 → "방금 본 가게와 비슷해요!" 아래 4개
+    for i, s in enumerate(stores):
+        similar[s['가게명']] = [f'{SIMILAR_BRANDS[(i + k) % len(SIMILAR_BRANDS)]} {BRANCHES[(i + k) % len(BRANCHES)]}'
+                               for k in range(4)]
+    for names in similar.values():
+        for name in names:
+            by_name.setdefault(name, {'가게명': name, '상호명': name, '주소': '', '전화번호': '',
+                                      '최근주문수': '', '전체리뷰수': '', '배달타입': '가게배달'})
+
+    def sorted_stores(device):
+        sort = device.state.get('sort', '기본순')
+        if sort == '기본순':
+            return stores
+        key = {'주문 많은 순': '최근주문수', '별점 높은 순': '전체리뷰수'}.get(sort)
+        if key:
+            return sorted(stores, key=lambda s: -int(s[key].replace(',', '')))
+        return stores[::-1]
+
+    def list_items(device):
+        # 가게목록 전체(스크롤 전 좌표) → [(y1, y2, 노드 생성 함수(dy))], 전체 높이
+        sort_label = '기본순' if device.state.get('sort', '기본순') == '기본순' else '기본순 외 1'
+        items = [(300, 360, lambda dy: [_node(text=t, bounds=(40 + 180 * k, 300 - dy, 200 + 180 * k, 360 - dy))
+                                        for k, t in enumerate(['홈', '치킨', '중식', '피자'])]),
+                 (380, 440, lambda dy: [_node(desc='정렬 버튼', bounds=(40, 380 - dy, 260, 440 - dy), clickable=True)]),
+                 (540, 600, lambda dy: [_node(text=sort_label, bounds=(40, 540 - dy, 220, 600 - dy))])]
+        y = 660
+        last = device.state.get('last_visited')
+        for i, s in enumerate(sorted_stores(device)):
+            def row(dy, s=s, y=y, i=i):
+                return [_node(desc=s['가게명'], bounds=(0, y - dy, 1080, y + 300 - dy), clickable=True),
+                        _node(desc=f'별점 4.{9 - i % 5}', bounds=(40, y + 200 - dy, 200, y + 250 - dy)),
+                        _node(desc=f'{(i * 97) % 4000 + 10}개', bounds=(210, y + 200 - dy, 330, y + 250 - dy)),
+                        _node(desc=s['배달타입'], bounds=(40, y + 250 - dy, 200, y + 290 - dy)),
+                        _node(desc=f'거리 {(i * 131) % 2000 + 300}m', bounds=(210, y + 250 - dy, 400, y + 290 - dy))]
+            items.append((y, y + 300, row))
+            y += ROW_HEIGHT
+            if s['가게명'] == last:
+                def block(dy, y=y, names=similar[last]):
+                    nodes = [_node(desc='방금 본 가게와 비슷해요!', bounds=(40, y + 20 - dy, 700, y + 80 - dy))]
+                    for k, name in enumerate(names):
+                        top = y + 120 + (k // 2) * 140 - dy
+                        nodes.append(_node(desc=name, bounds=(40 + 500 * (k % 2), top, 500 + 500 * (k % 2), top + 120),
+                                           clickable=True))
+                    return nodes
+                items.append((y, y + SIMILAR_HEIGHT, block))
+                y += SIMILAR_HEIGHT
+        return items, y
+
+    def render_list(device):
+        items, height = list_items(device)
+        dy = device.state.get('offset', 0)
+        nodes = [_node(desc='뒤로가기', bounds=(0, 160, 130, 280), clickable=True),
+                 _node(text='음식배달', bounds=(400, 180, 680, 260))]
+        for y1, y2, make in items:
+            # 스크롤 영역 안에 완전히 보이는 항목만
+            if y1 - dy >= LIST_TOP and y2 - dy <= LIST_BOTTOM:
+                nodes.extend(make(dy))
+        nodes.append(_node(desc='하단탭바 홈탭', bounds=(0, 2200, 216, 2400), clickable=True))
+        return _hierarchy(_status_bar() + nodes)
+
+    def scroll_list(device, amount):
+        _, height = list_items(device)
+        limit = max(height - (LIST_BOTTOM - LIST_TOP) - LIST_TOP, 0)
+        device.state['offset'] = min(max(device.state.get('offset', 0) + amount, 0), limit)
+        return None
+
+    def open_store(device, node):
+        name = node.desc.split(', 배달팁')[0]
+        if name not in by_name:
+            return None
+        device.state['store'] = name
+        if device.current == 'list':
+            device.state['last_visited'] = name
+        return 'detail'
+
+    def open_list(device, node):
+        device.state.update(offset=0, sort='기본순', last_visited=None)
+        return 'list'
+
+    def choose_sort(device, node):
+        if node.desc in SORTS:
+            device.state.update(sort=node.desc, offset=0, last_visited=None)
+            device.back()
+        return None
+
+    def render_sort(device):
+        nodes = [_node(desc=s, bounds=(0, 1500 + 140 * k, 1080, 1620 + 140 * k), clickable=True)
+                 for k, s in enumerate(SORTS)]
+        return _hierarchy(_status_bar() + nodes)
+
+    def render_info(device):
+        s = by_name[device.state['store']]
+        nodes = [_node(desc='뒤로가기', bounds=(0, 160, 130, 280), clickable=True),
+                 _node(text='가게정보', bounds=(400, 180, 680, 260))]
+        for k, label in enumerate(['상호명', '주소', '전화번호']):
+            y = 400 + 100 * k
+            nodes.append(_node(text=label, bounds=(40, y, 250, y + 60)))
+            nodes.append(_node(text=s[label], bounds=(300, y, 1040, y + 60)))
+        for k, (label, key) in enumerate([('최근 주문수', '최근주문수'), ('전체 리뷰수', '전체리뷰수')]):
+            y = 1500 + 100 * k
+            nodes.append(_node(text=label, bounds=(40, y, 300, y + 60)))
+            nodes.append(_node(text=s[key], bounds=(700, y, 1000, y + 60)))
+        return _hierarchy(_status_bar() + nodes)
+
+    def render_search(device, results=False):
+        typed = device.state.get('typed', '')
+        nodes = [_node(desc='뒤로가기', bounds=(0, 160, 130, 280), clickable=True),
+                 _node(text=typed, bounds=(150, 160, 1000, 280), cls='android.widget.EditText', clickable=True)]
+        if results and typed:
+            hits = [s for s in stores if typed in s['가게명'] or s['가게명'] in typed]
+            for k, s in enumerate(hits[:6]):
+                y = 400 + 320 * k
+                nodes.append(_node(desc=f'{s["가게명"]}, 배달팁 0원~3,000원', bounds=(0, y, 1080, y + 300),
+                                   clickable=True))
+        return _hierarchy(_status_bar() + nodes)
+
+    screens = [
+        Screen('home', _read_dump('step1_ui.xml'), 'screenshots/step0_start.png', [
+            ('click', '음식배달에서 더보기', open_list, True),
+            ('click', '검색 버튼', 'search', True),
+        ]),
+        Screen('list', render_list, None, [
+            ('click', '정렬 버튼', 'sort', True),
+            ('click', '뒤로가기', lambda d, n: d.back(), False),
+            ('click', '', open_store, True),
+            ('scroll', None, scroll_list, False),
+        ]),
+        Screen('sort', render_sort, None, [
+            ('click', '', choose_sort, False),
+        ]),
+        Screen('detail', _read_dump('step2_ui.xml'), 'screenshots/step2_store_detail.png', [
+            ('click', STORE_INFO_REGION, 'info', True),
+            ('click', '펼쳐보기', 'detail_open', False),
+            ('click', '뒤로가기', lambda d, n: d.back(), False),
+        ]),
+        Screen('detail_open', _read_dump('current_ui.xml'), 'screenshots/step2_expanded.png', [
+            ('click', STORE_INFO_REGION, 'info', True),
+            ('click', '접기', 'detail', False),
+            ('click', '뒤로가기', lambda d, n: d.back(), False),
+        ]),
+        Screen('info', render_info, None, [
+            ('click', '뒤로가기', lambda d, n: d.back(), False),
+        ]),
+        Screen('search', lambda d: render_search(d), None, [
+            ('enter', None, 'results', True),
+            ('click', '뒤로가기', lambda d, n: d.back(), False),
+        ]),
+        Screen('results', lambda d: render_search(d, results=True), None, [
+            ('click', '배달팁', open_store, True),
+            ('click', '뒤로가기', lambda d, n: d.back(), False),
+        ]),
+    ]
+    return screens, 'home'
+
+
+def baemin_device(stores=None):
+    """배민 화면 그래프로 만든 ReplayDevice (메인 화면에서 시작)"""
+    screens, start = baemin_screens(stores)
+    device = ReplayDevice(screens, start)
+    device.state['home'] = start
+    return device
+
+
+def run_v1(max_stores=5, sort_type='기본순', device=None, workdir=None):
+    """V1 크롤러를 재생 디바이스로 실행 → (가게 목록, 디바이스)"""
+    from baemin_crawler_final import BaeminCrawler
+    from element_resolver import ElementResolver
+
+    device = device or baemin_device()
+    workdir = workdir or tempfile.mkdtemp(prefix='replay_')
+    crawler = BaeminCrawler(device=device)
+    crawler.resolver = ElementResolver(os.path.join(workdir, 'element_strategy.json'))
+    stores = crawler.run(max_stores=max_stores, sort_type=sort_type, save=False,
+                         checkpoint_path=os.path.join(workdir, 'checkpoint.jsonl'))
+    return stores, device
+
+
+def run_v2(store_names=None, device=None, workdir=None):
+    """V2 크롤러를 재생 디바이스로 실행 (임시 엑셀 생성) → (결과 엑셀 경로, 디바이스)"""
+    import pandas as pd
+    sys.path.insert(0, os.path.join(HERE, '..', 'version2'))
+    from baemin_crawler_v2_gui import BaeminCrawlerV2
+    from element_resolver import ElementResolver
+
+    device = device or baemin_device()
+    workdir = workdir or tempfile.mkdtemp(prefix='replay_')
+    if store_names is None:
+        store_names = [s['가게명'] for s in make_stores()[:5]] + ['없는 가게']
+    excel_path = os.path.join(workdir, 'replay.xlsx')
+    rows = [['', '', '', '', '', name] for name in store_names]
+    pd.DataFrame(rows, columns=['A', 'B', 'C', 'D', 'E', '상호명']).to_excel(excel_path, index=False)
+
+    crawler = BaeminCrawlerV2(settle_timeout=0.5, device=device)
+    crawler.resolver = ElementResolver(os.path.join(workdir, 'element_strategy.json'))
+    return crawler.run(excel_path), device
+
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='폰 없이 재생 디바이스로 크롤러 실행')
+    parser.add_argument('crawler', choices=['v1', 'v2'])
+    parser.add_argument('--stores', type=int, default=5, help='V1: 크롤링할 가게 수')
+    parser.add_argument('--sort', default='기본순', help='V1: 정렬 방식')
+    parser.add_argument('--trace', help='단계/RPC 구간 기록 파일 (Chrome trace JSON)')
+    args = parser.parse_args()
+    if args.trace:
+        from tracing import tracer
+        args.trace = os.path.abspath(args.trace)
+        tracer.start()
+
+    # 템플릿 경로(templates/...)가 상대 경로라서 이 폴더에서 실행
+    os.chdir(HERE)
+    if args.crawler == 'v1':
+        _, device = run_v1(args.stores, args.sort)
+    else:
+        _, device = run_v2()
+    print(f'[REPLAY] 호출 수: {dict(device.calls)}')
+    if args.trace:
+        print(f'[REPLAY] 구간 기록: {args.trace} ({tracer.save(args.trace)}개)')
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+화면 스냅샷 - dump_hierarchy() 1회로 모든 추출기가 공유하는 화면 정보
+클릭/스와이프/뒤로가기 후에는 자동으로 무효화됨
+"""
+import re
+import xml.etree.ElementTree as ET
+
+from geometry import NodeGeometry, parse_bounds
+
+
+class UINode:
+    """계층 덤프의 노드 1개 (평면 테이블 한 행)"""
+    __slots__ = ('index', 'text', 'desc', 'resource_id', 'cls', 'package', 'clickable',
+                 'has_bounds', 'x1', 'y1', 'x2', 'y2', 'cy')
+
+    def __repr__(self):
+        return f'UINode({self.index}, text={self.text!r}, desc={self.desc!r}, bounds=[{self.x1},{self.y1}][{self.x2},{self.y2}])'
+
+
+def walk_nodes(root):
+    """트리를 한 번만 순회(iter(), 재귀 없음)해서 UINode 평면 리스트 반환 (문서 순서)"""
+    nodes = []
+    for elem in root.iter('node'):
+        attrib = elem.attrib
+        n = UINode()
+        n.index = len(nodes)
+        n.text = attrib.get('text', '').strip()
+        n.desc = attrib.get('content-desc', '').strip()
+        n.resource_id = attrib.get('resource-id', '')
+        n.cls = attrib.get('class', '')
+        n.package = attrib.get('package', '')
+        n.clickable = attrib.get('clickable', 'false') == 'true'
+        box = parse_bounds(attrib.get('bounds', ''))
+        if box:
+            n.has_bounds = True
+            n.x1, n.y1, n.x2, n.y2 = box
+            n.cy = (n.y1 + n.y2) // 2
+        else:
+            n.has_bounds = False
+            n.x1 = n.y1 = n.x2 = n.y2 = n.cy = None
+        nodes.append(n)
+    return nodes
+
+
+# u2 셀렉터 키 → (노드 → bool) - 같은 셀렉터를 덤프 1개에 대해 평가
+SELECTOR_MATCHERS = {
+    'text': lambda n, v: n.text == v,
+    'textContains': lambda n, v: v in n.text,
+    'textStartsWith': lambda n, v: n.text.startswith(v),
+    'textMatches': lambda n, v: re.fullmatch(v, n.text) is not None,
+    'description': lambda n, v: n.desc == v,
+    'descriptionContains': lambda n, v: v in n.desc,
+    'descriptionStartsWith': lambda n, v: n.desc.startswith(v),
+    'descriptionMatches': lambda n, v: re.fullmatch(v, n.desc) is not None,
+    'resourceId': lambda n, v: n.resource_id == v,
+    'resourceIdMatches': lambda n, v: re.fullmatch(v, n.resource_id) is not None,
+    'className': lambda n, v: n.cls == v,
+    'clickable': lambda n, v: n.clickable == v,
+}
+
+
+def matches(node, selector):
+    """노드가 u2 셀렉터(dict)의 조건을 모두 만족하는지"""
+    return all(SELECTOR_MATCHERS[key](node, value) for key, value in selector.items())
+
+
+class ScreenSnapshot:
+    """dump_hierarchy() 결과 1개를 파싱해서 bounds/text/content-desc를 미리 인덱싱"""
+
+    def __init__(self, xml):
+        self.xml = xml
+        self.root = ET.fromstring(xml)
+        self.nodes = walk_nodes(self.root)   # UINode 평면 테이블 (문서 순서)
+        self.texts = []      # strip된 text (빈 값 제외, 문서 순서)
+        self.descs = []      # strip된 content-desc (빈 값 제외, 문서 순서)
+        self.by_text = {}    # text → [UINode, ...]
+        self._geometry = None
+        self._signature = None
+
+        for n in self.nodes:
+            if n.text:
+                self.texts.append(n.text)
+                self.by_text.setdefault(n.text, []).append(n)
+            if n.desc:
+                self.descs.append(n.desc)
+
+    @property
+    def geometry(self):
+        """bounds 좌표 배열 (처음 쓸 때 생성)"""
+        if self._geometry is None:
+            self._geometry = NodeGeometry(self.nodes)
+        return self._geometry
+
+    def signature(self):
+        """화면 내용 해시 (상태바 시계/배터리 등 systemui 노드 제외)"""
+        if self._signature is None:
+            self._signature = hash(tuple(
+                (n.cls, n.text, n.desc, n.x1, n.y1, n.x2, n.y2)
+                for n in self.nodes if n.package != 'com.android.systemui'
+            ))
+        return self._signature
+
+    def find_text(self, text):
+        """text가 정확히 일치하는 첫 번째 노드"""
+        found = self.by_text.get(text)
+        return found[0] if found else None
+
+    def has_text_contains(self, sub):
+        """text에 sub가 포함된 노드가 있는지"""
+        return any(sub in t for t in self.texts)
+
+    def has_desc_contains(self, sub):
+        """content-desc에 sub가 포함된 노드가 있는지"""
+        return any(sub in d for d in self.descs)
+
+    def find(self, **selector):
+        """u2 셀렉터와 같은 조건(textContains=... 등)을 만족하는 첫 번째 노드 (없으면 None)"""
+        for n in self.nodes:
+            if matches(n, selector):
+                return n
+        return None
+
+
+class _SelectorProxy:
+    """d(...) 셀렉터 래퍼 - 클릭/입력 시 스냅샷 무효화"""
+
+    def __init__(self, device, selector):
+        self._device = device
+        self._selector = selector
+
+    def click(self, *args, **kwargs):
+        self._device.invalidate()
+        return self._selector.click(*args, **kwargs)
+
+    def set_text(self, *args, **kwargs):
+        self._device.invalidate()
+        return self._selector.set_text(*args, **kwargs)
+
+    def clear_text(self, *args, **kwargs):
+        self._device.invalidate()
+        return self._selector.clear_text(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._selector, name)
+
+
+class SnapshotDevice:
+    """uiautomator2 디바이스 래퍼 - 화면을 바꾸는 동작마다 generation 증가"""
+
+    def __init__(self, d):
+        self._d = d
+        self.generation = 0
+
+    def invalidate(self):
+        """캐시된 스냅샷 무효화"""
+        self.generation += 1
+
+    def click(self, *args, **kwargs):
+        self.invalidate()
+        return self._d.click(*args, **kwargs)
+
+    def swipe(self, *args, **kwargs):
+        self.invalidate()
+        return self._d.swipe(*args, **kwargs)
+
+    def press(self, *args, **kwargs):
+        self.invalidate()
+        return self._d.press(*args, **kwargs)
+
+    def __call__(self, **selector):
+        return _SelectorProxy(self, self._d(**selector))
+
+    def __getattr__(self, name):
+        return getattr(self._d, name)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+스크린샷 - 폰에서 축소된 JPEG로 받아서 바로 흑백 numpy 배열로 디코딩
+d.screenshot(format='opencv')는 원본 크기 JPEG → PIL → RGB → BGR 변환을 거침
+"""
+import base64
+
+import cv2
+import numpy as np
+
+
+class ScreenshotService:
+    """스크린샷 요청기
+
+    Args:
+        d: uiautomator2 디바이스
+        scale: 폰에서 줄여서 보낼 배율 (0.5면 가로세로 절반, 전송량 약 1/4)
+        quality: JPEG 품질 (1~100)
+    """
+
+    def __init__(self, d, scale=0.5, quality=80):
+        self.d = d
+        self.scale = scale
+        self.quality = quality
+
+    def jpeg_base64(self, scale=None, quality=None):
+        """폰이 보낸 JPEG base64 문자열 그대로 (지원 안 하면 None)"""
+        try:
+            return self.d.jsonrpc.takeScreenshot(scale or self.scale, quality or self.quality)
+        except Exception:
+            return None
+
+    def gray(self):
+        """흑백 화면 → (배열, 배율) - 배열 좌표 / 배율 = 화면 좌표"""
+        data = self.jpeg_base64()
+        if data:
+            buf = np.frombuffer(base64.b64decode(data), dtype=np.uint8)
+            screen = cv2.imdecode(buf, cv2.IMREAD_GRAYSCALE)
+            if screen is not None:
+                return screen, self.scale
+
+        # takeScreenshot을 못 쓰면 원본 크기로 (이전 방식)
+        screen = self.d.screenshot(format='opencv')
+        return cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY), 1.0
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+적응형 스크롤 - 스와이프 전후 스냅샷에서 같은 요소(앵커)의 y 위치로 실제 이동 거리 측정
+손가락 이동 대비 내용 이동 비율을 배워서 스와이프 길이를 조절하고,
+연속으로 움직이지 않으면 목록 끝으로 판단 (고정 횟수 재시도 대신)
+"""
+import statistics
+from collections import Counter
+
+from device_profile import BASE_HEIGHT
+
+
+def _anchors(snap):
+    # 화면에서 한 번만 나오는 요소 → y1 (상태바 제외, 위치는 키에 넣지 않음)
+    keys = [((n.cls, n.text, n.desc, n.x1, n.x2), n.y1) for n in snap.nodes
+            if n.has_bounds and (n.text or n.desc) and n.package != 'com.android.systemui']
+    counts = Counter(key for key, _ in keys)
+    return {key: y for key, y in keys if counts[key] == 1}
+
+
+def measure_scroll(before, after):
+    """두 스냅샷 사이 내용 이동 거리 (px, 양수: 내용이 위로 = 아래쪽을 봄)
+
+    같은 앵커가 움직였으면 그 이동량의 중앙값 (고정된 헤더/탭바는 제외)
+    움직인 것도 새로 나타난 것도 없으면 0 (더 스크롤할 수 없음)
+    한 화면 넘게 이동해서 겹치는 앵커가 없으면 None
+    """
+    a = _anchors(before)
+    b = _anchors(after)
+    moved = [a[key] - b[key] for key in a.keys() & b.keys() if a[key] != b[key]]
+    if moved:
+        return int(statistics.median(moved))
+    if b.keys() <= a.keys():
+        return 0
+    return None
+
+
+class ScrollEngine:
+    """스와이프 좌표 계획 + 이동 거리 학습 + 목록 끝 감지
+
+    Args:
+        x: 스와이프 x 좌표
+        center: 스와이프 중심 y 좌표
+        step: 한 번에 움직이고 싶은 내용 거리 (px)
+        min_distance, max_distance: 스와이프 길이 범위 (px)
+        duration: 스와이프 시간 (초)
+        end_after: 연속 몇 번 안 움직이면 끝으로 볼지
+        change_timeout: 스와이프 후 화면이 이 시간(초) 안에 안 바뀌면 안 움직인 것으로 보고 대기 끝
+    """
+
+    def __init__(self, x=540, center=1100, step=800, min_distance=200, max_distance=1200,
+                 duration=0.3, end_after=2, change_timeout=0.5):
+        self.x = x
+        self.center = center
+        self.step = step
+        self.min_distance = min_distance
+        self.max_distance = max_distance
+        self.duration = duration
+        self.end_after = end_after
+        self.change_timeout = change_timeout
+        self.ratio = 1.0              # 내용 이동 / 손가락 이동 (측정할 때마다 갱신)
+        self._stuck = Counter()       # 방향 → 연속으로 안 움직인 횟수
+        self.last_moved = None        # 마지막 측정 이동 거리
+        self._last_signature = None   # 마지막 스와이프 후 화면 (다른 화면에서 시작하면 끝 판단 초기화)
+
+    @classmethod
+    def for_profile(cls, profile, **kwargs):
+        """화면 크기에 맞춘 엔진 (기본 좌표/거리는 1080x2400 화면 기준 값을 비율로 환산)"""
+        return cls(x=profile.x(0.5), center=profile.y(1100 / BASE_HEIGHT), step=profile.y(800 / BASE_HEIGHT),
+                   min_distance=profile.y(200 / BASE_HEIGHT), max_distance=profile.y(1200 / BASE_HEIGHT), **kwargs)
+
+    def gesture(self, direction='down'):
+        """스와이프 좌표 (fx, fy, tx, ty) - direction: 'down' 아래 내용 보기, 'up' 위 내용 보기"""
+        distance = min(max(int(round(self.step / self.ratio)), self.min_distance), self.max_distance)
+        fy, ty = self.center + distance // 2, self.center - distance // 2
+        if direction == 'up':
+            fy, ty = ty, fy
+        return self.x, fy, self.x, ty
+
+    def update(self, direction, gesture, before, after):
+        """스와이프 결과 반영 → 아직 더 스크롤할 수 있으면 True
+
+        before가 None이면(직전 화면을 모름) 측정 없이 True
+        """
+        if before is None:
+            self.last_moved = None
+            self._last_signature = None
+            return True
+        if before.signature() != self._last_signature:
+            self._stuck.clear()
+        self._last_signature = after.signature()
+        moved = measure_scroll(before, after)
+        self.last_moved = moved
+        if moved is None:
+            self._stuck[direction] = 0
+            return True
+        if moved == 0:
+            self._stuck[direction] += 1
+            return self._stuck[direction] < self.end_after
+
+        self._stuck.clear()
+        distance = abs(gesture[1] - gesture[3])
+        self.ratio = 0.5 * self.ratio + 0.5 * (abs(moved) / distance)
+        return True
+
+    def shift(self, gesture):
+        """마지막 스와이프로 내용이 움직인 거리 (측정값, 측정 못 했으면 학습한 비율로 추정)"""
+        if self.last_moved is not None:
+            return self.last_moved
+        return int(round((gesture[1] - gesture[3]) * self.ratio))
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+세션 녹화 - u2 디바이스를 감싸서 dump_hierarchy/screenshot 결과를 직전 동작과 함께 기록
+같은 덤프/이미지는 한 번만 저장 (내용 해시), XML은 압축, 이미지는 PNG/JPEG 그대로
+
+아카이브(zip) 구조:
+    blobs/<sha1>.xml, blobs/<sha1>.png, blobs/<sha1>.jpg
+    events.jsonl - {"seq", "t", "kind": "dump"/"screenshot", "blob", "actions": [직전 동작들]}
+녹화 중에는 zip 대신 저널 파일에 관측마다 추가 (중간에 죽어도 그때까지 녹화는 남음)
+"""
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import zipfile
+
+import cv2
+import numpy as np
+
+
+class SessionArchive:
+    """녹화 파일 쓰기/읽기
+
+    녹화 중에는 관측마다 저널 파일(path + '.journal')에 바로 추가하고 close()에서 zip으로 묶음
+    크롤러가 죽어서 close()를 못 해도 저널은 남음 → 읽기 모드로 열면 zip으로 복구
+
+    Args:
+        path: zip 파일 경로 (또는 파일 객체 - 이때 저널은 메모리)
+        mode: 'w' 새로 녹화, 'r' 읽기
+        fsync_every: 관측 몇 개마다 저널을 디스크까지 동기화할지 (flush는 매번)
+    """
+
+    def __init__(self, path, mode='r', fsync_every=20):
+        self.path = path
+        self.mode = mode
+        self.fsync_every = fsync_every
+        self._lock = threading.Lock()
+        self._t0 = time.monotonic()
+        self._seq = 0
+        self._unsynced = 0
+        self._zip = None
+        self._journal = None
+        if mode == 'w':
+            self._blobs = set()
+            self._journal = open(self._journal_path(), 'wb') if isinstance(path, str) else io.BytesIO()
+        else:
+            if isinstance(path, str) and os.path.exists(self._journal_path()):
+                self.recover(path)
+            self._zip = zipfile.ZipFile(path, 'r')
+            self._blobs = set(self._zip.namelist())
+
+    def _journal_path(self):
+        return f'{self.path}.journal'
+
+    def _write(self, header, data=b''):
+        # 저널 레코드 = JSON 헤더 한 줄 + 내용 바이트
+        self._journal.write(json.dumps(header, ensure_ascii=False).encode('utf-8') + b'\n' + data)
+
+    def _put(self, data, ext):
+        # 내용 해시로 한 번만 저장 → blob 이름
+        name = f'blobs/{hashlib.sha1(data).hexdigest()}.{ext}'
+        if name not in self._blobs:
+            self._write({'blob': name, 'size': len(data)}, data)
+            self._blobs.add(name)
+        return name
+
+    def add(self, kind, data, ext, actions):
+        """관측 1개 기록 (kind: 'dump' / 'screenshot') - 저널에 바로 추가"""
+        with self._lock:
+            blob = self._put(data, ext)
+            self._write({'event': {'seq': self._seq, 't': round(time.monotonic() - self._t0, 3),
+                                   'kind': kind, 'blob': blob, 'actions': actions}})
+            self._seq += 1
+            self._journal.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every and isinstance(self.path, str):
+                os.fsync(self._journal.fileno())
+                self._unsynced = 0
+
+    @staticmethod
+    def _read_journal(f):
+        # → (blob 이름 → 내용, 이벤트 목록) - 쓰다 만 마지막 레코드는 무시
+        blobs, events = {}, []
+        while True:
+            line = f.readline()
+            if not line.endswith(b'\n'):
+                break
+            try:
+                header = json.loads(line)
+            except ValueError:
+                break
+            if 'blob' in header:
+                data = f.read(header['size'])
+                if len(data) < header['size']:
+                    break
+                blobs[header['blob']] = data
+            else:
+                events.append(header['event'])
+        # 내용이 잘린 blob을 가리키는 이벤트는 버림
+        return blobs, [e for e in events if e['blob'] in blobs]
+
+    @staticmethod
+    def _pack(target, blobs, events):
+        # 파일이면 임시 파일에 쓰고 교체 (묶는 중에 죽어도 저널은 그대로 남음)
+        out = f'{target}.tmp' if isinstance(target, str) else target
+        with zipfile.ZipFile(out, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            for name, data in blobs.items():
+                # PNG/JPEG는 이미 압축되어 있으니 그대로 저장
+                compress = zipfile.ZIP_DEFLATED if name.endswith('.xml') else zipfile.ZIP_STORED
+                zf.writestr(name, data, compress_type=compress)
+            zf.writestr('events.jsonl', ''.join(json.dumps(e, ensure_ascii=False) + '\n' for e in events))
+        if out is not target:
+            os.replace(out, target)
+
+    @classmethod
+    def recover(cls, path):
+        """close() 전에 끝난 녹화의 저널 → zip (저널은 삭제) → 복구한 관측 수"""
+        journal = f'{path}.journal'
+        with open(journal, 'rb') as f:
+            blobs, events = cls._read_journal(f)
+        cls._pack(path, blobs, events)
+        os.remove(journal)
+        return len(events)
+
+    def close(self):
+        """녹화 마무리 - 저널 → zip"""
+        if self._journal is not None:
+            with self._lock:
+                journal, self._journal = self._journal, None
+                if isinstance(self.path, str):
+                    journal.close()
+                    self.recover(self.path)
+                else:
+                    journal.seek(0)
+                    self._pack(self.path, *self._read_journal(journal))
+            return
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # --- 읽기 ---
+
+    def events(self):
+        """기록된 관측 목록"""
+        with self._zip.open('events.jsonl') as f:
+            return [json.loads(line) for line in io.TextIOWrapper(f, encoding='utf-8')]
+
+    def read(self, blob):
+        """blob 원본 바이트"""
+        return self._zip.read(blob)
+
+    def dumps(self):
+        """저장된 덤프 XML 목록 (중복 없음)"""
+        return [self.read(name).decode('utf-8') for name in sorted(self._blobs) if name.endswith('.xml')]
+
+    def image(self, blob, flags=cv2.IMREAD_COLOR):
+        """blob → OpenCV 이미지"""
+        return cv2.imdecode(np.frombuffer(self.read(blob), dtype=np.uint8), flags)
+
+
+class _RecordingSelector:
+    """d(**selector) 래퍼 - click/set_text를 동작으로 기록"""
+
+    def __init__(self, selector_obj, selector, recorder):
+        self._obj = selector_obj
+        self._selector = selector
+        self._recorder = recorder
+
+    def click(self, *args, **kwargs):
+        self._recorder._action('selector_click', self._selector)
+        return self._obj.click(*args, **kwargs)
+
+    def set_text(self, text, *args, **kwargs):
+        self._recorder._action('set_text', self._selector, text)
+        return self._obj.set_text(text, *args, **kwargs)
+
+    def clear_text(self, *args, **kwargs):
+        self._recorder._action('clear_text', self._selector)
+        return self._obj.clear_text(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._obj, name)
+
+
+class _RecordingRpc:
+    """d.jsonrpc 래퍼 - takeScreenshot 결과(JPEG) 기록"""
+
+    def __init__(self, rpc, recorder):
+        self._rpc = rpc
+        self._recorder = recorder
+
+    def takeScreenshot(self, *args):
+        data = self._rpc.takeScreenshot(*args)
+        if data:
+            self._recorder._observe('screenshot', base64.b64decode(data), 'jpg')
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._rpc, name)
+
+
+class RecordingDevice:
+    """u2 디바이스 녹화 프록시 - 나머지 API는 그대로 전달
+
+    Args:
+        d: uiautomator2 디바이스
+        archive: SessionArchive (쓰기 모드) 또는 zip 경로
+    """
+
+    def __init__(self, d, archive):
+        self._d = d
+        self.archive = archive if isinstance(archive, SessionArchive) else SessionArchive(archive, 'w')
+        self._pending = []  # 마지막 관측 이후 동작들
+        self.jsonrpc = _RecordingRpc(d.jsonrpc, self)
+
+    def _action(self, *action):
+        self._pending.append(list(action))
+
+    def _observe(self, kind, data, ext):
+        actions, self._pending = self._pending, []
+        self.archive.add(kind, data, ext, actions)
+
+    def dump_hierarchy(self, *args, **kwargs):
+        xml = self._d.dump_hierarchy(*args, **kwargs)
+        self._observe('dump', xml.encode('utf-8'), 'xml')
+        return xml
+
+    def screenshot(self, *args, **kwargs):
+        result = self._d.screenshot(*args, **kwargs)
+        if isinstance(result, np.ndarray):
+            ok, buf = cv2.imencode('.png', result)
+            if ok:
+                self._observe('screenshot', buf.tobytes(), 'png')
+        elif result is not None:
+            buf = io.BytesIO()
+            result.save(buf, format='PNG')
+            self._observe('screenshot', buf.getvalue(), 'png')
+        return result
+
+    def click(self, x, y):
+        self._action('click', x, y)
+        return self._d.click(x, y)
+
+    def swipe(self, fx, fy, tx, ty, *args, **kwargs):
+        self._action('swipe', fx, fy, tx, ty)
+        return self._d.swipe(fx, fy, tx, ty, *args, **kwargs)
+
+    def press(self, key, *args, **kwargs):
+        self._action('press', key)
+        return self._d.press(key, *args, **kwargs)
+
+    def __call__(self, **selector):
+        return _RecordingSelector(self._d(**selector), selector, self)
+
+    def __getattr__(self, name):
+        return getattr(self._d, name)
+
+    def close(self):
+        """녹화 파일 마무리 (저널 → zip)"""
+        self.archive.close()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+화면 안정 대기 - 고정 time.sleep 대신 화면이 멈추면 바로 진행
+계층 덤프 해시를 점점 늘어나는 간격으로 확인하고, 연속으로 같으면 안정된 것으로 판단
+여러 셀렉터 대기(wait_for_any/wait_for_all)도 확인할 때마다 덤프 1개로 모든 셀렉터를 평가
+"""
+import time
+
+from screen_snapshot import ScreenSnapshot
+
+
+def wait_for_settle(d, timeout=3.0, until=None, previous=None, change_timeout=None,
+                    interval=0.05, backoff=1.5, max_interval=0.4, stable_count=2):
+    """화면이 안정될 때까지 대기하고 마지막 스냅샷 반환
+
+    Args:
+        d: uiautomator2 디바이스 (dump_hierarchy 지원)
+        timeout: 최대 대기 시간 (초) - 넘으면 마지막 스냅샷 그대로 반환
+        until: snap → bool, True가 되면 안정 여부와 상관없이 바로 반환 (기대하는 요소 등장)
+        previous: 동작 직전 스냅샷 - 주어지면 화면이 한 번 바뀐 뒤부터 안정 판단
+        change_timeout: previous와 같은 화면이 이 시간(초) 넘게 그대로면 안 바뀌는 동작으로 보고 반환
+            (목록 끝에서 스와이프 등 - timeout까지 기다리지 않음)
+        interval, backoff, max_interval: 확인 간격 (interval부터 backoff배씩, 최대 max_interval)
+        stable_count: 같은 해시가 연속 몇 번 나와야 안정으로 볼지
+
+    Returns:
+        ScreenSnapshot
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    previous_sig = previous.signature() if previous is not None else None
+    changed = previous is None
+    last_sig = None
+    same = 0
+
+    while True:
+        snap = ScreenSnapshot(d.dump_hierarchy())
+        if until is not None and until(snap):
+            return snap
+
+        sig = snap.signature()
+        if not changed and sig != previous_sig:
+            changed = True
+        if sig == last_sig:
+            same += 1
+        else:
+            same = 1
+            last_sig = sig
+        if changed and same >= stable_count:
+            return snap
+        if not changed and change_timeout is not None and same >= stable_count \
+                and time.monotonic() - started >= change_timeout:
+            return snap
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return snap
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+
+
+def _poll(d, timeout, check, interval, backoff, max_interval):
+    # 덤프 1개 → check(snap)이 None이 아닌 값을 줄 때까지 반복 → (스냅샷, 값)
+    deadline = time.monotonic() + timeout
+    while True:
+        snap = ScreenSnapshot(d.dump_hierarchy())
+        result = check(snap)
+        remaining = deadline - time.monotonic()
+        if result is not None or remaining <= 0:
+            return snap, result
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+
+
+def wait_for_any(d, selectors, timeout=3.0, interval=0.05, backoff=1.5, max_interval=0.4):
+    """셀렉터 중 하나라도 보일 때까지 대기 → (찾은 셀렉터 번호 또는 None, 마지막 스냅샷)
+
+    Args:
+        d: uiautomator2 디바이스 (dump_hierarchy 지원)
+        selectors: u2 셀렉터 dict 목록 (예: [{'textContains': '최근 주문수'}, {'description': '닫기'}])
+        timeout: 최대 대기 시간 (초) - 0이면 덤프 1번만 확인
+    """
+    def first(snap):
+        for i, selector in enumerate(selectors):
+            if snap.find(**selector) is not None:
+                return i
+        return None
+
+    snap, index = _poll(d, timeout, first, interval, backoff, max_interval)
+    return index, snap
+
+
+def wait_for_all(d, selectors, timeout=3.0, interval=0.05, backoff=1.5, max_interval=0.4):
+    """셀렉터가 모두 보일 때까지 대기 → (모두 찾았는지, 마지막 스냅샷)"""
+    def every(snap):
+        return True if all(snap.find(**selector) is not None for selector in selectors) else None
+
+    snap, found = _poll(d, timeout, every, interval, backoff, max_interval)
+    return bool(found), snap
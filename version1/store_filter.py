@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+가게명 후보 필터 - store_name_filter.json의 제외 규칙을 정규식 1개로 컴파일
+content-desc 1개당 한 번만 스캔하고, 어떤 규칙으로 제외됐는지 기록
+"""
+import json
+import os
+import re
+from collections import Counter
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'store_name_filter.json')
+
+
+class StoreNameFilter:
+    """가게명 제외 규칙 모음
+
+    exact: 정확히 일치하면 제외
+    contains: {분류: [키워드, ...]} - 키워드가 포함되면 제외
+    patterns: 정규식 (re.match와 동일하게 앞에서부터 매칭)
+    prefixes: 이 문자로 시작하면 제외
+    numeric: '.', ','를 뺀 나머지가 숫자뿐이면 제외
+    min_len, max_len: 가게명 길이 범위
+    """
+
+    def __init__(self, exact=(), contains=None, patterns=(), prefixes=(),
+                 numeric=False, min_len=None, max_len=None):
+        self.exact = set(exact)
+        self.numeric = numeric
+        self.min_len = min_len
+        self.max_len = max_len
+        self.rejections = Counter()   # 규칙별 제외 횟수 (튜닝용)
+
+        # 키워드 → 분류
+        self.keyword_category = {}
+        for category, keywords in (contains or {}).items():
+            for kw in keywords:
+                self.keyword_category.setdefault(kw, category)
+
+        # 키워드/정규식/접두어를 alternation 하나로 합침
+        alternatives = []
+        self._group_rule = {}
+        if self.keyword_category:
+            # 긴 키워드 먼저 (예: '탭바'가 '탭'보다 먼저 보고되도록)
+            keywords = sorted(self.keyword_category, key=len, reverse=True)
+            alternatives.append('(?P<kw>' + '|'.join(map(re.escape, keywords)) + ')')
+        for i, pattern in enumerate(patterns):
+            group = f'p{i}'
+            alternatives.append(f'(?P<{group}>\\A(?:{pattern}))')
+            self._group_rule[group] = f'pattern:{pattern}'
+        for i, prefix in enumerate(prefixes):
+            group = f'x{i}'
+            alternatives.append(f'(?P<{group}>\\A{re.escape(prefix)})')
+            self._group_rule[group] = f'prefix:{prefix}'
+        self._regex = re.compile('|'.join(alternatives)) if alternatives else None
+
+    @classmethod
+    def load(cls, profile, path=DEFAULT_CONFIG):
+        """설정 파일에서 profile('list', 'similar' 등) 규칙 로드"""
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+        return cls(**config[profile])
+
+    def reject_reason(self, name):
+        """제외 규칙 이름 반환 (통과하면 None)"""
+        reason = None
+        if name in self.exact:
+            reason = f'exact:{name}'
+        elif self._regex is not None and (m := self._regex.search(name)):
+            group = next(k for k, v in m.groupdict().items() if v is not None)
+            if group == 'kw':
+                kw = m.group('kw')
+                reason = f'contains:{kw} [{self.keyword_category[kw]}]'
+            else:
+                reason = self._group_rule[group]
+        elif self.numeric and name.replace('.', '').replace(',', '').isdigit():
+            reason = 'numeric'
+        elif (self.min_len is not None and len(name) < self.min_len) or \
+                (self.max_len is not None and len(name) > self.max_len):
+            reason = 'length'
+
+        if reason:
+            self.rejections[reason] += 1
+        return reason
+
+    def accepts(self, name):
+        """가게명으로 쓸 수 있는지"""
+        return self.reject_reason(name) is None
+
+    def report(self, top=20):
+        """많이 걸린 규칙 순으로 (규칙, 횟수) 목록"""
+        return self.rejections.most_common(top)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+가게목록 모델 - 스크롤하면서 본 가게를 목록 안 위치(절대 y)와 함께 누적
+화면 y + 스크롤 오프셋 = 목록 안 위치, 오프셋은 이미 아는 가게가 보이면 그 위치로 다시 맞춤
+방문/건너뜀은 집합으로 확인 (리스트 검색 대신) - 방문 기록은 VisitedRegistry로 실행/디바이스 간 공유 가능
+행(content-desc)이 가게인지는 처음 볼 때 한 번만 분류하고 기억 (스크롤 후 다시 보이는 행은 필터를 다시 안 거침)
+"""
+import statistics
+
+
+class StoreListModel:
+    """가게목록 상태
+
+    Args:
+        visited: 방문 기록 (in / add 지원 - set 또는 VisitedRegistry, 기본: 이번 실행만)
+        collected: 이전 실행에서 이미 수집한 가게명 (중간 저장 파일 - 건너뛰기만 하고 방문 기록에는 다시 안 씀)
+    """
+
+    def __init__(self, visited=None, collected=()):
+        self.position = {}     # 가게명 → 목록 안 위치 (px, 처음 본 화면 상단 기준)
+        self.visited = visited if visited is not None else set()  # 크롤링한 가게
+        self.collected = set(collected)
+        self.skipped = set()   # 건너뛸 가게 (방금본가게 광고 등)
+        self.offset = 0        # 현재 화면 상단의 목록 안 위치 (추정)
+        self.visible = []      # 마지막으로 본 화면의 가게명 (위에서 아래로)
+        self.rows = {}         # content-desc → 가게명 (가게가 아니면 None)
+
+    def row_name(self, desc, classify):
+        """content-desc → 가게명 (가게가 아니면 None) - 처음 보는 desc만 classify(desc)로 분류"""
+        try:
+            return self.rows[desc]
+        except KeyError:
+            name = self.rows[desc] = classify(desc)
+            return name
+
+    def __contains__(self, name):
+        return name in self.position
+
+    def __len__(self):
+        return len(self.position)
+
+    def is_done(self, name):
+        """방문했거나 건너뛸 가게인지"""
+        return name in self.collected or name in self.visited or name in self.skipped
+
+    def mark_visited(self, name):
+        self.visited.add(name)
+
+    def mark_skipped(self, name):
+        """건너뛸 가게로 표시 → 새로 추가됐으면 True"""
+        if self.is_done(name):
+            return False
+        self.skipped.add(name)
+        return True
+
+    def observe(self, stores):
+        """화면에 보이는 가게 [{'name', 'y'}, ...] 반영 → 처음 본 가게명 목록
+
+        이미 아는 가게가 보이면 그 위치 차이(중앙값)로 오프셋을 다시 맞춤
+        """
+        known = [self.position[s['name']] - s['y'] for s in stores if s['name'] in self.position]
+        if known:
+            self.offset = int(statistics.median(known))
+        new = []
+        for s in stores:
+            if s['name'] not in self.position:
+                self.position[s['name']] = s['y'] + self.offset
+                new.append(s['name'])
+        self.visible = [s['name'] for s in sorted(stores, key=lambda s: s['y'])]
+        return new
+
+    def scrolled(self, moved):
+        """스크롤로 내용이 moved px 움직였음 (양수: 아래쪽을 봄)"""
+        self.offset += moved
+
+    def next_unvisited(self, stores):
+        """화면의 가게 중 위에서부터 첫 번째 미방문 가게 (없으면 None)"""
+        for s in sorted(stores, key=lambda s: s['y']):
+            if not self.is_done(s['name']):
+                return s
+        return None
+
+    def locate(self, name):
+        """가게가 마지막 화면 기준 어디 있는지 → 'visible' / 'up' / 'down' / None(모름)"""
+        if name in self.visible:
+            return 'visible'
+        if name not in self.position:
+            return None
+        if self.visible:
+            top = self.position.get(self.visible[0])
+            if top is not None and self.position[name] < top:
+                return 'up'
+            return 'down'
+        return 'up' if self.position[name] < self.offset else 'down'
+
+    def ordered(self):
+        """본 가게명 전체 (목록 순서)"""
+        return sorted(self.position, key=self.position.get)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+템플릿 매칭 - 템플릿은 처음 한 번만 읽어서 흑백으로 보관
+찾았던 위치 주변(ROI)을 먼저 매칭하고, 없을 때만 전체 화면 매칭
+전체 화면은 축소 피라미드에서 후보를 찾고 원본 크기에서는 후보 주변만 다시 매칭
+해상도(DPI)가 다른 폰도 같은 템플릿으로 찾도록 몇 가지 배율을 시도
+축소해서 받은 스크린샷(screen_scale)도 그대로 매칭 - 결과 좌표는 원본 화면 기준
+"""
+import cv2
+import numpy as np
+
+
+class TemplateMatcher:
+    """템플릿 등록소 + 템플릿별로 학습한 ROI/배율
+
+    Args:
+        roi_margin: 찾았던 영역에서 상하좌우로 더 볼 여백 (px)
+        scales: 시도할 템플릿 배율 (처음 값부터, 한 번 찾은 배율은 다음부터 먼저 시도)
+        levels: 피라미드 최대 단계 (1단계마다 가로세로 1/2)
+        candidates: 축소 화면에서 원본 크기로 다시 확인할 후보 수
+        min_size: 축소한 템플릿의 최소 변 길이 (이보다 작아지는 단계는 건너뜀)
+    """
+
+    def __init__(self, roi_margin=60, scales=(1.0, 0.9, 1.1, 0.8, 1.25), levels=2, candidates=3, min_size=16):
+        self.roi_margin = roi_margin
+        self.scales = scales
+        self.levels = levels
+        self.candidates = candidates
+        self.min_size = min_size
+        self._templates = {}  # 경로 → 흑백 템플릿 (없으면 None)
+        self._scaled = {}     # (경로, 배율) → [원본 크기, 1/2, 1/4 ...] 템플릿 피라미드
+        self._rois = {}       # 경로 → (x1, y1, x2, y2) 지금까지 찾은 위치를 모두 포함하는 영역 (원본 화면 좌표)
+        self._scale_of = {}   # 경로 → 마지막으로 찾은 배율
+
+    def get(self, path):
+        """흑백 템플릿 (파일이 없으면 None)"""
+        if path not in self._templates:
+            template = cv2.imread(path)
+            if template is not None:
+                template = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+            self._templates[path] = template
+        return self._templates[path]
+
+    def _pyramid(self, path, scale):
+        # 배율을 적용한 템플릿과 그 축소본들
+        key = (path, scale)
+        if key not in self._scaled:
+            template = self.get(path)
+            if scale != 1.0:
+                h, w = template.shape
+                size = (max(int(round(w * scale)), 1), max(int(round(h * scale)), 1))
+                template = cv2.resize(template, size, interpolation=cv2.INTER_AREA)
+            pyramid = [template]
+            while len(pyramid) <= self.levels and min(pyramid[-1].shape) // 2 >= self.min_size:
+                pyramid.append(cv2.pyrDown(pyramid[-1]))
+            self._scaled[key] = pyramid
+        return self._scaled[key]
+
+    def _match(self, screen_gray, template, x1=0, y1=0):
+        # → (중심 x, 중심 y, 점수) - 좌표는 화면 기준
+        result = cv2.matchTemplate(screen_gray, template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        h, w = template.shape
+        return x1 + max_loc[0] + w // 2, y1 + max_loc[1] + h // 2, max_val
+
+    def _match_in(self, screen_gray, template, x1, y1, x2, y2):
+        # 화면의 (x1, y1)-(x2, y2) 영역 안에서만 매칭 (영역이 템플릿보다 작으면 None)
+        h, w = template.shape
+        screen_h, screen_w = screen_gray.shape[:2]
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, screen_w), min(y2, screen_h)
+        if x2 - x1 < w or y2 - y1 < h:
+            return None
+        return self._match(screen_gray[y1:y2, x1:x2], template, x1, y1)
+
+    def _coarse_to_fine(self, screens, pyramid):
+        # 가장 작은 단계에서 후보 위치 → 원본 크기에서 후보 주변만 매칭
+        level = min(len(screens), len(pyramid)) - 1
+        template = pyramid[0]
+        if level == 0:
+            return self._match(screens[0], template)
+
+        small = pyramid[level]
+        if small.shape[0] > screens[level].shape[0] or small.shape[1] > screens[level].shape[1]:
+            return None
+        result = cv2.matchTemplate(screens[level], small, cv2.TM_CCOEFF_NORMED)
+        factor = 2 ** level
+        h, w = template.shape
+        sh, sw = small.shape
+        pad = 2 * factor
+
+        best = None
+        for _ in range(self.candidates):
+            _, _, _, (x, y) = cv2.minMaxLoc(result)
+            # 같은 봉우리를 다시 고르지 않도록 주변을 지움
+            result[max(y - sh // 2, 0):y + sh // 2 + 1, max(x - sw // 2, 0):x + sw // 2 + 1] = -np.inf
+            fine = self._match_in(screens[0], template, x * factor - pad, y * factor - pad,
+                                  x * factor + w + pad, y * factor + h + pad)
+            if fine is not None and (best is None or fine[2] > best[2]):
+                best = fine
+        return best
+
+    def _learn(self, path, scale, cx, cy, w, h):
+        box = (cx - w // 2, cy - h // 2, cx - w // 2 + w, cy - h // 2 + h)
+        roi = self._rois.get(path)
+        if roi is not None and self._scale_of.get(path) == scale:
+            box = (min(roi[0], box[0]), min(roi[1], box[1]), max(roi[2], box[2]), max(roi[3], box[3]))
+        self._rois[path] = box
+        self._scale_of[path] = scale
+
+    def match(self, screen_gray, path, threshold=0.7, screen_scale=1.0):
+        """화면에서 템플릿 찾기 → (중심 x, 중심 y, 점수), 못 찾으면 (None, None, 점수)
+
+        screen_scale: screen_gray가 원본 화면의 몇 배로 줄어든 것인지 (좌표는 원본 기준으로 돌려줌)
+        템플릿 파일이 없으면 None
+        """
+        template = self.get(path)
+        if template is None:
+            return None
+
+        def found_at(found, scale):
+            # 찾은 위치를 원본 화면 좌표로 바꾸고 ROI/배율 학습
+            cx, cy, score = found
+            cx, cy = int(round(cx / screen_scale)), int(round(cy / screen_scale))
+            th, tw = template.shape
+            self._learn(path, scale, cx, cy, int(tw * scale), int(th * scale))
+            return cx, cy, score
+
+        learned = self._scale_of.get(path, self.scales[0])
+        roi = self._rois.get(path)
+        if roi is not None:
+            m = self.roi_margin
+            x1, y1, x2, y2 = (int((v + d) * screen_scale) for v, d in zip(roi, (-m, -m, m, m)))
+            found = self._match_in(screen_gray, self._pyramid(path, learned * screen_scale)[0], x1, y1, x2, y2)
+            if found is not None and found[2] >= threshold:
+                return found_at(found, learned)
+
+        screens = [screen_gray]
+        for _ in range(self.levels):
+            screens.append(cv2.pyrDown(screens[-1]))
+
+        best_score = -1.0
+        for scale in [learned] + [s for s in self.scales if s != learned]:
+            found = self._coarse_to_fine(screens, self._pyramid(path, scale * screen_scale))
+            if found is None:
+                continue
+            if found[2] >= threshold:
+                return found_at(found, scale)
+            best_score = max(best_score, found[2])
+        return None, None, best_score
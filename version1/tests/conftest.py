@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+테스트 공용 설정 - version1 모듈을 바로 import, 템플릿 경로(templates/...)가 상대 경로라서 version1에서 실행
+"""
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+
+
+@pytest.fixture(autouse=True)
+def _version1_cwd(monkeypatch):
+    monkeypatch.chdir(HERE)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+버튼 찾기 기억 파일 - 크롤러(스레드)마다 ElementResolver가 따로 있어도 기록이 합쳐져야 함
+"""
+import json
+import threading
+
+from element_resolver import ElementResolver, ElementTarget
+
+
+def test_concurrent_resolvers_keep_each_others_strategies(tmp_path):
+    path = str(tmp_path / 'element_strategy.json')
+    targets = [ElementTarget(f'button{i}', selectors=[('desc', lambda n: False)]) for i in range(8)]
+    resolvers = [ElementResolver(path) for _ in targets]
+
+    threads = [threading.Thread(target=r.remember, args=(t, 'app 1.0', 'desc'))
+               for r, t in zip(resolvers, targets)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with open(path, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved == {'app 1.0': {t.name: 'desc' for t in targets}}
+    assert ElementResolver(path).order(targets[0], 'app 1.0') == ['desc']
+    assert list(tmp_path.iterdir()) == [tmp_path / 'element_strategy.json']
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+작업 큐 - 임대/완료/재시도, 임대 만료 후 재배정과 마지막 시도 만료 → 실패
+"""
+import time
+
+from job_queue import DONE, FAILED, PENDING, JobQueue
+
+
+def make_queue(tmp_path, **kwargs):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite'), **kwargs)
+    for i in range(3):
+        queue.add(i, {'row': i})
+    return queue
+
+
+def test_lease_in_order_and_complete(tmp_path):
+    queue = make_queue(tmp_path)
+    assert queue.lease('a') == ('0', {'row': 0})
+    assert queue.lease('b') == ('1', {'row': 1})
+    assert queue.complete('0', 'a', {'ok': 1})
+    assert not queue.complete('1', 'a')  # 다른 워커의 임대
+    assert queue.results() == {'0': {'ok': 1}}
+
+
+def test_fail_retries_until_max_attempts(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=2)
+    queue.reset()
+    queue.add('x', {})
+    for _ in range(2):
+        key, _ = queue.lease('a')
+        queue.fail(key, 'a', 'boom')
+    assert queue.lease('a') is None
+    assert queue.counts() == {FAILED: 1}
+    assert not queue.has_unfinished()
+
+
+def test_expired_lease_goes_to_another_worker(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.05)
+    queue.lease('dead')
+    time.sleep(0.1)
+    key, _ = queue.lease('alive')
+    assert key == '0'
+    assert queue.complete('0', 'alive')
+    assert not queue.complete('0', 'dead')
+
+
+def test_expired_last_attempt_becomes_failed(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.05, max_attempts=2)
+    queue.reset()
+    queue.add('hung', {})
+    queue.lease('a')
+    time.sleep(0.1)
+    assert queue.lease('b')[0] == 'hung'  # 2번째(마지막) 시도
+    time.sleep(0.1)
+    assert queue.lease('c') is None
+    assert not queue.has_unfinished()
+    assert queue.counts() == {FAILED: 1}
+
+
+def test_counts_reports_expired_last_attempt_without_lease(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.05, max_attempts=1)
+    for _ in range(3):
+        key, _ = queue.lease('a')
+    queue.complete('0', 'a')
+    time.sleep(0.1)
+    assert queue.counts() == {DONE: 1, FAILED: 2}
+
+
+def test_requeue_resets_failed_and_leased(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=1)
+    key, _ = queue.lease('a')
+    queue.fail(key, 'a', 'boom')
+    queue.lease('a')
+    assert queue.requeue() == 2  # 실패 1 + 임대 중 1
+    assert queue.counts() == {PENDING: 3}
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Prometheus 텍스트 형식 - 카운터 설명 이름이 샘플 이름(_total)과 같은지, 라벨 값 이스케이프
+"""
+from metrics import Metrics
+
+
+def render(**labels):
+    metrics = Metrics()
+    metrics.enabled = True
+    metrics.inc('stores_completed', **labels)
+    metrics.observe('dump_seconds', 0.3, **labels)
+    return metrics.render().splitlines()
+
+
+def test_counter_family_matches_sample_name():
+    lines = render(device='R3CN')
+    assert '# TYPE baemin_stores_completed_total counter' in lines
+    assert lines[lines.index('# TYPE baemin_stores_completed_total counter') + 1] == \
+        'baemin_stores_completed_total{device="R3CN"} 1'
+    assert '# TYPE baemin_dump_seconds histogram' in lines
+
+
+def test_label_values_are_escaped():
+    lines = render(device='a"b\\c\nd')
+    assert 'baemin_stores_completed_total{device="a\\"b\\\\c\\nd"} 1' in lines
+    assert all(not line.startswith('d"') for line in lines)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+화면 상태 판별 - 실제 덤프(ui_dumps)와 재생 디바이스의 각 화면을 덤프 1개로 분류, 뒤로가기 경로
+"""
+import pytest
+
+from baemin_crawler_final import BaeminCrawler
+from page_state import PageState, classify, reachable_by_back
+from replay_device import baemin_device
+from screen_snapshot import ScreenSnapshot
+
+# 실제 폰에서 받은 덤프
+DUMPS = {
+    'step1_ui.xml': PageState.HOME,
+    'ui_dump.xml': PageState.STORE_LIST,
+    'step2_ui.xml': PageState.STORE_DETAIL,
+    'current_ui.xml': PageState.STORE_DETAIL,  # 배달팁 펼친 상태
+}
+
+EXPECTED = {
+    'home': PageState.HOME,
+    'list': PageState.STORE_LIST,
+    'detail': PageState.STORE_DETAIL,
+    'detail_open': PageState.STORE_DETAIL,
+    'info': PageState.STORE_INFO,
+    'search': PageState.SEARCH_INPUT,
+    'results': PageState.SEARCH_RESULTS,
+}
+
+
+@pytest.mark.parametrize('name, state', sorted(DUMPS.items()))
+def test_classify_real_dumps(name, state):
+    with open(f'ui_dumps/{name}', encoding='utf-8') as f:
+        assert classify(ScreenSnapshot(f.read())) == state
+
+
+@pytest.mark.parametrize('screen, state', sorted(EXPECTED.items()))
+def test_classify_replay_screens(screen, state):
+    device = baemin_device()
+    device.state.update(store='교촌치킨 반포점', typed='교촌치킨')
+    device.current = screen
+    assert classify(ScreenSnapshot(device.dump_hierarchy())) == state
+
+
+def test_sort_popup_is_unknown():
+    device = baemin_device()
+    device.current = 'sort'
+    assert classify(ScreenSnapshot(device.dump_hierarchy())) == PageState.UNKNOWN
+
+
+def test_reachable_by_back():
+    assert reachable_by_back(PageState.STORE_INFO, PageState.STORE_LIST)
+    assert reachable_by_back(PageState.STORE_INFO, PageState.HOME)
+    assert not reachable_by_back(PageState.STORE_LIST, PageState.STORE_DETAIL)
+    assert not reachable_by_back(PageState.HOME, PageState.STORE_LIST)
+
+
+def test_back_from_empty_search_results(capsys):
+    # 검색 결과 0개 → 검색입력으로 분류, 뒤로가기하면 다시 검색입력 → 메인
+    device = baemin_device()
+    device.go('search')
+    device.state['typed'] = '없는 가게'
+    device.go('results')
+    crawler = BaeminCrawler(settle_timeout=0.2, device=device)
+    crawler.connect()
+    assert crawler.current_state() == PageState.SEARCH_INPUT
+
+    assert crawler.back_to(PageState.HOME)
+    assert '예상과 다름' not in capsys.readouterr().out
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+중간 저장 + --resume - 재생 디바이스로 V1 실행
+이미 수집한 가게가 여러 화면에 걸쳐 있어도 그 구간을 지나서 새 가게를 수집해야 함
+"""
+import contextlib
+import io
+
+from baemin_crawler_final import BaeminCrawler
+from checkpoint import RecordLog
+from element_resolver import ElementResolver
+from replay_device import baemin_device, make_stores
+
+
+def run(tmp_path, stores, max_stores, resume=False, visited=None):
+    crawler = BaeminCrawler(settle_timeout=0.2, device=baemin_device(stores))
+    crawler.resolver = ElementResolver(str(tmp_path / 'element_strategy.json'))
+    with contextlib.redirect_stdout(io.StringIO()):
+        return crawler.run(max_stores=max_stores, save=False, resume=resume, visited=visited,
+                           checkpoint_path=str(tmp_path / 'checkpoint.jsonl'))
+
+
+def write_checkpoint(tmp_path, names):
+    log = RecordLog(str(tmp_path / 'checkpoint.jsonl'))
+    log.open()
+    for i, name in enumerate(names, 1):
+        log.append({'순번': i, '가게명': name})
+    log.close()
+
+
+def test_checkpoint_has_every_store(tmp_path):
+    stores = make_stores(10)
+    result = run(tmp_path, stores, 3)
+    saved = RecordLog(str(tmp_path / 'checkpoint.jsonl')).load()
+    assert [r['가게명'] for r in saved] == [r['가게명'] for r in result]
+    assert len(saved) == 3
+    assert saved[0]['상호명'] == f'(주){saved[0]["가게명"]}'
+
+
+def test_resume_past_many_screens_of_done_stores(tmp_path):
+    stores = make_stores(80)
+    done = [s['가게명'] for s in stores[:60]]
+    write_checkpoint(tmp_path, done)
+
+    result = run(tmp_path, stores, 63, resume=True)
+
+    assert len(result) == 63
+    assert [r['가게명'] for r in result[:60]] == done
+    new = [r['가게명'] for r in result[60:]]
+    assert not set(new) & set(done)
+    assert all(r['상호명'] for r in result[60:])
+
+
+def test_resume_ignores_partial_last_line(tmp_path):
+    stores = make_stores(10)
+    write_checkpoint(tmp_path, [stores[0]['가게명']])
+    with open(tmp_path / 'checkpoint.jsonl', 'a', encoding='utf-8') as f:
+        f.write('{"순번": 2, "가게명": "쓰다 만')  # 저장 중 종료
+
+    result = run(tmp_path, stores, 2, resume=True)
+
+    names = [r['가게명'] for r in result]
+    assert len(names) == 2 and names[0] == stores[0]['가게명'] and names[1] != names[0]
+    assert len(RecordLog(str(tmp_path / 'checkpoint.jsonl')).load()) == 2
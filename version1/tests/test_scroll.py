@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+적응형 스크롤 - 이동 거리 측정, 목록 끝 감지 (안 움직이는 스와이프는 settle_timeout까지 기다리지 않음)
+"""
+import time
+
+from baemin_crawler_final import BaeminCrawler
+from replay_device import baemin_device, make_stores
+from screen_snapshot import ScreenSnapshot
+from scroll import ScrollEngine, measure_scroll
+
+
+def store_list_crawler(count, settle_timeout=3.0):
+    crawler = BaeminCrawler(settle_timeout=settle_timeout, device=baemin_device(make_stores(count)))
+    crawler.connect()
+    crawler.d(descriptionContains='음식배달에서 더보기').click()
+    crawler.settle()
+    return crawler
+
+
+def test_measure_scroll_matches_list_offset():
+    device = baemin_device(make_stores(12))
+    device(descriptionContains='음식배달에서 더보기').click()
+    before = ScreenSnapshot(device.dump_hierarchy())
+    device.swipe(540, 1500, 540, 700)
+    after = ScreenSnapshot(device.dump_hierarchy())
+    assert measure_scroll(before, after) == device.state['offset'] == 800
+    assert measure_scroll(after, after) == 0
+
+
+def test_scroll_engine_stops_after_end_after_still_swipes():
+    device = baemin_device(make_stores(12))
+    device(descriptionContains='음식배달에서 더보기').click()
+    engine = ScrollEngine()
+    moves = []
+    for _ in range(20):
+        before = ScreenSnapshot(device.dump_hierarchy())
+        gesture = engine.gesture('down')
+        device.swipe(*gesture)
+        more = engine.update('down', gesture, before, ScreenSnapshot(device.dump_hierarchy()))
+        moves.append(engine.last_moved)
+        if not more:
+            break
+    assert not more
+    assert moves[-engine.end_after:] == [0] * engine.end_after
+    assert all(moves[:-engine.end_after])
+
+
+def test_list_end_detected_without_waiting_settle_timeout():
+    crawler = store_list_crawler(12, settle_timeout=3.0)
+    swipes = 0
+    started = time.monotonic()
+    while crawler.scroll_down(1):
+        swipes += 1
+        assert swipes < 20
+    elapsed = time.monotonic() - started
+    # 끝에서 안 움직이는 스와이프 2번은 change_timeout(0.5초)만 기다림
+    assert elapsed < 2 * crawler.settle_timeout
+    assert crawler.scroll_up(1)
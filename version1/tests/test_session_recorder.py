@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+세션 녹화 - 관측마다 저널에 바로 기록, close() 없이 끝나도 다시 열면 zip으로 복구
+"""
+import io
+
+from replay_device import baemin_device, run_v1
+from session_recorder import RecordingDevice, SessionArchive
+
+
+def record(tmp_path, close=True):
+    path = str(tmp_path / 'session.zip')
+    device = RecordingDevice(baemin_device(), path)
+    run_v1(2, device=device, workdir=str(tmp_path))
+    if close:
+        device.close()
+    return path, device
+
+
+def test_close_packs_deduplicated_archive(tmp_path):
+    path, device = record(tmp_path)
+    assert not (tmp_path / 'session.zip.journal').exists()
+    with SessionArchive(path) as archive:
+        events = archive.events()
+        assert [e['seq'] for e in events] == list(range(len(events)))
+        assert len(archive.dumps()) < sum(e['kind'] == 'dump' for e in events)
+        assert archive.read(events[0]['blob']).decode('utf-8') in archive.dumps()
+
+
+def test_crash_before_close_keeps_recording(tmp_path):
+    path, device = record(tmp_path, close=False)  # close() 없이 종료
+    written = device.archive._seq
+    journal = tmp_path / 'session.zip.journal'
+    assert journal.exists() and not (tmp_path / 'session.zip').exists()
+
+    with open(journal, 'ab') as f:
+        f.write(b'{"blob": "blobs/x.xml", "size": 100}\n<hier')  # 쓰다 만 레코드
+
+    with SessionArchive(path) as archive:
+        assert len(archive.events()) == written
+        assert archive.dumps()
+    assert not journal.exists()
+
+
+def test_file_object_archive_keeps_journal_in_memory(tmp_path):
+    buf = io.BytesIO()
+    device = RecordingDevice(baemin_device(), SessionArchive(buf, 'w', fsync_every=1))
+    run_v1(1, device=device, workdir=str(tmp_path))
+    device.close()
+    assert SessionArchive(buf).events()
+    assert [p.name for p in tmp_path.iterdir() if 'journal' in p.name] == []
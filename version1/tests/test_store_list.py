@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+가게목록 모델 - 스크롤 오프셋으로 목록 위치 누적, 행 분류는 desc마다 한 번
+"""
+from store_list import StoreListModel
+
+
+def test_observe_keeps_list_positions_across_scrolls():
+    model = StoreListModel()
+    assert model.observe([{'name': 'A', 'y': 700}, {'name': 'B', 'y': 1000}]) == ['A', 'B']
+    model.scrolled(300)  # 추정치 - 다시 보이는 가게 위치로 보정됨
+    assert model.observe([{'name': 'B', 'y': 600}, {'name': 'C', 'y': 900}]) == ['C']
+    assert model.offset == 400
+    assert model.ordered() == ['A', 'B', 'C']
+    assert model.locate('A') == 'up' and model.locate('C') == 'visible'
+
+
+def test_next_unvisited_skips_visited_and_skipped():
+    model = StoreListModel(visited={'A'})
+    stores = [{'name': 'C', 'y': 900}, {'name': 'A', 'y': 300}, {'name': 'B', 'y': 600}]
+    assert model.mark_skipped('B')
+    assert not model.mark_skipped('A')
+    assert model.next_unvisited(stores)['name'] == 'C'
+    model.mark_visited('C')
+    assert model.next_unvisited(stores) is None
+
+
+def test_row_name_classifies_each_desc_once():
+    model = StoreListModel()
+    seen = []
+
+    def classify(desc):
+        seen.append(desc)
+        return desc.split(', ')[0] if '배달팁' in desc else None
+
+    for _ in range(3):
+        assert model.row_name('교촌치킨, 배달팁 0원', classify) == '교촌치킨'
+        assert model.row_name('별점 4.9', classify) is None
+    assert seen == ['교촌치킨, 배달팁 0원', '별점 4.9']
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+템플릿 매칭 - ROI/피라미드를 써도 전체 화면 원본 크기 매칭과 같은 클릭 좌표
+(합성 스크린샷: 노이즈 배경에 템플릿을 붙여 넣음)
+"""
+import cv2
+import numpy as np
+import pytest
+
+from template_match import TemplateMatcher
+
+SCREEN = (1200, 720)  # 높이, 너비
+TW, TH = 120, 60
+MARGIN = 60
+
+
+def texture(rng, h, w):
+    return cv2.GaussianBlur(rng.integers(0, 256, (h, w), dtype=np.uint8), (5, 5), 0)
+
+
+@pytest.fixture
+def template(tmp_path):
+    path = str(tmp_path / 'button.png')
+    cv2.imwrite(path, texture(np.random.default_rng(1), TH, TW))
+    return path
+
+
+def screen_with(template, x, y, seed=2):
+    screen = texture(np.random.default_rng(seed), *SCREEN)
+    screen[y:y + TH, x:x + TW] = cv2.imread(template, cv2.IMREAD_GRAYSCALE)
+    return screen
+
+
+def plain(screen, template):
+    # ROI/피라미드 없이 전체 화면 원본 크기 매칭
+    return TemplateMatcher(levels=0, scales=(1.0,)).match(screen, template)
+
+
+def no_full_search(*args):
+    raise AssertionError('ROI에서 못 찾고 전체 화면 매칭')
+
+
+@pytest.mark.parametrize('x, y', [(300, 500), (0, 0), (SCREEN[1] - TW, SCREEN[0] - TH)])
+def test_pyramid_and_roi_match_full_search(template, x, y):
+    screen = screen_with(template, x, y)
+    expected = plain(screen, template)
+    assert expected[:2] == (x + TW // 2, y + TH // 2)
+
+    matcher = TemplateMatcher(roi_margin=MARGIN)
+    assert matcher.match(screen, template)[:2] == expected[:2]  # 피라미드
+    matcher._coarse_to_fine = no_full_search
+    assert matcher.match(screen, template)[:2] == expected[:2]  # 학습한 ROI
+
+
+@pytest.mark.parametrize('dx, dy', [(MARGIN, 0), (-MARGIN, 0), (0, MARGIN), (0, -MARGIN), (MARGIN, MARGIN)])
+def test_roi_edge_matches_full_search(template, dx, dy):
+    # 두 번째 화면에서 템플릿이 ROI 여백 끝에 딱 걸침
+    x, y = 300, 500
+    matcher = TemplateMatcher(roi_margin=MARGIN)
+    matcher.match(screen_with(template, x, y), template)
+
+    screen = screen_with(template, x + dx, y + dy, seed=3)
+    expected = plain(screen, template)
+    matcher._coarse_to_fine = no_full_search
+    assert matcher.match(screen, template)[:2] == expected[:2] == (x + dx + TW // 2, y + dy + TH // 2)
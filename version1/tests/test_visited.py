@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+방문 기록 - SQLite ttl/공유, 블룸 필터 저장/크기/ttl, 이어하기 때 기록 갱신 안 함, 크롤링에서 건너뛰기
+"""
+import sqlite3
+import time
+
+import pytest
+
+from test_resume import run, write_checkpoint
+from replay_device import make_stores
+import visited
+from visited import BloomFilter, VisitedRegistry
+
+
+def seen_at(path):
+    with sqlite3.connect(path) as conn:
+        return dict(conn.execute('SELECT name, seen_at FROM visited'))
+
+
+def test_sqlite_shared_between_devices_and_ttl(tmp_path):
+    path = str(tmp_path / 'visited.sqlite')
+    a = VisitedRegistry(path, ttl=0.2, device='a')
+    b = VisitedRegistry(path, ttl=0.2, device='b')
+    assert a.add('교촌치킨') and not a.add('교촌치킨')
+    assert '교촌치킨' not in b
+    assert b.refresh() == 1 and '교촌치킨' in b
+
+    time.sleep(0.3)
+    c = VisitedRegistry(path, ttl=0.2)  # 열 때 ttl 지난 기록 삭제
+    assert '교촌치킨' not in c and len(c) == 0
+    assert seen_at(path) == {}
+
+
+def test_bloom_persists_and_estimates_size(tmp_path):
+    path = str(tmp_path / 'visited.bloom')
+    names = [f'가게 {i}' for i in range(300)]
+    with VisitedRegistry(path, capacity=1000, error_rate=0.01) as first:
+        for name in names:
+            first.add(name)
+
+    # 파일 크기를 그대로 이어서 씀 (capacity가 달라도)
+    second = VisitedRegistry(path, capacity=50)
+    assert all(name in second for name in names)
+    assert abs(len(second) - len(names)) < 15
+    assert sum(f'없는 가게 {i}' in second for i in range(1000)) < 30
+
+
+def test_bloom_refresh_reports_other_devices_additions(tmp_path):
+    path = str(tmp_path / 'visited.bloom')
+    a = VisitedRegistry(path, capacity=1000, save_every=1)
+    b = VisitedRegistry(path, capacity=1000)
+    for i in range(20):
+        a.add(f'가게 {i}')
+    assert 15 <= b.refresh() <= 25
+    assert '가게 3' in b
+
+
+def test_bloom_refresh_skips_unchanged_file(tmp_path, monkeypatch):
+    path = str(tmp_path / 'visited.bloom')
+    a = VisitedRegistry(path, capacity=1000, save_every=1)
+    b = VisitedRegistry(path, capacity=1000)
+    a.add('교촌치킨')
+    assert b.refresh() == 1
+
+    def reread(data):
+        raise AssertionError('안 바뀐 파일을 다시 읽음')
+    monkeypatch.setattr(visited.BloomFilter, 'from_bytes', reread)
+    assert b.refresh() == 0
+    a.refresh()  # 자기가 저장한 파일도 다시 안 읽음
+
+
+def test_bloom_long_running_writer_rotates_after_ttl(tmp_path):
+    path = str(tmp_path / 'visited.bloom')
+    writer = VisitedRegistry(path, ttl=0.3, capacity=1000, save_every=1)
+    writer.add('오래된 가게')
+    time.sleep(0.4)
+    writer.add('새 가게')  # 필터가 ttl보다 오래됨 → 새로 시작하고 저장
+
+    reader = VisitedRegistry(path, ttl=0.3)
+    assert '새 가게' in reader
+    assert '오래된 가게' not in reader
+
+    time.sleep(0.4)
+    assert writer.refresh() == 0 and '새 가게' not in writer._bloom  # 새로 고칠 때도 만료
+
+
+def test_bloom_merge_rejects_different_size():
+    with pytest.raises(ValueError):
+        BloomFilter(1000).merge(BloomFilter(2000))
+
+
+def test_resume_does_not_rewrite_checkpointed_stores(tmp_path):
+    stores = make_stores(10)
+    write_checkpoint(tmp_path, [stores[0]['가게명']])
+    path = str(tmp_path / 'visited.sqlite')
+    with VisitedRegistry(path) as visited:
+        run(tmp_path, stores, 3, resume=True, visited=visited)
+    saved = seen_at(path)
+    assert stores[0]['가게명'] not in saved
+    assert len(saved) == 2
+
+
+def test_crawl_skips_many_screens_of_visited_stores(tmp_path):
+    stores = make_stores(80)
+    path = str(tmp_path / 'visited.sqlite')
+    with VisitedRegistry(path, ttl=3600, device='other') as other:
+        for s in stores[:60]:
+            other.add(s['가게명'])
+
+    with VisitedRegistry(path, ttl=3600) as visited:
+        result = run(tmp_path, stores, 3, visited=visited)
+
+    done = {s['가게명'] for s in stores[:60]}
+    assert len(result) == 3
+    assert not {r['가게명'] for r in result} & done
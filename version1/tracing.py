@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+구간 추적 - 크롤링 단계와 디바이스 RPC 구간을 Chrome trace(JSON)로 저장
+chrome://tracing 또는 https://ui.perfetto.dev 에서 파일을 열어서 확인
+
+꺼져 있으면 span()은 아무것도 안 하는 공용 객체를 돌려줌 (기록/시간 측정 없음)
+
+사용법:
+    tracer.start()
+    with span('expand'):
+        ...
+    tracer.save('trace.json')
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'cat', 'args', 'start')
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer._add(self.name, self.cat, self.start, end, self.args)
+        return False
+
+
+class Tracer:
+    """구간 기록기 (스레드 안전 - 디바이스별 스레드는 trace에서 줄이 나뉨)"""
+
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self._threads = {}  # 스레드 id → 이름
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter_ns()
+
+    def start(self):
+        """기록 시작 (이전 기록은 버림)"""
+        with self._lock:
+            self.events = []
+            self._threads = {}
+            self._t0 = time.perf_counter_ns()
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    def span(self, name, cat='phase', **args):
+        """with 구간 - 꺼져 있으면 아무것도 안 함"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def _add(self, name, cat, start, end, args):
+        thread = threading.current_thread()
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'pid': os.getpid(), 'tid': thread.ident,
+                 'ts': (start - self._t0) / 1000, 'dur': (end - start) / 1000}
+        if args:
+            event['args'] = args
+        with self._lock:
+            self.events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+
+    def save(self, path):
+        """Chrome trace JSON 저장 → 구간 수"""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        meta = [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid, 'args': {'name': name}}
+                for tid, name in threads.items()]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': meta + events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+        return len(events)
+
+
+# 프로세스 공용 기록기
+tracer = Tracer()
+
+
+def span(name, cat='phase', **args):
+    """공용 기록기의 구간 (tracer.span과 같음)"""
+    if not tracer.enabled:
+        return _NULL_SPAN
+    return _Span(tracer, name, cat, args)
+
+
+class _TracingSelector:
+    """d(**selector) 래퍼 - exists/click 등을 RPC 구간으로 기록"""
+
+    def __init__(self, obj, selector, tracer):
+        self._obj = obj
+        self._selector = selector
+        self._tracer = tracer
+
+    def _rpc(self, name, fn, *args, **kwargs):
+        with self._tracer.span(f'selector.{name}', cat='rpc', selector=self._selector):
+            return fn(*args, **kwargs)
+
+    def exists(self, *args, **kwargs):
+        return self._rpc('exists', self._obj.exists, *args, **kwargs)
+
+    def click(self, *args, **kwargs):
+        return self._rpc('click', self._obj.click, *args, **kwargs)
+
+    def click_exists(self, *args, **kwargs):
+        return self._rpc('click_exists', self._obj.click_exists, *args, **kwargs)
+
+    def get_text(self, *args, **kwargs):
+        return self._rpc('get_text', self._obj.get_text, *args, **kwargs)
+
+    def set_text(self, *args, **kwargs):
+        return self._rpc('set_text', self._obj.set_text, *args, **kwargs)
+
+    def clear_text(self, *args, **kwargs):
+        return self._rpc('clear_text', self._obj.clear_text, *args, **kwargs)
+
+    @property
+    def info(self):
+        return self._rpc('info', lambda: self._obj.info)
+
+    def __getattr__(self, name):
+        return getattr(self._obj, name)
+
+
+class _TracingRpc:
+    def __init__(self, rpc, tracer):
+        self._rpc = rpc
+        self._tracer = tracer
+
+    def takeScreenshot(self, *args):
+        with self._tracer.span('takeScreenshot', cat='rpc'):
+            return self._rpc.takeScreenshot(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._rpc, name)
+
+
+class TracingDevice:
+    """u2 디바이스 래퍼 - 모든 RPC를 구간으로 기록 (기록할 때만 감싸서 씀)
+
+    Args:
+        d: uiautomator2 디바이스
+        tracer: 기록기 (기본: 공용 기록기)
+    """
+
+    def __init__(self, d, tracer=tracer):
+        self._d = d
+        self._tracer = tracer
+        self.jsonrpc = _TracingRpc(d.jsonrpc, tracer)
+
+    def _rpc(self, name, fn, *args, **kwargs):
+        with self._tracer.span(name, cat='rpc'):
+            return fn(*args, **kwargs)
+
+    def dump_hierarchy(self, *args, **kwargs):
+        return self._rpc('dump_hierarchy', self._d.dump_hierarchy, *args, **kwargs)
+
+    def screenshot(self, *args, **kwargs):
+        return self._rpc('screenshot', self._d.screenshot, *args, **kwargs)
+
+    def click(self, *args, **kwargs):
+        return self._rpc('click', self._d.click, *args, **kwargs)
+
+    def swipe(self, *args, **kwargs):
+        return self._rpc('swipe', self._d.swipe, *args, **kwargs)
+
+    def press(self, *args, **kwargs):
+        return self._rpc('press', self._d.press, *args, **kwargs)
+
+    def window_size(self, *args, **kwargs):
+        return self._rpc('window_size', self._d.window_size, *args, **kwargs)
+
+    def app_info(self, *args, **kwargs):
+        return self._rpc('app_info', self._d.app_info, *args, **kwargs)
+
+    def __call__(self, **selector):
+        return _TracingSelector(self._d(**selector), selector, self._tracer)
+
+    def __getattr__(self, name):
+        return getattr(self._d, name)
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+방문 기록 - 이미 크롤링한 가게명을 실행/디바이스 사이에서 공유
+확인은 메모리 집합으로 하고, 추가할 때만 저장소에 기록
+    path 없음      이번 실행만 (메모리)
+    *.sqlite, *.db SQLite - 가게명/디바이스/시각 저장, 다른 디바이스가 추가한 기록은 refresh()로 반영
+    *.bloom        블룸 필터 파일 - 가게 수가 아주 많을 때 (오탐 확률 error_rate, 가게별 시각은 없음)
+ttl이 지난 기록은 다시 방문 대상 (블룸 필터는 만든 지 ttl이 지나면 새로 시작 - 이번 실행에서 ttl 안에 추가한 가게만 옮겨 담음)
+"""
+import hashlib
+import math
+import os
+import sqlite3
+import struct
+import threading
+import time
+from contextlib import closing
+
+_HEADER = struct.Struct('<dII')  # 생성 시각, 비트 수, 해시 수
+_file_lock = threading.Lock()    # 같은 프로세스의 디바이스 스레드가 블룸 파일을 번갈아 저장
+_popcount = getattr(int, 'bit_count', lambda n: bin(n).count('1'))  # 켜진 비트 수 (3.10 미만은 bin)
+
+
+class BloomFilter:
+    """블룸 필터 (가게명 → 비트 k개)
+
+    Args:
+        capacity: 예상 가게 수
+        error_rate: 없는 가게를 있다고 볼 확률 (capacity까지 넣었을 때)
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001, bits=None, hashes=None, created=None):
+        self.size = bits or max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = hashes or max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.created = created or time.time()
+
+    def _positions(self, name):
+        digest = hashlib.blake2b(name.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, name):
+        for p in self._positions(name):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, name):
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(name))
+
+    def __len__(self):
+        """넣은 가게 수 추정 (켜진 비트 수로 계산)"""
+        ones = _popcount(int.from_bytes(self.bits, 'little'))
+        if ones >= self.size:
+            return self.size
+        return int(round(-self.size / self.hashes * math.log(1 - ones / self.size)))
+
+    def merge(self, other):
+        """다른 필터의 기록 합치기 → 새로 켜진 비트 수 (비트 수/해시 수가 다르면 ValueError)"""
+        if other.size != self.size or other.hashes != self.hashes:
+            raise ValueError(f'블룸 필터 크기가 다름: {other.size}비트/{other.hashes}해시 '
+                             f'≠ {self.size}비트/{self.hashes}해시')
+        mine = int.from_bytes(self.bits, 'little')
+        merged = mine | int.from_bytes(other.bits, 'little')
+        self.bits = bytearray(merged.to_bytes(len(self.bits), 'little'))
+        self.created = min(self.created, other.created)
+        return _popcount(merged ^ mine)
+
+    def to_bytes(self):
+        return _HEADER.pack(self.created, self.size, self.hashes) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data):
+        created, size, hashes = _HEADER.unpack_from(data)
+        bloom = cls(bits=size, hashes=hashes, created=created)
+        bloom.bits = bytearray(data[_HEADER.size:_HEADER.size + len(bloom.bits)])
+        return bloom
+
+
+class VisitedRegistry:
+    """방문한 가게 집합 (in / add)
+
+    Args:
+        path: 저장 파일 (None이면 메모리만, 확장자 .bloom이면 블룸 필터, 그 외는 SQLite)
+        ttl: 기록 유효 시간 (초, None이면 만료 없음)
+        device: 기록에 남길 디바이스 이름
+        capacity, error_rate: 블룸 필터 크기 (새 파일만 - 파일이 있으면 그 크기를 이어서 씀)
+        save_every: 블룸 필터를 몇 개 추가마다 파일에 저장할지
+    """
+
+    def __init__(self, path=None, ttl=None, device=None, capacity=100000, error_rate=0.001, save_every=10):
+        self.path = path
+        self.ttl = ttl
+        self.device = device
+        self.save_every = save_every
+        self._names = set()   # 이번 실행에서 확인된 가게 (메모리)
+        self._synced = 0      # SQLite: 이 rowid까지의 기록은 반영함
+        self._bloom = None
+        self._unsaved = 0
+        self._added = {}      # 블룸 필터: 이번 실행에서 추가한 가게 → 시각 (필터를 새로 시작할 때 옮겨 담음)
+        self._stamp = None    # 블룸 필터: 마지막으로 읽거나 쓴 파일의 (inode, 수정 시각, 크기)
+
+        if path and path.endswith('.bloom'):
+            with _file_lock:
+                saved = self._read_bloom()
+            self._bloom = saved if saved is not None else BloomFilter(capacity, error_rate)
+        elif path:
+            with self._connect() as conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('CREATE TABLE IF NOT EXISTS visited '
+                             '(name TEXT PRIMARY KEY, device TEXT, seen_at REAL NOT NULL)')
+            self.purge()
+            self.refresh()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return closing(conn)  # with가 끝나면 닫음 (sqlite3 연결의 with는 커밋만 하고 닫지 않음)
+
+    def _cutoff(self):
+        return time.time() - self.ttl if self.ttl else 0.0
+
+    def refresh(self):
+        """저장소에서 다른 실행/디바이스가 추가한 기록 반영 → 새로 반영한 수
+
+        블룸 필터는 파일이 바뀌었을 때만 다시 읽음 (반영한 수는 새로 켜진 비트로 본 추정값)
+        """
+        if self._bloom is not None:
+            return self._load_bloom()
+        if not self.path:
+            return 0
+        with self._connect() as conn:
+            rows = conn.execute('SELECT rowid, name FROM visited WHERE rowid > ? AND seen_at >= ?',
+                                (self._synced, self._cutoff())).fetchall()
+        before = len(self._names)
+        for rowid, name in rows:
+            self._names.add(name)
+            self._synced = max(self._synced, rowid)
+        return len(self._names) - before
+
+    @staticmethod
+    def _file_stamp(st):
+        # 저장할 때마다 임시 파일을 바꿔 끼우므로 inode도 바뀜 (수정 시각 해상도가 거칠어도 구분)
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _read_bloom(self):
+        # 저장된 필터 (파일이 없거나 ttl이 지났으면 None → 새로 시작, 다음 저장 때 덮어씀)
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return None
+        with f:
+            self._stamp = self._file_stamp(os.fstat(f.fileno()))
+            saved = BloomFilter.from_bytes(f.read())
+        if self.ttl and saved.created < self._cutoff():
+            return None
+        return saved
+
+    def _rotate_bloom(self):
+        # 만든 지 ttl이 지난 필터 → 새 필터에 이번 실행에서 ttl 안에 추가한 가게만 옮겨 담음
+        # (그대로 저장하면 파일의 생성 시각이 ttl보다 오래돼서 다른 디바이스가 통째로 버림)
+        cutoff = self._cutoff()
+        if not self.ttl or self._bloom.created >= cutoff:
+            return
+        self._bloom = BloomFilter(bits=self._bloom.size, hashes=self._bloom.hashes)
+        self._added = {name: at for name, at in self._added.items() if at >= cutoff}
+        for name in self._added:
+            self._bloom.add(name)
+        self._stamp = None  # 파일 기록도 다시 합쳐야 함
+
+    def _load_bloom(self):
+        self._rotate_bloom()
+        with _file_lock:
+            try:
+                if self._file_stamp(os.stat(self.path)) == self._stamp:
+                    return 0  # 마지막으로 읽거나 쓴 뒤로 안 바뀜
+            except FileNotFoundError:
+                return 0
+            saved = self._read_bloom()
+        if saved is None:
+            return 0
+        return self._bloom.merge(saved) // self._bloom.hashes
+
+    def _save_bloom(self):
+        self._rotate_bloom()
+        with _file_lock:
+            saved = self._read_bloom()
+            if saved is not None:
+                self._bloom.merge(saved)  # 그 사이 다른 디바이스가 저장한 기록 유지
+            tmp = f'{self.path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(self._bloom.to_bytes())
+            stamp = self._file_stamp(os.stat(tmp))  # 이름을 바꿔도 inode/수정 시각은 그대로
+            os.replace(tmp, self.path)
+            self._stamp = stamp
+        self._unsaved = 0
+
+    def __contains__(self, name):
+        return name in self._names or (self._bloom is not None and name in self._bloom)
+
+    def __len__(self):
+        """기록된 가게 수 (블룸 필터는 추정값)"""
+        if self._bloom is not None:
+            return max(len(self._names), len(self._bloom))
+        return len(self._names)
+
+    def add(self, name):
+        """방문 기록 → 새로 추가했으면 True (이미 있으면 저장소도 그대로)"""
+        if name in self:
+            return False
+        self._names.add(name)
+        if self._bloom is not None:
+            self._bloom.add(name)
+            self._added[name] = time.time()
+            self._unsaved += 1
+            if self._unsaved >= self.save_every:
+                self._save_bloom()
+        elif self.path:
+            now = time.time()
+            with self._connect() as conn:
+                conn.execute('INSERT OR REPLACE INTO visited (name, device, seen_at) VALUES (?, ?, ?)',
+                             (name, self.device, now))
+        return True
+
+    def purge(self):
+        """ttl이 지난 기록 삭제 (SQLite, 열 때 자동) → 삭제한 수"""
+        if self._bloom is not None or not self.path or not self.ttl:
+            return 0
+        with self._connect() as conn:
+            return conn.execute('DELETE FROM visited WHERE seen_at < ?', (self._cutoff(),)).rowcount
+
+    def close(self):
+        """블룸 필터 저장 (SQLite는 추가할 때마다 저장됨)"""
+        if self._bloom is not None and self._unsaved:
+            self._save_bloom()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -3,182 +3,34 @@
 배달의민족 크롤러 - 버전2 (엑셀 기반 검색)
 엑셀 파일의 상호명(F열)으로 배민에서 검색하여 정보 수집
 """
-import uiautomator2 as u2
 import time
-import re
 import sys
 import os
 import pandas as pd
 from datetime import datetime
-import xml.etree.ElementTree as ET
-import cv2
-import numpy as np
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
 
+# 공용 모듈 (version1 폴더)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'version1'))
+from baemin_crawler_final import BaeminCrawler
+from page_state import PageState
+from orchestrator import list_devices, run_on_devices
+from job_queue import JobQueue
+from tracing import span
+from metrics import metrics
 
-class BaeminCrawlerV2:
-    def __init__(self, log_callback=None):
-        self.d = None
-        self.log_callback = log_callback
-        self.is_running = False
-        self.should_stop = False
-
-    def log(self, msg):
-        """로그 출력"""
-        if self.log_callback:
-            self.log_callback(msg)
-        print(msg)
-
-    def connect(self):
-        """디바이스 연결"""
-        self.d = u2.connect()
-        self.log('[OK] 디바이스 연결됨')
-        return True
-
-    def get_xml_root(self):
-        """XML 루트 가져오기"""
-        xml = self.d.dump_hierarchy()
-        return ET.fromstring(xml)
-
-    def get_all_texts(self):
-        """현재 화면의 모든 텍스트 추출"""
-        root = self.get_xml_root()
-        texts = []
-
-        def extract(node):
-            text = node.attrib.get('text', '')
-            if text.strip():
-                texts.append(text.strip())
-            for child in node:
-                extract(child)
-
-        extract(root)
-        return texts
-
-    def get_content_descs(self):
-        """현재 화면의 모든 content-desc 추출"""
-        root = self.get_xml_root()
-        descs = []
-
-        def extract(node):
-            desc = node.attrib.get('content-desc', '')
-            if desc.strip():
-                descs.append(desc.strip())
-            for child in node:
-                extract(child)
-
-        extract(root)
-        return descs
-
-    def find_and_click_image(self, template_path, threshold=0.7):
-        """이미지 템플릿 매칭으로 클릭"""
-        screen = self.d.screenshot(format='opencv')
-        template = cv2.imread(template_path)
-
-        if template is None:
-            self.log(f'[ERROR] 템플릿 없음: {template_path}')
-            return False
+RESULT_COLUMNS = ['배달타입_배민', '상호명_배민', '주소_배민', '전화번호_배민', '최근주문수', '전체리뷰수', '크롤링시간']
 
-        screen_gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
-        template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
 
-        result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+class BaeminCrawlerV2(BaeminCrawler):
+    """엑셀 상호명 검색 크롤러 - 연결/화면 대기/스크롤/정보 추출은 버전1 크롤러 그대로 사용"""
 
-        if max_val >= threshold:
-            h, w = template_gray.shape
-            cx = max_loc[0] + w // 2
-            cy = max_loc[1] + h // 2
-            self.d.click(cx, cy)
-            self.log(f'      [이미지매칭] 클릭 ({cx}, {cy}) - {max_val:.0%}')
-            return True
-        else:
-            self.log(f'      [WARN] 이미지 못 찾음 - {max_val:.0%}')
-            return False
-
-    def extract_delivery_types(self):
-        """배달타입 추출 (가게배달/알뜰배달/한집배달)"""
-        descs = self.get_content_descs()
-        types = []
-        for desc in descs:
-            if desc in ['가게배달', '알뜰배달', '한집배달']:
-                if desc not in types:
-                    types.append(desc)
-        return types
-
-    def extract_store_info(self):
-        """가게정보 페이지에서 상호명, 주소, 전화번호 추출"""
-        texts = self.get_all_texts()
-        info = {}
-
-        for i, t in enumerate(texts):
-            if t == '상호명' and i+1 < len(texts):
-                info['상호명'] = texts[i+1]
-            if t == '주소' and i+1 < len(texts):
-                info['주소'] = texts[i+1]
-            if t == '전화번호' and i+1 < len(texts):
-                info['전화번호'] = texts[i+1]
-
-        return info
-
-    def extract_stats(self):
-        """최근주문수, 전체리뷰수 추출"""
-        root = self.get_xml_root()
-        stats = {}
-
-        elements = []
-        def collect(node):
-            text = node.attrib.get('text', '').strip()
-            bounds = node.attrib.get('bounds', '')
-            if text and bounds:
-                match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
-                if match:
-                    x1, y1, x2, y2 = map(int, match.groups())
-                    elements.append({
-                        'text': text,
-                        'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2,
-                        'cy': (y1 + y2) // 2
-                    })
-            for child in node:
-                collect(child)
-        collect(root)
-
-        for elem in elements:
-            if elem['text'] == '최근 주문수':
-                for other in elements:
-                    if other['x1'] >= elem['x2'] and abs(other['cy'] - elem['cy']) < 40:
-                        stats['최근주문수'] = other['text']
-                        break
-
-            if elem['text'] == '전체 리뷰수':
-                for other in elements:
-                    if other['x1'] >= elem['x2'] and abs(other['cy'] - elem['cy']) < 40:
-                        stats['전체리뷰수'] = other['text']
-                        break
-
-        return stats
-
-    def scroll_down(self, times=1):
-        """아래로 스크롤"""
-        for _ in range(times):
-            self.d.swipe(540, 1500, 540, 700, duration=0.3)
-            time.sleep(0.8)
-
-    def go_back(self):
-        """뒤로가기"""
-        self.d.press('back')
-        time.sleep(1.5)
-
-    def click_expand_delivery(self):
-        """배달타입 펼치기 클릭"""
-        elem = self.d(descriptionContains='펼쳐보기')
-        if elem.exists(timeout=2):
-            elem.click()
-            time.sleep(1)
-            return True
-        return False
+    def __init__(self, log_callback=None, settle_timeout=3.0, serial=None, device=None):
+        super().__init__(settle_timeout=settle_timeout, serial=serial, device=device, log_callback=log_callback)
+        self.is_running = False
+        self.should_stop = False
 
     def search_store(self, store_name):
         """배민에서 가게 검색"""
@@ -186,7 +38,7 @@ class BaeminCrawlerV2:
         search_btn = self.d(descriptionContains='검색')
         if search_btn.exists(timeout=3):
             search_btn.click()
-            time.sleep(1.5)
+            self.settle()
         else:
             self.log('[WARN] 검색 버튼 못 찾음')
             return False
@@ -195,42 +47,30 @@ class BaeminCrawlerV2:
         search_input = self.d(className='android.widget.EditText')
         if search_input.exists(timeout=3):
             search_input.set_text(store_name)
-            time.sleep(0.5)
             # 검색 실행 (엔터)
             self.d.press('enter')
-            time.sleep(2)
+            self.settle(until=lambda snap: snap.has_desc_contains('배달팁') or snap.has_desc_contains('준비중'))
             return True
         else:
             self.log('[WARN] 검색창 못 찾음')
             self.go_back()
             return False
 
-    def click_first_store(self, search_name):
+    def click_first_store(self, search_name, snap=None):
         """검색 결과에서 첫 번째 가게 클릭"""
-        time.sleep(1)
-
         # 검색 결과에서 가게 찾기 (content-desc에 배달팁 또는 준비중 포함된 것)
-        root = self.get_xml_root()
-
         stores = []
-        def find_stores(node):
-            desc = node.attrib.get('content-desc', '')
-            bounds = node.attrib.get('bounds', '')
+        for n in (snap or self.snapshot()).nodes:
+            desc = n.desc
             # 배달팁 또는 준비중이 있으면 가게로 인식
-            if desc.strip() and bounds and ('배달팁' in desc or '준비중' in desc):
-                match = re.search(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
-                if match:
-                    y1 = int(match.group(2))
-                    # 가게명 추출 (배달팁, 준비중 앞부분)
-                    store_name = desc
-                    if ', 배달팁' in desc:
-                        store_name = desc.split(', 배달팁')[0]
-                    elif ', 준비중' in desc:
-                        store_name = desc.split(', 준비중')[0]
-                    stores.append({'name': store_name, 'y': y1, 'desc': desc})
-            for child in node:
-                find_stores(child)
-        find_stores(root)
+            if desc and n.has_bounds and ('배달팁' in desc or '준비중' in desc):
+                # 가게명 추출 (배달팁, 준비중 앞부분)
+                store_name = desc
+                if ', 배달팁' in desc:
+                    store_name = desc.split(', 배달팁')[0]
+                elif ', 준비중' in desc:
+                    store_name = desc.split(', 준비중')[0]
+                stores.append({'name': store_name, 'y': n.y1, 'desc': desc})
 
         if stores:
             stores.sort(key=lambda x: x['y'])
@@ -240,7 +80,7 @@ class BaeminCrawlerV2:
             if elem.exists(timeout=2):
                 elem.click()
                 self.log(f'      [OK] 가게 클릭: {first_store["name"]}')
-                time.sleep(2)
+                self.settle(until=lambda snap: snap.has_desc_contains('펼쳐보기'))
                 return True
 
         self.log('[WARN] 검색 결과에서 가게 못 찾음')
@@ -261,87 +101,84 @@ class BaeminCrawlerV2:
         try:
             # 1. 배달타입 펼치기
             self.log(f'      [1] 배달타입 펼치기...')
-            self.click_expand_delivery()
-            time.sleep(1)
+            with span('expand'):
+                self.click_expand_delivery()
 
             # 2. 배달타입 추출
             self.log(f'      [2] 배달타입 추출...')
-            delivery_types = self.extract_delivery_types()
+            with span('delivery_type'):
+                delivery_types = self.extract_delivery_types()
             store_data['배달타입'] = ', '.join(delivery_types)
             self.log(f'          → {store_data["배달타입"]}')
 
-            # 3. 가게정보·원산지 클릭
+            # 3. 가게정보·원산지 클릭 (UI 덤프 → 이미지 매칭)
             self.log(f'      [3] 가게정보·원산지 클릭...')
-            if self.find_and_click_image('templates/store_info_btn.png', threshold=0.6):
-                time.sleep(2)
-
+            with span('image_click'):
+                opened = self.click_store_info_button()
+                if opened:
+                    self.settle(until=lambda snap: '상호명' in snap.by_text)
+            if opened:
                 # 4. 상호명, 주소, 전화번호 추출
                 self.log(f'      [4] 가게정보 추출...')
-                info = self.extract_store_info()
+                with span('info_extract'):
+                    info = self.extract_store_info()
                 store_data.update(info)
                 self.log(f'          → 상호명: {info.get("상호명", "없음")}')
 
                 # 5. 최근주문수, 전체리뷰수 추출
                 self.log(f'      [5] 통계 추출...')
-                for _ in range(5):
-                    if self.d(textContains='최근 주문수').exists(timeout=1) and self.d(textContains='전체 리뷰수').exists(timeout=1):
-                        break
-                    self.scroll_down(1)
-                stats = self.extract_stats()
+                with span('stats_scroll'):
+                    for _ in range(5):
+                        if self.wait_for_all([{'textContains': '최근 주문수'}, {'textContains': '전체 리뷰수'}]):
+                            break
+                        if not self.scroll_down(1):
+                            break
+                    stats = self.extract_stats()
                 store_data.update(stats)
                 self.log(f'          → 최근주문수: {stats.get("최근주문수", "없음")}')
                 self.log(f'          → 전체리뷰수: {stats.get("전체리뷰수", "없음")}')
 
-                # 뒤로가기 (가게정보 → 가게상세)
-                self.go_back()
-
         except Exception as e:
             self.log(f'      [ERROR] {e}')
 
-        # 뒤로가기 (가게상세 → 검색결과)
-        self.go_back()
-        time.sleep(1)
-        # 뒤로가기 (검색결과 → 메인)
-        self.go_back()
-        time.sleep(1)
+        # 뒤로가기 (가게정보 → 가게상세 → 검색결과 → 메인) - 화면 확인하며 필요한 만큼만
+        with span('back'):
+            self.back_to(PageState.HOME)
 
         return store_data
 
     def go_to_main(self):
         """배민 메인 화면으로 이동"""
-        # 홈 버튼 여러번 눌러서 메인으로
+        state = self.current_state()
+        if state == PageState.HOME:
+            return True
+        # 알려진 화면이면 뒤로가기로 메인까지
+        if state != PageState.UNKNOWN and self.back_to(PageState.HOME):
+            return True
+        # 그래도 안 되면 홈 버튼
         for _ in range(3):
             home_btn = self.d(descriptionContains='홈')
             if home_btn.exists(timeout=1):
                 home_btn.click()
-                time.sleep(1)
+                self.settle()
                 break
             self.go_back()
+        return self.current_state() == PageState.HOME
 
-    def run(self, excel_path, progress_callback=None):
-        """크롤링 실행"""
-        self.is_running = True
-        self.should_stop = False
-
-        self.log('=' * 50)
-        self.log('  배달의민족 크롤러 V2 시작')
-        self.log(f'  엑셀 파일: {excel_path}')
-        self.log('=' * 50)
-
+    def load_excel(self, excel_path):
+        """엑셀 로드 + 결과 컬럼 추가 → (df, 상호명 컬럼), 실패하면 (None, None)"""
         # 엑셀 파일 읽기
         try:
             df = pd.read_excel(excel_path)
             self.log(f'[OK] 엑셀 로드 완료: {len(df)}개 행')
         except Exception as e:
             self.log(f'[ERROR] 엑셀 로드 실패: {e}')
-            self.is_running = False
-            return None
+            return None, None
 
         # F열(상호명) 확인 - 0-indexed로 5번째
         if df.shape[1] < 6:
             self.log('[ERROR] 엑셀에 F열(상호명)이 없습니다')
-            self.is_running = False
-            return None
+            return None, None
 
         # 컬럼명 확인
         col_names = df.columns.tolist()
@@ -351,68 +188,126 @@ class BaeminCrawlerV2:
         store_col = col_names[5] if len(col_names) > 5 else None
         if not store_col:
             self.log('[ERROR] 상호명 컬럼을 찾을 수 없습니다')
-            self.is_running = False
-            return None
+            return None, None
 
         self.log(f'[INFO] 상호명 컬럼: {store_col}')
 
         # I열부터 새 컬럼 추가 (없으면)
-        new_cols = ['배달타입_배민', '상호명_배민', '주소_배민', '전화번호_배민', '최근주문수', '전체리뷰수', '크롤링시간']
-        for col in new_cols:
+        for col in RESULT_COLUMNS:
             if col not in df.columns:
                 df[col] = ''
 
-        if not self.connect():
-            self.is_running = False
-            return None
+        return df, store_col
+
+    def write_row(self, df, idx, data):
+        """크롤링 결과를 df의 idx 행에 기록"""
+        df.at[idx, '배달타입_배민'] = data.get('배달타입', '')
+        df.at[idx, '상호명_배민'] = data.get('상호명', '')
+        df.at[idx, '주소_배민'] = data.get('주소', '')
+        df.at[idx, '전화번호_배민'] = data.get('전화번호', '')
+        df.at[idx, '최근주문수'] = data.get('최근주문수', '')
+        df.at[idx, '전체리뷰수'] = data.get('전체리뷰수', '')
+        df.at[idx, '크롤링시간'] = data.get('크롤링시간', '')
+
+    def crawl_row(self, store_name):
+        """가게 1개 검색 → 정보 추출 (못 찾으면 None)"""
+        # 메인화면으로
+        with span('go_to_main'):
+            self.go_to_main()
+
+        # 검색
+        with span('search', store=store_name):
+            found = self.search_store(store_name)
+        if found:
+            # 첫 번째 가게 클릭
+            if self.click_first_store(store_name):
+                # 정보 추출
+                with span('store', store=store_name):
+                    data = self.crawl_store_info()
+                self.log(f'      [완료] 상호명: {data.get("상호명", "")}')
+                return data
+            else:
+                self.log(f'      [SKIP] 가게 못 찾음')
+                metrics.inc('skips', reason='not_found', device=self.serial or 'default')
+                self.back_to(PageState.HOME)
+        else:
+            self.log(f'      [SKIP] 검색 실패')
+            metrics.inc('skips', reason='search_failed', device=self.serial or 'default')
+        return None
+
+    def open_queue(self, df, store_col, excel_path, resume=False):
+        """엑셀 행마다 작업 1개씩 큐에 등록 (원본파일명_jobs.sqlite)
+
+        작업 결과는 행이 끝날 때마다 큐 파일에 저장됨 - resume이면 이미 끝난 행은 건너뛰고
+        이전 실행에서 중단/실패한 행만 다시 크롤링
+        """
+        queue = JobQueue(excel_path.replace('.xlsx', '_jobs.sqlite'))
+        if resume:
+            requeued = queue.requeue()
+            self.log(f'[RESUME] 완료된 행 {queue.counts().get("done", 0)}개 건너뜀, 다시 시도 {requeued}개')
+        else:
+            queue.reset()
 
         total = len(df)
-        for idx, row in df.iterrows():
-            if self.should_stop:
+        for idx in df.index:
+            store_name = str(df.at[idx, store_col]).strip()
+            if store_name and store_name != 'nan':
+                queue.add(idx, {'row': int(idx), 'total': total, 'store_name': store_name})
+        return queue
+
+    def write_results(self, df, queue):
+        """큐에 저장된 결과를 df에 기록"""
+        for key, data in queue.results().items():
+            if data:
+                self.write_row(df, int(key), data)
+        self.log(f'[INFO] 작업 결과: {queue.counts()}')
+
+    def crawl_jobs(self, queue, progress_callback=None, stop_check=None, poll=5.0, max_failures=3):
+        """작업 큐에서 행을 하나씩 임대해서 크롤링 - 큐가 빌 때까지 (다른 디바이스와 나눠 가짐)
+
+        연속 max_failures번 예외가 나면 이 디바이스에 문제가 있는 것으로 보고 중단
+        (남은 행은 다른 디바이스가 가져감)
+        """
+        owner = self.serial or 'default'
+        failures = 0
+        while True:
+            if self.should_stop or (stop_check and stop_check()):
                 self.log('[중지] 사용자 요청으로 중지됨')
                 break
 
-            store_name = str(row[store_col]).strip()
-            if not store_name or store_name == 'nan':
+            job = queue.lease(owner)
+            if job is None:
+                # 다른 디바이스가 잡고 있는 행이 남아있으면 임대 만료를 기다림
+                if not queue.has_unfinished():
+                    break
+                time.sleep(poll)
                 continue
 
-            self.log(f'\n[{idx+1}/{total}] 검색: {store_name}')
-
+            key, payload = job
+            store_name = payload['store_name']
+            self.log(f'\n[{payload["row"]+1}/{payload["total"]}] 검색: {store_name}')
             if progress_callback:
-                progress_callback(idx + 1, total)
+                progress_callback(payload['row'] + 1, payload['total'])
 
-            # 메인화면으로
-            self.go_to_main()
-            time.sleep(1)
-
-            # 검색
-            if self.search_store(store_name):
-                # 첫 번째 가게 클릭
-                if self.click_first_store(store_name):
-                    # 정보 추출
-                    data = self.crawl_store_info()
-
-                    # 엑셀에 저장
-                    df.at[idx, '배달타입_배민'] = data.get('배달타입', '')
-                    df.at[idx, '상호명_배민'] = data.get('상호명', '')
-                    df.at[idx, '주소_배민'] = data.get('주소', '')
-                    df.at[idx, '전화번호_배민'] = data.get('전화번호', '')
-                    df.at[idx, '최근주문수'] = data.get('최근주문수', '')
-                    df.at[idx, '전체리뷰수'] = data.get('전체리뷰수', '')
-                    df.at[idx, '크롤링시간'] = data.get('크롤링시간', '')
-
-                    self.log(f'      [완료] 상호명: {data.get("상호명", "")}')
-                else:
-                    self.log(f'      [SKIP] 가게 못 찾음')
-                    self.go_back()
-                    time.sleep(0.5)
-                    self.go_back()
-            else:
-                self.log(f'      [SKIP] 검색 실패')
+            try:
+                data = self.crawl_row(store_name)
+            except Exception as e:
+                failures += 1
+                queue.fail(key, owner, e)
+                metrics.inc('retries', kind='row', device=owner)
+                self.log(f'      [ERROR] {e} (재시도 대기)')
+                if failures >= max_failures:
+                    self.log(f'[ERROR] 연속 {failures}회 실패 - 이 디바이스 중단')
+                    break
+                continue
 
-            time.sleep(1)
+            failures = 0
+            queue.complete(key, owner, data)
+            if data is not None:
+                metrics.inc('stores_completed', device=owner)
 
-        # 엑셀 저장
+    def save_result(self, df, excel_path):
+        """결과 엑셀 저장 (원본파일명_결과.xlsx)"""
         output_path = excel_path.replace('.xlsx', '_결과.xlsx')
         df.to_excel(output_path, index=False)
         self.log(f'\n[OK] 결과 저장: {output_path}')
@@ -421,7 +316,72 @@ class BaeminCrawlerV2:
         self.log('=' * 50)
         self.log('  크롤링 완료!')
         self.log('=' * 50)
+        return output_path
+
+    def run(self, excel_path, progress_callback=None, resume=False):
+        """크롤링 실행 (resume이면 이전 실행에서 끝난 행은 건너뜀)"""
+        self.is_running = True
+        self.should_stop = False
+
+        self.log('=' * 50)
+        self.log('  배달의민족 크롤러 V2 시작')
+        self.log(f'  엑셀 파일: {excel_path}')
+        self.log('=' * 50)
+
+        df, store_col = self.load_excel(excel_path)
+        if df is None:
+            self.is_running = False
+            return None
+
+        if not self.connect():
+            self.is_running = False
+            return None
+
+        queue = self.open_queue(df, store_col, excel_path, resume)
+        self.crawl_jobs(queue, progress_callback)
+        self.write_results(df, queue)
+
+        output_path = self.save_result(df, excel_path)
+        self.is_running = False
+        return output_path
+
+    def run_parallel(self, excel_path, serials, progress_callback=None, resume=False):
+        """여러 디바이스로 엑셀 행을 나눠서 크롤링 → 결과 엑셀 1개"""
+        self.is_running = True
+        self.should_stop = False
+
+        self.log('=' * 50)
+        self.log(f'  배달의민족 크롤러 V2 시작 (디바이스 {len(serials)}대)')
+        self.log(f'  엑셀 파일: {excel_path}')
+        self.log('=' * 50)
 
+        df, store_col = self.load_excel(excel_path)
+        if df is None:
+            self.is_running = False
+            return None
+
+        # 행마다 작업 1개 - 빨리 끝나는 디바이스가 더 많이 가져감
+        queue = self.open_queue(df, store_col, excel_path, resume)
+
+        done = [0]
+        lock = threading.Lock()
+
+        def on_progress(current, total):
+            if progress_callback:
+                with lock:
+                    done[0] += 1
+                    progress_callback(done[0], total)
+
+        def work(serial, _):
+            worker = BaeminCrawlerV2(log_callback=self.log_callback, settle_timeout=self.settle_timeout,
+                                     serial=serial)
+            if worker.connect():
+                worker.crawl_jobs(queue, on_progress, stop_check=lambda: self.should_stop)
+
+        run_on_devices(serials, serials, work)
+        self.write_results(df, queue)
+
+        output_path = self.save_result(df, excel_path)
         self.is_running = False
         return output_path
 
@@ -462,6 +422,16 @@ class BaeminCrawlerV2GUI:
         file_btn = ttk.Button(file_frame, text='파일 선택', command=self.select_file)
         file_btn.pack(side=tk.RIGHT)
 
+        # 여러 디바이스 사용 여부
+        self.multi_var = tk.BooleanVar(value=False)
+        multi_check = ttk.Checkbutton(main_frame, text='연결된 모든 디바이스로 나눠서 크롤링', variable=self.multi_var)
+        multi_check.pack(anchor=tk.W)
+
+        # 이전 실행 이어서 하기 (원본파일명_jobs.sqlite에 완료된 행은 건너뜀)
+        self.resume_var = tk.BooleanVar(value=False)
+        resume_check = ttk.Checkbutton(main_frame, text='이전 실행 이어서 하기 (완료된 행 건너뜀)', variable=self.resume_var)
+        resume_check.pack(anchor=tk.W, pady=(0, 10))
+
         # 안내 프레임
         info_frame = ttk.LabelFrame(main_frame, text='안내', padding=10)
         info_frame.pack(fill=tk.X, pady=(0, 10))
@@ -542,10 +512,20 @@ class BaeminCrawlerV2GUI:
 
         def crawl_task():
             try:
-                result_path = self.crawler.run(
-                    excel_path=self.excel_path,
-                    progress_callback=self.update_progress
-                )
+                serials = list_devices() if self.multi_var.get() else []
+                if len(serials) > 1:
+                    result_path = self.crawler.run_parallel(
+                        excel_path=self.excel_path,
+                        serials=serials,
+                        progress_callback=self.update_progress,
+                        resume=self.resume_var.get()
+                    )
+                else:
+                    result_path = self.crawler.run(
+                        excel_path=self.excel_path,
+                        progress_callback=self.update_progress,
+                        resume=self.resume_var.get()
+                    )
                 self.root.after(0, lambda: self.crawl_complete(result_path))
             except Exception as e:
                 self.root.after(0, lambda: self.log(f'[ERROR] {e}'))
@@ -577,5 +557,8 @@ class BaeminCrawlerV2GUI:
 
 
 if __name__ == '__main__':
+    # --metrics 포트: http://localhost:포트/ 상태 페이지, /metrics (Prometheus)
+    if '--metrics' in sys.argv:
+        metrics.serve(int(sys.argv[sys.argv.index('--metrics') + 1]))
     app = BaeminCrawlerV2GUI()
     app.run()